@@ -2,11 +2,20 @@ from flask import Flask, request, jsonify, session, redirect, url_for, make_resp
 from flask_cors import CORS
 from flask_login import LoginManager, current_user
 from flask_jwt_extended import JWTManager
+from werkzeug.middleware.proxy_fix import ProxyFix
 from datetime import timedelta, datetime
 import os
+import click
 from models import db, User
 from config import Config
 from email_service import init_mail
+from utils.token_cache import init_token_cache, get_active_token, USER_NOT_FOUND, NO_ACTIVE_TOKEN
+from utils.role_cache import init_role_cache
+from utils.global_posts import init_global_post_cache
+from utils.attendance_analytics import init_attendance_analytics
+from utils.password_hasher import init_password_hasher, PasswordHasherBusy, password_hasher_busy_response
+from utils.rate_limit import init_rate_limiter
+from utils.event_bus import init_event_bus
 
 # Firebase 초기화 (앱 시작 시)
 try:
@@ -28,6 +37,8 @@ from blueprints.clubs import clubs_bp
 from blueprints.messages import messages_bp
 from blueprints.inquiries import inquiries_bp
 from blueprints.schedules import schedules_bp
+from blueprints.events import events_bp
+from blueprints.search import search_bp
 
 # Google Sheets 기능을 선택적으로 로드
 try:
@@ -38,6 +49,11 @@ except ImportError as e:
 
 app = Flask(__name__)
 app.config.from_object(Config)
+
+# 신뢰하는 프록시가 붙인 X-Forwarded-For 값만 request.remote_addr 로 반영
+# (클라이언트가 보낸 X-Forwarded-For 로 IP 를 바꿀 수 없도록)
+if app.config.get('TRUSTED_PROXY_COUNT'):
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXY_COUNT'])
 app.url_map.strict_slashes = False  # URL 끝 슬래시 리다이렉트 비활성화
 
 # Flask 세션 설정 (메모리 기반으로 단순화)
@@ -72,6 +88,27 @@ def unauthorized():
 # JWT 설정
 jwt = JWTManager(app)
 
+# JWT 활성 토큰 캐시 초기화
+init_token_cache(app)
+init_role_cache(app)
+init_global_post_cache(app)
+init_attendance_analytics(app)
+init_password_hasher(app)
+init_rate_limiter(app)
+init_event_bus(app)
+
+@app.errorhandler(PasswordHasherBusy)
+def handle_password_hasher_busy(error):
+    """엔드포인트에서 처리하지 않은 비밀번호 해시 대기열 초과 → 503 + Retry-After"""
+    return password_hasher_busy_response(error)
+
+def _load_active_token(user_id):
+    """DB에서 사용자의 active_token만 조회 (토큰 캐시 미스 시 사용)"""
+    row = db.session.query(User.active_token).filter(User.id == user_id).first()
+    if row is None:
+        return USER_NOT_FOUND
+    return row.active_token or NO_ACTIVE_TOKEN
+
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
     """JWT 토큰이 무효화되었는지 확인 (active_token의 jti와 비교)"""
@@ -80,12 +117,12 @@ def check_if_token_revoked(jwt_header, jwt_payload):
         if not user_id:
             return True  # 사용자 ID가 없으면 무효화된 것으로 간주
         
-        user = User.query.get(int(user_id))
-        if not user:
+        active_token = get_active_token(int(user_id), _load_active_token)
+        if active_token == USER_NOT_FOUND:
             return True  # 사용자가 없으면 무효화된 것으로 간주
         
         # active_token이 없으면 (첫 로그인 또는 로그아웃) 허용
-        if not user.active_token:
+        if not active_token:
             return False  # 블랙리스트에 없음 (유효)
         
         # 현재 토큰의 jti 가져오기
@@ -96,11 +133,11 @@ def check_if_token_revoked(jwt_header, jwt_payload):
             return True
         
         # active_token이 jti 형식인지 확인 (UUID 형식: 36자, 하이픈 포함)
-        active_token_is_jti = len(user.active_token) == 36 and user.active_token.count('-') == 4
+        active_token_is_jti = len(active_token) == 36 and active_token.count('-') == 4
         
         if active_token_is_jti:
             # active_token도 jti 형식이면 jti로 비교
-            if user.active_token != current_jti:
+            if active_token != current_jti:
                 return True  # 블랙리스트에 있음 (무효화됨)
             else:
                 return False  # 블랙리스트에 없음 (유효)
@@ -135,7 +172,7 @@ CORS(app,
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
      allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-Privacy-Token", "X-Club-Id"],
      supports_credentials=True,
-     expose_headers=["Content-Type", "Authorization"],
+     expose_headers=["Content-Type", "Authorization", "ETag", "Retry-After"],
      automatic_options=True)  # OPTIONS 요청 자동 처리
 
 # CORS는 flask-cors 라이브러리로만 처리 (중복 방지)
@@ -161,6 +198,8 @@ app.register_blueprint(clubs_bp)
 app.register_blueprint(messages_bp)
 app.register_blueprint(inquiries_bp)
 app.register_blueprint(schedules_bp)
+app.register_blueprint(events_bp)
+app.register_blueprint(search_bp)
 
 # Google Sheets 기능이 사용 가능한 경우에만 등록
 if SHEETS_AVAILABLE:
@@ -260,6 +299,102 @@ def create_super_admin():
         
         # 슈퍼 관리자 계정 생성 완료
 
+@app.cli.command('reconcile-fund-ledger')
+@click.option('--club-id', type=int, default=None, help='특정 클럽만 보정 (기본값: 전체)')
+def reconcile_fund_ledger(club_id):
+    """납입 내역 기준으로 회비 장부 일괄 보정 (한 번의 set-based 구문)"""
+    from utils.fund_ledger import reconcile_payment_ledger
+    from utils.fund_snapshot import update_current_month_snapshot
+    from blueprints.payments import _calculate_fund_balance_and_chart
+
+    result = reconcile_payment_ledger(club_id)
+    print(f"장부 보정 완료: 삭제 {result['removed']}건, 생성/갱신 {result['upserted']}건")
+
+    # 변경된 클럽의 스냅샷 재계산
+    for changed_club_id in sorted(result['club_ids']):
+        _calculate_fund_balance_and_chart(changed_club_id)
+        update_current_month_snapshot(changed_club_id)
+
+@app.cli.command('purge-verification-codes')
+def purge_verification_codes():
+    """만료된 인증/비밀번호 재설정 코드 일괄 삭제 (주기 실행용)"""
+    from utils.verification_codes import purge_expired_codes
+
+    deleted = purge_expired_codes()
+    db.session.commit()
+    print(f"만료된 인증 코드 {deleted}건 삭제")
+
+@app.cli.command('materialize-recurring-schedules')
+@click.option('--months', type=int, default=None, help='미리 생성할 개월 수 (기본값: RECURRING_SCHEDULE_HORIZON_MONTHS)')
+@click.option('--club-id', type=int, default=None, help='특정 클럽만 생성 (기본값: 전체)')
+def materialize_recurring_schedules(months, club_id):
+    """활성 정기 일정 규칙의 일정을 기간 끝까지 일괄 생성 (주기 실행용, 이미 있는 일정은 건너뜀)"""
+    from datetime import date
+    from models import ScheduleRecurrence
+    from utils.recurrence import materialize_recurrences, horizon_end
+
+    if months is None:
+        months = app.config.get('RECURRING_SCHEDULE_HORIZON_MONTHS', 3)
+    until = horizon_end(date.today(), months)
+    query = ScheduleRecurrence.query.filter(ScheduleRecurrence.is_active == True)
+    if club_id:
+        query = query.filter(ScheduleRecurrence.club_id == club_id)
+
+    result = materialize_recurrences(until, rules=query.all())
+    db.session.commit()
+    print(f"정기 일정 {result['rules']}개 규칙, {until}까지 일정 {result['created']}건 생성")
+
+@app.cli.command('benchmark-login')
+@click.option('--concurrency', type=int, default=4, help='동시 로그인 요청 수')
+@click.option('--total', type=int, default=32, help='전체 비밀번호 검증 횟수')
+@click.option('--cost', type=int, default=None, help='비교할 해시 비용 (기본값: 현재 설정)')
+def benchmark_login(concurrency, total, cost):
+    """동시 로그인 시 비밀번호 검증 처리량/지연 시간 측정"""
+    from utils.password_hasher import PasswordHasher, benchmark_password_verification
+
+    hasher = PasswordHasher(
+        algorithm=app.config.get('PASSWORD_HASH_ALGORITHM', 'pbkdf2:sha256'),
+        cost=cost or app.config.get('PASSWORD_HASH_COST'),
+        workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+        max_pending=max(concurrency, app.config.get('PASSWORD_HASH_MAX_PENDING', 16)),
+    )
+    try:
+        result = benchmark_password_verification(concurrency=concurrency, total=total, hasher=hasher)
+    finally:
+        hasher.shutdown()
+
+    print(f"해시 방식: {result['method']} (해시 스레드 {hasher.workers}개)")
+    print(f"동시 요청 {result['concurrency']}개, 검증 {result['total']}회, 소요 {result['elapsed']:.2f}초")
+    print(f"처리량: {result['per_second']:.1f} 로그인/초, p50 {result['p50_ms']:.0f}ms, p95 {result['p95_ms']:.0f}ms")
+
+@app.cli.command('stress-attendance')
+@click.option('--participants', type=int, default=40, help='동시에 참석 신청하는 회원 수')
+@click.option('--max-participants', type=int, default=18, help='일정 정원')
+@click.option('--cancels', type=int, default=5, help='신청 후 동시에 취소하는 참석자 수')
+@click.option('--concurrency', type=int, default=16, help='동시 요청(스레드) 수')
+def stress_attendance(participants, max_participants, cancels, concurrency):
+    """일정 참석 동시 신청/취소 시 정원 초과가 없는지 확인 (임시 데이터 생성 후 삭제, PostgreSQL 필요)"""
+    from utils.schedule_attendance import stress_test_attendance
+
+    if db.engine.dialect.name != 'postgresql':
+        print(f"⚠️ {db.engine.dialect.name} 은(는) SELECT ... FOR UPDATE 를 지원하지 않아 결과가 의미 없습니다.")
+
+    result = stress_test_attendance(
+        app,
+        participants=participants,
+        max_participants=max_participants,
+        cancels=cancels,
+        concurrency=concurrency,
+    )
+    print(f"신청 {result['participants']}명 / 정원 {result['max_participants']}명 (스레드 {concurrency}개, {result['elapsed']:.2f}초)")
+    print(f"신청 후: 참석 {result['attending']}명, 대기 {result['waiting']}명")
+    print(f"취소 {cancels}명 후: 참석 {result['after_cancel_attending']}명, 대기 {result['after_cancel_waiting']}명")
+    if result['errors']:
+        print(f"오류 {len(result['errors'])}건: {result['errors'][0]}")
+    if result['overbooked']:
+        raise click.ClickException('정원 초과 발생')
+    print('정원 초과 없음')
+
 # 데이터베이스 초기화 (애플리케이션 시작 시)
 with app.app_context():
     try:
@@ -3,7 +3,11 @@ from flask_login import login_user, logout_user, login_required, current_user
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, verify_jwt_in_request
 from datetime import datetime, timedelta
 from models import db, User, AppSetting
-from werkzeug.security import generate_password_hash, check_password_hash
+from utils.password_hasher import hash_password, verify_password, PasswordHasherBusy, password_hasher_busy_response
+from utils.rate_limit import rate_limit, record_login_failure, reset_login_failures
+from utils.verification_codes import (
+    PURPOSE_VERIFY, PURPOSE_PASSWORD_RESET, issue_code, get_code, check_code, consume_code
+)
 import google.auth.transport.requests
 from google.oauth2 import id_token
 import os
@@ -14,10 +18,22 @@ import random
 import string
 import uuid
 import hashlib
+from utils.token_cache import store_active_token, USER_NOT_FOUND
+from utils.role_cache import invalidate_user_roles
+from utils.conversation_summary import delete_user_conversations
+from utils.identity import get_user, get_current_user as get_request_user, get_membership_summary
 
 # 인증 관리 Blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+# 요청 제한 (capacity, period_seconds): period 동안 capacity 회까지 허용
+LOGIN_IP_LIMIT = (20, 60)  # IP당 1분에 20회
+LOGIN_FAILURE_LIMIT = (5, 300)  # 이메일당 5분에 로그인 실패 5회
+CODE_SEND_IP_LIMIT = (10, 600)  # 인증 코드 발송: IP당 10분에 10회
+CODE_SEND_EMAIL_LIMIT = (3, 600)  # 인증 코드 발송: 이메일당 10분에 3회
+CODE_VERIFY_IP_LIMIT = (30, 600)  # 인증 코드 검증: IP당 10분에 30회
+CODE_VERIFY_EMAIL_LIMIT = (10, 600)  # 인증 코드 검증: 이메일당 10분에 10회
+
 def get_device_fingerprint():
     """요청의 User-Agent와 IP 주소를 조합해서 기기 식별자 생성"""
     user_agent = request.headers.get('User-Agent', '')
@@ -82,12 +98,12 @@ def get_current_user_from_jwt():
     """JWT 토큰에서 현재 사용자 정보 가져오기"""
     try:
         verify_jwt_in_request()
-        user_id = get_jwt_identity()
-        return User.query.get(int(user_id))
+        return get_request_user()
     except Exception as e:
         return None
 
 @auth_bp.route('/register', methods=['POST'])
+@rate_limit('register', per_ip=CODE_SEND_IP_LIMIT, per_email=CODE_SEND_EMAIL_LIMIT)
 def register():
     """일반 회원가입"""
     try:
@@ -221,6 +237,7 @@ def check_active_session():
         return jsonify({'success': False, 'message': f'활성 세션 확인 중 오류가 발생했습니다: {str(e)}'})
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit('login', per_ip=LOGIN_IP_LIMIT, per_email=LOGIN_FAILURE_LIMIT, email_on_failure=True)
 def login():
     """일반 로그인"""
     try:
@@ -235,8 +252,14 @@ def login():
         # 사용자 찾기
         user = User.query.filter_by(email=email).first()
         
-        if not user or not user.check_password(password):
+        try:
+            password_ok = user is not None and user.check_password(password)
+        except PasswordHasherBusy as e:
+            return password_hasher_busy_response(e)
+        if not password_ok:
+            record_login_failure('login', email, LOGIN_FAILURE_LIMIT)
             return jsonify({'success': False, 'message': '이메일 또는 비밀번호가 올바르지 않습니다.'})
+        reset_login_failures('login', email)
         
         if not user.is_active:
             return jsonify({'success': False, 'message': '비활성화된 계정입니다.'})
@@ -288,46 +311,26 @@ def login():
         old_active_token = user.active_token
         user.active_token = jti
         user.last_device_fingerprint = current_device_fingerprint
-        db.session.commit()
         
-        print(f"[LOGIN] User {user.id} ({email}): Updated active_token from {old_active_token[:8] if old_active_token else 'None'}... to {jti[:8]}...")
+        # 응답 데이터는 커밋 전에 구성 (커밋 후 user 재조회 방지)
+        # 클럽 멤버십 요약: 멤버십 + 클럽 한 번의 조인 쿼리
+        membership_summary = get_membership_summary(user.id)
+        user_dict = user.to_dict()
+        user_dict['clubs'] = membership_summary['clubs']
         
-        # 승인된 클럽 멤버십 정보 추가
-        from models import ClubMember, Club
-        club_memberships = ClubMember.query.filter_by(
-            user_id=user.id,
-            status='approved'
-        ).all()
-        clubs_info = []
-        for membership in club_memberships:
-            club = Club.query.get(membership.club_id)
-            if club:
-                clubs_info.append({
-                    'id': club.id,
-                    'name': club.name,
-                    'role': membership.role,
-                    'status': membership.status
-                })
+        db.session.commit()
+        store_active_token(user_dict['id'], jti)
         
-        # 승인 대기 중인 멤버십 확인
-        pending_memberships = ClubMember.query.filter_by(
-            user_id=user.id,
-            status='pending'
-        ).all()
-        has_pending_membership = len(pending_memberships) > 0
-        has_approved_club = len(club_memberships) > 0
+        print(f"[LOGIN] User {user_dict['id']} ({email}): Updated active_token from {old_active_token[:8] if old_active_token else 'None'}... to {jti[:8]}...")
         
         # 승인 대기 중이고 승인된 클럽이 없는 경우
-        if has_pending_membership and not has_approved_club:
+        if membership_summary['has_pending_membership'] and not membership_summary['has_approved_club']:
             return jsonify({
                 'success': True,
                 'message': '아직 클럽 가입 승인이 완료되지 않았습니다. 승인 후 다시 로그인해주세요.',
                 'pending_approval': True
             })
         
-        user_dict = user.to_dict()
-        user_dict['clubs'] = clubs_info
-        
         return jsonify({
             'success': True,
             'message': '로그인되었습니다.',
@@ -436,8 +439,7 @@ def google_login():
         
         # 새 사용자이고 클럽에 가입하지 않은 경우 클럽 선택 필요
         if is_new_user:
-            from models import ClubMember
-            has_club = ClubMember.query.filter_by(user_id=user.id).first() is not None
+            has_club = get_membership_summary(user.id)['has_membership']
             if not has_club:
                 # 사용자는 생성되었지만 클럽 선택이 필요함
                 db.session.commit()  # 사용자 정보는 저장
@@ -506,6 +508,7 @@ def google_login():
         # 새 토큰의 jti를 활성 토큰으로 저장
         user.active_token = jti
         db.session.commit()
+        store_active_token(user.id, jti)
         
         return jsonify({
             'success': True,
@@ -557,6 +560,7 @@ def google_confirm_login():
         user.active_token = jti
         user.last_device_fingerprint = current_device_fingerprint
         db.session.commit()
+        store_active_token(user.id, jti)
         
         print(f"[GOOGLE_CONFIRM_LOGIN] User {user.id} ({email}): Updated active_token from {old_active_token[:8] if old_active_token else 'None'}... to {jti[:8]}...")
         
@@ -718,21 +722,18 @@ def google_callback():
             return jsonify({'success': False, 'message': '비활성화된 계정입니다.'})
         
         # 모든 사용자에 대해 클럽 가입 여부 확인 (새 사용자든 기존 사용자든)
-        from models import ClubMember
-        all_memberships = ClubMember.query.filter_by(user_id=user.id).all()
-        approved_memberships = [m for m in all_memberships if m.status == 'approved']
-        pending_memberships = [m for m in all_memberships if m.status == 'pending']
-        has_approved_club = len(approved_memberships) > 0
+        membership_summary = get_membership_summary(user.id)
+        has_approved_club = membership_summary['has_approved_club']
         
         # 승인 대기 중인 사용자는 승인 대기 메시지 반환
         # pending 멤버십이 있고 승인된 멤버십이 없는 경우
-        if len(pending_memberships) > 0 and not has_approved_club:
+        if membership_summary['has_pending_membership'] and not has_approved_club:
             # pending 멤버십이 최근에 생성된 것인지 확인 (5분 이내)
             # 첫 회원가입 시 클럽 선택 직후에는 승인 대기 메시지를 반환하지 않음
             recent_pending = any(
-                (datetime.utcnow() - m.requested_at).total_seconds() < 300 
-                for m in pending_memberships 
-                if m.requested_at
+                (datetime.utcnow() - requested_at).total_seconds() < 300 
+                for requested_at in membership_summary['pending_requested_at'] 
+                if requested_at
             )
             
             # 첫 회원가입이 아닌 경우(재로그인)에는 항상 승인 대기 메시지 반환
@@ -825,11 +826,15 @@ def google_callback():
         # 새 토큰의 jti를 활성 토큰으로 저장
         user.active_token = jti
         db.session.commit()
+        store_active_token(user.id, jti)
+        
+        user_dict = user.to_dict()
+        user_dict['clubs'] = membership_summary['clubs']
         
         return jsonify({
             'success': True,
             'message': '구글 로그인이 완료되었습니다.',
-            'user': user.to_dict(),
+            'user': user_dict,
             'access_token': access_token,
             'has_active_session': False  # 활성 세션이 없었으므로 False
         })
@@ -860,10 +865,11 @@ def logout():
                     pass
             
             if user_id:
-                user = User.query.get(int(user_id))
+                user = get_user(user_id)
                 if user:
                     user.active_token = None
                     db.session.commit()
+                    store_active_token(user.id, None)
         except:
             pass
         
@@ -888,7 +894,7 @@ def logout_other_devices():
     """다른 기기에서 로그아웃 (현재 기기는 유지)"""
     try:
         user_id = get_jwt_identity()
-        user = User.query.get(int(user_id))
+        user = get_user(user_id)
         
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
@@ -902,6 +908,7 @@ def logout_other_devices():
             if current_jti:
                 user.active_token = current_jti
                 db.session.commit()
+                store_active_token(user.id, current_jti)
             else:
                 return jsonify({'success': False, 'message': '토큰에서 jti를 찾을 수 없습니다.'})
         except Exception as e:
@@ -922,30 +929,15 @@ def get_current_user():
     try:
         user_id = get_jwt_identity()
         # JWT identity는 문자열로 저장되므로 정수로 변환
-        user = User.query.get(int(user_id))
+        user = get_user(user_id)
         
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
         
         user_dict = user.to_dict()
         
-        # 승인된 클럽 멤버십 정보 추가
-        from models import ClubMember, Club
-        club_memberships = ClubMember.query.filter_by(
-            user_id=user.id,
-            status='approved'
-        ).all()
-        clubs_info = []
-        for membership in club_memberships:
-            club = Club.query.get(membership.club_id)
-            if club:
-                clubs_info.append({
-                    'id': club.id,
-                    'name': club.name,
-                    'role': membership.role,
-                    'status': membership.status
-                })
-        user_dict['clubs'] = clubs_info
+        # 승인된 클럽 멤버십 정보 추가 (멤버십 + 클럽 한 번의 조인 쿼리)
+        user_dict['clubs'] = get_membership_summary(user.id)['clubs']
         
         return jsonify({
             'success': True,
@@ -955,52 +947,106 @@ def get_current_user():
     except Exception as e:
         return jsonify({'success': False, 'message': f'사용자 정보 조회 중 오류가 발생했습니다: {str(e)}'})
 
+# 사용자 목록 응답에서 선택 가능한 필드 (fields= 파라미터)
+USER_LIST_FIELDS = User.DICT_FIELDS + ('clubs',)
+USER_LIST_PER_PAGE = 50
+USER_LIST_MAX_PER_PAGE = 200
+
 @auth_bp.route('/users', methods=['GET'])
 @jwt_required()
 def get_users():
     """사용자 목록 조회 (관리자만)"""
     try:
         user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(user_id))
+        current_user_obj = get_user(user_id)
         
         if not current_user_obj or current_user_obj.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
         
         from models import ClubMember, Club
+        from sqlalchemy.orm import load_only
+        
+        # fields=id,name,email 처럼 필요한 필드만 요청 가능 (기본값: 전체 + clubs)
+        fields_param = request.args.get('fields')
+        if fields_param:
+            fields = [f.strip() for f in fields_param.split(',') if f.strip()]
+            invalid_fields = [f for f in fields if f not in USER_LIST_FIELDS]
+            if invalid_fields:
+                return jsonify({'success': False, 'message': f'지원하지 않는 필드입니다: {", ".join(invalid_fields)}'}), 400
+            if 'id' not in fields:
+                fields.insert(0, 'id')
+        else:
+            fields = list(USER_LIST_FIELDS)
+        include_clubs = 'clubs' in fields
+        user_fields = [f for f in fields if f != 'clubs']
+        
+        # 승인 요청 상태(pending)만 있고 승인된 멤버십이 없는 사용자는 제외
+        # (승인 요청 상태는 가입한 상태가 아니므로)
+        has_approved = db.session.query(ClubMember.id).filter(
+            ClubMember.user_id == User.id, ClubMember.status == 'approved'
+        ).exists()
+        has_pending = db.session.query(ClubMember.id).filter(
+            ClubMember.user_id == User.id, ClubMember.status == 'pending'
+        ).exists()
+        
+        # 목록에 필요한 컬럼만 로드 (토큰/비밀번호 해시 등 제외)
+        query = User.query.options(
+            load_only(*[getattr(User, f) for f in user_fields])
+        ).filter(
+            db.or_(has_approved, ~has_pending)
+        ).order_by(User.id)
+        
+        # page 지정 시에만 페이지네이션 (미지정 시 기존처럼 전체 반환)
+        pagination = None
+        if request.args.get('page'):
+            page = max(int(request.args.get('page', 1)), 1)
+            per_page = min(max(int(request.args.get('per_page', USER_LIST_PER_PAGE)), 1), USER_LIST_MAX_PER_PAGE)
+            pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+            users = pagination.items
+        else:
+            users = query.all()
+        
+        # 승인된 클럽 정보는 조회된 사용자 전체에 대해 한 번의 조인 쿼리로 조회
+        clubs_by_user = {}
+        if include_clubs and users:
+            rows = db.session.query(
+                ClubMember.user_id, ClubMember.role, ClubMember.status, Club.id, Club.name
+            ).join(
+                Club, Club.id == ClubMember.club_id
+            ).filter(
+                ClubMember.user_id.in_([user.id for user in users]),
+                ClubMember.status == 'approved'
+            ).order_by(ClubMember.id).all()
+            for member_user_id, role, status, club_id, club_name in rows:
+                clubs_by_user.setdefault(member_user_id, []).append({
+                    'id': club_id,
+                    'name': club_name,
+                    'role': role,
+                    'status': status
+                })
         
-        users = User.query.all()
         users_data = []
         for user in users:
-            # 모든 멤버십 조회 (승인된 것과 대기 중인 것 모두)
-            all_memberships = ClubMember.query.filter_by(user_id=user.id).all()
-            approved_memberships = [m for m in all_memberships if m.status == 'approved']
-            pending_memberships = [m for m in all_memberships if m.status == 'pending']
-            
-            # 승인 요청 상태(pending)만 있고 승인된 멤버십이 없는 사용자는 제외
-            # (승인 요청 상태는 가입한 상태가 아니므로)
-            if len(pending_memberships) > 0 and len(approved_memberships) == 0:
-                continue  # 이 사용자는 목록에서 제외
-            
-            user_dict = user.to_dict()
-            # 승인된 클럽 정보만 추가
-            clubs_info = []
-            for membership in approved_memberships:
-                club = Club.query.get(membership.club_id)
-                if club:
-                    clubs_info.append({
-                        'id': club.id,
-                        'name': club.name,
-                        'role': membership.role,
-                        'status': membership.status
-                    })
-            user_dict['clubs'] = clubs_info
+            user_dict = user.to_dict(user_fields)
+            if include_clubs:
+                user_dict['clubs'] = clubs_by_user.get(user.id, [])
             users_data.append(user_dict)
         
-        return jsonify({
+        response = {
             'success': True,
             'users': users_data
-        })
+        }
+        if pagination is not None:
+            response['pagination'] = {
+                'page': page,
+                'per_page': per_page,
+                'total': pagination.total,
+                'pages': pagination.pages
+            }
+        return jsonify(response)
         
+    except ValueError:
+        return jsonify({'success': False, 'message': '잘못된 페이지 값입니다.'}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': f'사용자 목록 조회 중 오류가 발생했습니다: {str(e)}'})
 
@@ -1010,7 +1056,7 @@ def update_user_role(user_id):
     """사용자 역할 변경 (슈퍼 관리자만)"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
@@ -1031,6 +1077,7 @@ def update_user_role(user_id):
         
         user.role = new_role
         db.session.commit()
+        invalidate_user_roles(user.id)
         
         return jsonify({
             'success': True,
@@ -1048,7 +1095,7 @@ def update_user_status(user_id):
     """사용자 활성화 상태 변경 (슈퍼 관리자만)"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
@@ -1083,7 +1130,7 @@ def delete_user(user_id):
     """사용자 삭제 (슈퍼 관리자만)"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
@@ -1109,9 +1156,15 @@ def delete_user(user_id):
         # 클럽 멤버십 삭제
         ClubMember.query.filter_by(user_id=user.id).delete()
         
+        # 대화 요약 삭제
+        delete_user_conversations(user.id)
+        
         # 사용자 삭제
+        deleted_user_id = user.id
         db.session.delete(user)
         db.session.commit()
+        store_active_token(deleted_user_id, USER_NOT_FOUND)
+        invalidate_user_roles(deleted_user_id)
         
         return jsonify({
             'success': True,
@@ -1145,6 +1198,8 @@ def verify_email():
         result = verify_email_token(token)
         return jsonify(result)
         
+    except PasswordHasherBusy as e:
+        return password_hasher_busy_response(e)
     except Exception as e:
         return jsonify({'success': False, 'message': f'이메일 인증 중 오류가 발생했습니다: {str(e)}'})
 
@@ -1329,6 +1384,7 @@ def get_google_config():
         return jsonify({'success': False, 'message': f'설정 확인 중 오류: {str(e)}'})
 
 @auth_bp.route('/verify-code', methods=['POST'])
+@rate_limit('verify-code', per_ip=CODE_VERIFY_IP_LIMIT, per_email=CODE_VERIFY_EMAIL_LIMIT)
 def verify_code():
     """인증 코드 검증 (구글 로그인용)"""
     try:
@@ -1349,20 +1405,18 @@ def verify_code():
         if user.is_verified:
             return jsonify({'success': False, 'message': '이미 인증된 계정입니다.'})
         
-        # 인증 코드 검증
-        if user.verification_code != code:
+        # 인증 코드 검증 (만료 포함)
+        code_status = check_code(email, PURPOSE_VERIFY, code)
+        if code_status == 'invalid':
             return jsonify({'success': False, 'message': '인증 코드가 올바르지 않습니다.'})
-        
-        # 인증 코드 만료 확인
-        if user.verification_code_expires and user.verification_code_expires < datetime.utcnow():
+        if code_status == 'expired':
             return jsonify({'success': False, 'message': '인증 코드가 만료되었습니다. 다시 로그인해주세요.'})
         
         # 인증 완료 처리
         user.is_verified = True
         user.is_active = True
         user.verified_at = datetime.utcnow()
-        user.verification_code = None  # 보안을 위해 코드 삭제
-        user.verification_code_expires = None
+        consume_code(email, PURPOSE_VERIFY)  # 보안을 위해 코드 삭제
         
         db.session.commit()
         
@@ -1385,6 +1439,7 @@ def verify_code():
         user.active_token = jti
         user.last_device_fingerprint = current_device_fingerprint
         db.session.commit()
+        store_active_token(user.id, jti)
         
         print(f"User verified and logged in: {user.email}")
         
@@ -1409,7 +1464,7 @@ def get_verification_code(email):
     try:
         # 현재 사용자 확인
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
@@ -1423,17 +1478,15 @@ def get_verification_code(email):
         if user.is_verified:
             return jsonify({'success': False, 'message': '이미 인증된 계정입니다.'})
         
-        if not user.verification_code:
+        verification = get_code(user.email, PURPOSE_VERIFY)
+        if not verification:
             return jsonify({'success': False, 'message': '인증 코드가 생성되지 않았습니다.'})
         
-        # 만료 여부 확인
-        is_expired = user.verification_code_expires and user.verification_code_expires < datetime.utcnow()
-        
         return jsonify({
             'success': True,
-            'verification_code': user.verification_code,
-            'expires_at': user.verification_code_expires.strftime('%Y-%m-%d %H:%M:%S') if user.verification_code_expires else None,
-            'is_expired': is_expired,
+            'verification_code': verification.code,
+            'expires_at': verification.expires_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'is_expired': verification.is_expired,
             'user': {
                 'email': user.email,
                 'name': user.name,
@@ -1452,7 +1505,7 @@ def regenerate_verification_code():
     try:
         # 현재 사용자 확인
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '권한이 없습니다.'})
@@ -1474,10 +1527,7 @@ def regenerate_verification_code():
         
         # 새 인증 코드 생성
         new_code = generate_verification_code()
-        new_expires = datetime.utcnow() + timedelta(hours=24)
-        
-        user.verification_code = new_code
-        user.verification_code_expires = new_expires
+        new_expires = issue_code(user.email, PURPOSE_VERIFY, new_code, timedelta(hours=24))
         
         db.session.commit()
         
@@ -1501,7 +1551,7 @@ def set_privacy_password():
     """개인정보 보호 비밀번호 설정 (슈퍼관리자 전용) - 전역 설정"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj or current_user_obj.role != 'super_admin':
             return jsonify({'success': False, 'message': '슈퍼관리자만 설정할 수 있습니다.'})
@@ -1516,7 +1566,7 @@ def set_privacy_password():
             return jsonify({'success': False, 'message': '비밀번호는 4자리 이상이어야 합니다.'})
         
         # 전역 개인정보 보호 비밀번호 설정
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
         
         setting = AppSetting.query.filter_by(setting_key='privacy_password').first()
         if setting:
@@ -1539,6 +1589,9 @@ def set_privacy_password():
             'message': '개인정보 보호 비밀번호가 설정되었습니다. (전체 관리자에게 적용)'
         })
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy_response(e)
     except Exception as e:
         db.session.rollback()
         print(f"Error setting privacy password: {e}")
@@ -1550,7 +1603,7 @@ def verify_privacy_password():
     """개인정보 보호 비밀번호 검증 - 전역 비밀번호 사용"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
@@ -1573,7 +1626,7 @@ def verify_privacy_password():
             })
         
         # 비밀번호 검증
-        if check_password_hash(setting.setting_value, password):
+        if verify_password(setting.setting_value, password):
             return jsonify({
                 'success': True,
                 'message': '비밀번호가 확인되었습니다.'
@@ -1584,6 +1637,8 @@ def verify_privacy_password():
                 'message': '비밀번호가 올바르지 않습니다.'
             })
         
+    except PasswordHasherBusy as e:
+        return password_hasher_busy_response(e)
     except Exception as e:
         print(f"Error verifying privacy password: {e}")
         return jsonify({'success': False, 'message': f'비밀번호 검증 중 오류가 발생했습니다: {str(e)}'})
@@ -1594,7 +1649,7 @@ def check_privacy_password_status():
     """개인정보 보호 비밀번호 설정 여부 확인 - 전역 설정"""
     try:
         current_user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(current_user_id))
+        current_user_obj = get_user(current_user_id)
         
         if not current_user_obj:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
@@ -1612,6 +1667,7 @@ def check_privacy_password_status():
         return jsonify({'success': False, 'message': f'상태 확인 중 오류가 발생했습니다: {str(e)}'})
 
 @auth_bp.route('/resend-verification-code', methods=['POST'])
+@rate_limit('resend-verification-code', per_ip=CODE_SEND_IP_LIMIT, per_email=CODE_SEND_EMAIL_LIMIT)
 def resend_verification_code():
     """인증 코드 재발송 (사용자용 - 인증 불필요)"""
     try:
@@ -1632,10 +1688,7 @@ def resend_verification_code():
         
         # 새 인증 코드 생성
         new_code = generate_verification_code()
-        new_expires = datetime.utcnow() + timedelta(hours=24)
-        
-        user.verification_code = new_code
-        user.verification_code_expires = new_expires
+        issue_code(user.email, PURPOSE_VERIFY, new_code, timedelta(hours=24))
         
         db.session.commit()
         
@@ -1667,6 +1720,7 @@ def resend_verification_code():
         return jsonify({'success': False, 'message': f'인증 코드 재발송 중 오류가 발생했습니다: {str(e)}'})
 
 @auth_bp.route('/forgot-password', methods=['POST'])
+@rate_limit('forgot-password', per_ip=CODE_SEND_IP_LIMIT, per_email=CODE_SEND_EMAIL_LIMIT)
 def forgot_password():
     """비밀번호 찾기 - 인증 코드 발송"""
     try:
@@ -1692,11 +1746,9 @@ def forgot_password():
         
         # 새 인증 코드 생성 (6자리)
         reset_code = generate_verification_code()
-        reset_expires = datetime.utcnow() + timedelta(hours=1)  # 1시간 유효
         
-        # 사용자 정보에 비밀번호 재설정 코드 저장
-        user.verification_code = reset_code
-        user.verification_code_expires = reset_expires
+        # 비밀번호 재설정 코드 저장 (1시간 유효)
+        issue_code(user.email, PURPOSE_PASSWORD_RESET, reset_code, timedelta(hours=1))
         
         db.session.commit()
         
@@ -1736,6 +1788,7 @@ def forgot_password():
         return jsonify({'success': False, 'message': f'비밀번호 찾기 중 오류가 발생했습니다: {str(e)}'})
 
 @auth_bp.route('/verify-reset-code', methods=['POST'])
+@rate_limit('verify-reset-code', per_ip=CODE_VERIFY_IP_LIMIT, per_email=CODE_VERIFY_EMAIL_LIMIT)
 def verify_reset_code():
     """비밀번호 재설정 코드 검증"""
     try:
@@ -1752,12 +1805,11 @@ def verify_reset_code():
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
         
-        # 인증 코드 검증
-        if user.verification_code != code:
+        # 인증 코드 검증 (만료 포함)
+        code_status = check_code(email, PURPOSE_PASSWORD_RESET, code)
+        if code_status == 'invalid':
             return jsonify({'success': False, 'message': '인증 코드가 올바르지 않습니다.'})
-        
-        # 인증 코드 만료 확인
-        if user.verification_code_expires and user.verification_code_expires < datetime.utcnow():
+        if code_status == 'expired':
             return jsonify({'success': False, 'message': '인증 코드가 만료되었습니다. 다시 요청해주세요.'})
         
         # 임시 토큰 생성 (비밀번호 재설정용)
@@ -1802,7 +1854,7 @@ def reset_password():
         
         # JWT에서 사용자 ID 가져오기
         user_id = get_jwt_identity()
-        user = User.query.get(int(user_id))
+        user = get_user(user_id)
         
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
@@ -1811,8 +1863,7 @@ def reset_password():
         user.set_password(new_password)
         
         # 인증 코드 초기화 (보안)
-        user.verification_code = None
-        user.verification_code_expires = None
+        consume_code(user.email, PURPOSE_PASSWORD_RESET)
         
         db.session.commit()
         
@@ -1823,6 +1874,9 @@ def reset_password():
             'message': '비밀번호가 성공적으로 재설정되었습니다. 새 비밀번호로 로그인해주세요.'
         })
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy_response(e)
     except Exception as e:
         db.session.rollback()
         print(f"Error resetting password: {e}")
@@ -1910,6 +1964,9 @@ def change_password():
             'message': '비밀번호가 성공적으로 변경되었습니다.'
         })
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy_response(e)
     except Exception as e:
         db.session.rollback()
         print(f"Error in change_password: {e}")
@@ -1926,7 +1983,7 @@ def register_fcm_token():
         if not user_id:
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
         
-        user = User.query.get(int(user_id))
+        user = get_user(user_id)
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
         
@@ -1991,10 +2048,16 @@ def delete_account():
         # 클럽 멤버십 삭제
         ClubMember.query.filter_by(user_id=current_user.id).delete()
         
+        # 대화 요약 삭제
+        delete_user_conversations(current_user.id)
+        
         # 계정 삭제
         user_email = current_user.email
+        deleted_user_id = current_user.id
         db.session.delete(current_user)
         db.session.commit()
+        store_active_token(deleted_user_id, USER_NOT_FOUND)
+        invalidate_user_roles(deleted_user_id)
         
         print(f"Account deleted for user: {user_email} (Google user: {is_google_user})")
         
@@ -2003,6 +2066,9 @@ def delete_account():
             'message': '회원탈퇴가 완료되었습니다.'
         })
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy_response(e)
     except Exception as e:
         db.session.rollback()
         print(f"Error in delete_account: {e}")
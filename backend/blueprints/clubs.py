@@ -15,6 +15,11 @@ from models import (
     FundLedger,
 )
 from datetime import datetime
+from utils.token_cache import store_active_token
+from utils.role_cache import invalidate_club_role, invalidate_user_roles, clear_role_cache
+from utils.identity import get_user, get_approved_membership
+from utils.event_bus import publish_event, SUPER_ADMIN_TOPIC, EVENT_JOIN_REQUESTS
+from utils.notification_counters import pending_join_request_count
 
 clubs_bp = Blueprint('clubs', __name__, url_prefix='/api/clubs')
 
@@ -59,6 +64,10 @@ def check_club_permission(user_id, club_id, required_role='member'):
     role_hierarchy = {'member': 1, 'admin': 2, 'owner': 3}
     return role_hierarchy.get(role, 0) >= role_hierarchy.get(required_role, 0)
 
+def publish_join_requests_changed():
+    """가입 요청 수 변경 알림 (슈퍼관리자 실시간 알림 채널, 커밋 후 호출)"""
+    publish_event([SUPER_ADMIN_TOPIC], EVENT_JOIN_REQUESTS)
+
 # 모든 클럽 목록 조회 (회원가입용 - 가입 여부와 관계없이)
 @clubs_bp.route('/public', methods=['GET'])
 def get_all_clubs():
@@ -81,7 +90,7 @@ def get_user_clubs():
     """사용자가 가입한 클럽 목록 조회 (슈퍼관리자는 모든 클럽 조회)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         is_super_admin = current_user and current_user.role == 'super_admin'
         
         if is_super_admin:
@@ -156,6 +165,7 @@ def create_club():
         )
         db.session.add(membership)
         db.session.commit()
+        invalidate_club_role(user_id, club.id)
         
         return jsonify({
             'success': True,
@@ -179,7 +189,7 @@ def get_club(club_id):
         club = Club.query.get_or_404(club_id)
         
         # 사용자 정보 확인
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         is_super_admin = current_user and current_user.role == 'super_admin'
         
         # 가입 여부 확인 (슈퍼관리자는 가입하지 않아도 선택 가능)
@@ -270,6 +280,9 @@ def select_club_after_signup():
         
         db.session.add(membership)
         db.session.commit()
+        invalidate_club_role(user_id, club_id)
+        if membership.status == 'pending':
+            publish_join_requests_changed()
         
         # 로그인 처리
         from flask_login import login_user
@@ -290,6 +303,7 @@ def select_club_after_signup():
         # 새 토큰의 jti를 활성 토큰으로 저장
         user.active_token = jti
         db.session.commit()
+        store_active_token(user.id, jti)
         
         # 클럽 정보와 멤버십 상태 포함
         club_data = club.to_dict()
@@ -312,7 +326,7 @@ def join_club(club_id):
     """클럽 가입 요청 (승인 대기 상태)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         # 슈퍼관리자는 즉시 가입
         is_super_admin = current_user and current_user.role == 'super_admin'
@@ -334,6 +348,8 @@ def join_club(club_id):
                 existing.approved_at = None
                 existing.approved_by = None
                 db.session.commit()
+                invalidate_club_role(user_id, club_id)
+                publish_join_requests_changed()
                 return jsonify({
                     'success': True,
                     'message': '클럽 가입 요청이 다시 제출되었습니다. 승인을 기다려주세요.',
@@ -366,6 +382,9 @@ def join_club(club_id):
         
         db.session.add(membership)
         db.session.commit()
+        invalidate_club_role(user_id, club_id)
+        if membership.status == 'pending':
+            publish_join_requests_changed()
         
         return jsonify({
             'success': True,
@@ -392,8 +411,12 @@ def leave_club(club_id):
         if membership.role == 'owner':
             return jsonify({'success': False, 'message': '클럽 소유자는 탈퇴할 수 없습니다. 먼저 소유권을 이전해주세요.'}), 400
         
+        was_pending = membership.status == 'pending'
         db.session.delete(membership)
         db.session.commit()
+        invalidate_club_role(user_id, club_id)
+        if was_pending:
+            publish_join_requests_changed()
         
         return jsonify({
             'success': True,
@@ -410,7 +433,7 @@ def remove_member_from_club(club_id, user_id):
     """클럽에서 사용자 강제 탈퇴 (슈퍼관리자만 가능)"""
     try:
         current_user_id = int(get_jwt_identity())
-        current_user = User.query.get(current_user_id)
+        current_user = get_user(current_user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -428,6 +451,7 @@ def remove_member_from_club(club_id, user_id):
         
         db.session.delete(membership)
         db.session.commit()
+        invalidate_club_role(user_id, club_id)
         
         return jsonify({
             'success': True,
@@ -448,7 +472,7 @@ def update_club_description(club_id):
     """
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
 
@@ -496,7 +520,7 @@ def delete_club(club_id):
     """클럽 전체 삭제 (슈퍼관리자만 가능)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '클럽을 삭제할 권한이 없습니다.'}), 403
 
@@ -519,6 +543,7 @@ def delete_club(club_id):
 
         db.session.delete(club)
         db.session.commit()
+        clear_role_cache()
 
         return jsonify({'success': True, 'message': '클럽이 삭제되었습니다.'})
     except Exception as e:
@@ -532,7 +557,7 @@ def select_club(club_id):
     """현재 사용할 클럽 선택 (슈퍼관리자는 가입하지 않은 클럽도 선택 가능)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         is_super_admin = current_user and current_user.role == 'super_admin'
         
         # 클럽 존재 확인
@@ -574,7 +599,7 @@ def get_club_users(club_id):
     """클럽에 가입한 모든 사용자(User) 목록 조회"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         # 클럽 존재 확인
         club = Club.query.get_or_404(club_id)
@@ -582,9 +607,7 @@ def get_club_users(club_id):
         # 슈퍼관리자이거나 해당 클럽의 승인된 멤버인지 확인
         is_super_admin = current_user and current_user.role == 'super_admin'
         if not is_super_admin:
-            membership = ClubMember.query.filter_by(
-                user_id=user_id, club_id=club_id, status='approved'
-            ).first()
+            membership = get_approved_membership(user_id, club_id)
             if not membership:
                 return jsonify({'success': False, 'message': '클럽에 가입하지 않았습니다.'}), 403
         
@@ -624,7 +647,7 @@ def update_club_member_role(club_id, user_id):
     """
     try:
         current_user_id = int(get_jwt_identity())
-        current_user = User.query.get(current_user_id)
+        current_user = get_user(current_user_id)
 
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -654,6 +677,7 @@ def update_club_member_role(club_id, user_id):
         membership.joined_at = membership.joined_at or datetime.utcnow()
 
         db.session.commit()
+        invalidate_club_role(membership.user_id, membership.club_id)
 
         return jsonify({
             'success': True,
@@ -675,7 +699,7 @@ def get_join_requests():
     """승인 대기 중인 클럽 가입 요청 목록 조회"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -718,13 +742,13 @@ def get_join_requests_count():
     """승인 대기 중인 클럽 가입 요청 개수 조회"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
         
         # 승인 대기 중인 요청 개수 조회
-        count = ClubMember.query.filter_by(status='pending').count()
+        count = pending_join_request_count()
         
         return jsonify({
             'success': True,
@@ -740,7 +764,7 @@ def approve_join_request(request_id):
     """클럽 가입 요청 승인"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -759,6 +783,8 @@ def approve_join_request(request_id):
             membership.joined_at = datetime.utcnow()
         
         db.session.commit()
+        invalidate_club_role(membership.user_id, membership.club_id)
+        publish_join_requests_changed()
         
         return jsonify({
             'success': True,
@@ -776,7 +802,7 @@ def reject_join_request(request_id):
     """클럽 가입 요청 거부 (사용자와 멤버십 모두 삭제)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -808,6 +834,8 @@ def reject_join_request(request_id):
             db.session.delete(membership)
         
         db.session.commit()
+        invalidate_user_roles(request_user_id)
+        publish_join_requests_changed()
         
         return jsonify({
             'success': True,
@@ -931,7 +959,7 @@ def update_promotion_club_detail(club_id):
     """클럽 상세 정보 업데이트 (운영진 이상)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '사용자 정보를 찾을 수 없습니다.'}), 401
         
@@ -995,7 +1023,7 @@ def upload_club_image(club_id):
         from werkzeug.utils import secure_filename
         
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '사용자 정보를 찾을 수 없습니다.'}), 401
         
@@ -1062,7 +1090,7 @@ def create_promotion_club():
     """클럽 생성 (슈퍼관리자 전용)"""
     try:
         user_id = int(get_jwt_identity())
-        current_user = User.query.get(user_id)
+        current_user = get_user(user_id)
         
         if not current_user or current_user.role != 'super_admin':
             return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
@@ -1120,7 +1148,7 @@ def toggle_club_favorite(club_id):
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
         
         # 사용자가 실제로 회원가입되어 있는지 확인 (최소한 하나의 클럽에 가입되어 있어야 함)
-        user = User.query.get(int(current_user_id))
+        user = get_user(current_user_id)
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
         
@@ -0,0 +1,113 @@
+from flask import Blueprint, request, jsonify, make_response, current_app
+from flask_jwt_extended import jwt_required
+from models import db
+from utils.club_helpers import get_current_club_id
+from utils.identity import get_current_user as get_request_user
+from utils.event_bus import (
+    get_event_bus, user_topic, club_admins_topic, SUPER_ADMIN_TOPIC, EventBusBusy
+)
+from utils.notification_counters import get_counters, can_view_unread_inquiries
+
+# 실시간 알림 Blueprint
+# 안 읽은 메시지 / 답변 대기 문의 / 가입 요청 카운터를 주기적으로 따로 조회하는 대신
+# long-poll 요청 하나로 변경 사항을 받습니다.
+# (EventSource 는 Authorization 헤더를 보낼 수 없어 SSE 대신 long-poll 사용)
+events_bp = Blueprint('events', __name__, url_prefix='/api/events')
+
+@events_bp.before_request
+def handle_preflight():
+    if request.method == "OPTIONS":
+        response = make_response()
+        allowed_origins = current_app.config.get('CORS_ALLOWED_ORIGINS', [])
+        request_origin = request.headers.get('Origin')
+        if request_origin and request_origin in allowed_origins:
+            response.headers.add("Access-Control-Allow-Origin", request_origin)
+        response.headers.add('Access-Control-Allow-Headers', "Content-Type,Authorization,X-Requested-With,X-Club-Id,X-Privacy-Token")
+        response.headers.add('Access-Control-Allow-Methods', "GET,OPTIONS")
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        return response
+
+def _parse_cursor(cursor, bus):
+    """'epoch:seq' 커서 해석 (다른 프로세스/재시작 전 커서이거나 형식이 틀리면 None)"""
+    if not cursor:
+        return None
+    epoch, _, seq = cursor.partition(':')
+    if epoch != bus.epoch:
+        return None
+    try:
+        seq = int(seq)
+    except ValueError:
+        return None
+    if seq < 0 or seq > bus.cursor:
+        return None
+    return seq
+
+# 알림 long-poll
+@events_bp.route('/poll', methods=['GET'])
+@jwt_required()
+def poll_events():
+    """알림 변경 사항 대기 (long-poll)
+
+    - cursor 가 없으면: 현재 카운터를 즉시 반환
+    - cursor 가 있으면: 이후 이벤트가 올 때까지 최대 EVENTS_POLL_TIMEOUT 초 대기 후
+      이벤트 목록과 다시 계산한 카운터 반환 (시간 초과 시 counters 는 null)
+    - cursor 가 다른 워커/재시작 전 프로세스의 것이면: 이 프로세스의 현재 커서부터 같은 방식으로 대기하고
+      counters 는 항상 반환 (즉시 반환하면 비고정 라우팅에서 클라이언트가 쉬지 않고 재요청하게 됨)
+    - 동시 대기 요청 수(EVENTS_MAX_WAITERS)가 가득 차면: 현재 카운터와 retry_after 를 즉시 반환
+      (클라이언트는 retry_after 초 후 다시 요청)
+    - 응답의 cursor 를 다음 요청에 그대로 전달
+    """
+    user = get_request_user()
+    if not user:
+        return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+
+    bus = get_event_bus()
+    club_id = get_current_club_id()
+    requested_cursor = request.args.get('cursor')
+    after = _parse_cursor(requested_cursor, bus)
+
+    if not requested_cursor:
+        cursor = bus.cursor
+        return jsonify({
+            'success': True,
+            'cursor': f'{bus.epoch}:{cursor}',
+            'counters': get_counters(user, club_id),
+            'events': []
+        })
+
+    # 다른 프로세스의 커서 → 이 프로세스 기준으로 다시 맞추고, 그 사이 놓친 변경은 응답 카운터로 보정
+    resync = after is None
+    if resync:
+        after = bus.cursor
+
+    topics = [user_topic(user.id)]
+    if user.role == 'super_admin':
+        topics.append(SUPER_ADMIN_TOPIC)
+    elif can_view_unread_inquiries(user, club_id):
+        topics.append(club_admins_topic(club_id))
+
+    # 대기하는 동안 DB 커넥션을 점유하지 않도록 세션 반납
+    db.session.close()
+
+    timeout = current_app.config.get('EVENTS_POLL_TIMEOUT', 25)
+    try:
+        cursor, events = bus.wait(topics, after, timeout)
+    except EventBusBusy:
+        # 대기 자리가 없으면 현재 카운터를 바로 반환 → 클라이언트는 Retry-After 간격의 짧은 폴링으로 전환
+        retry_after = current_app.config.get('EVENTS_BUSY_RETRY_AFTER', 15)
+        response = make_response(jsonify({
+            'success': True,
+            'cursor': f'{bus.epoch}:{bus.cursor}',
+            'counters': get_counters(user, club_id),
+            'events': [],
+            'retry_after': retry_after
+        }))
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+    return jsonify({
+        'success': True,
+        'cursor': f'{bus.epoch}:{cursor}',
+        'counters': get_counters(user, club_id) if events or resync else None,
+        'events': events
+    })
@@ -1,8 +1,18 @@
 from flask import Blueprint, request, jsonify, make_response
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from datetime import datetime
-from models import db, User, Inquiry, ClubMember, InquiryReplyComment, InquiryReplyCommentLike
-from utils.club_helpers import get_current_club_id, check_club_permission, require_club_membership
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+from models import db, User, Club, Inquiry, ClubMember, InquiryReplyComment, InquiryReplyCommentLike
+from utils.club_helpers import get_current_club_id, check_club_permission
+from utils.identity import get_current_user as get_request_user
+from utils.event_bus import (
+    publish_event, user_topic, club_admins_topic, SUPER_ADMIN_TOPIC,
+    EVENT_INQUIRIES, EVENT_INQUIRY_REPLIED, EVENT_MESSAGE
+)
+from utils.notification_counters import unread_inquiry_count, replied_inquiry_count, inquiry_counts
+from utils.visibility import inquiry_visibility_filter
+from utils.comment_threads import load_comment_likes, build_comment_tree
 
 # 문의하기 Blueprint
 inquiries_bp = Blueprint('inquiries', __name__, url_prefix='/api/inquiries')
@@ -22,67 +32,124 @@ def handle_preflight():
         return response
 
 def get_current_user():
-    """현재 로그인한 사용자 가져오기"""
-    user_id = get_jwt_identity()
-    if not user_id:
-        return None
-    return User.query.get(int(user_id))
+    """현재 로그인한 사용자 가져오기 (요청 내 1회 조회)"""
+    return get_request_user()
+
+def publish_inquiry_changed(club_id, author_id=None):
+    """답변 대기 문의 수 변경 알림 (운영진/슈퍼관리자 실시간 알림 채널, 커밋 후 호출)
+
+    author_id 지정 시 작성자에게도 답변 상태 변경 알림
+    """
+    topics = [SUPER_ADMIN_TOPIC]
+    if club_id:
+        topics.append(club_admins_topic(club_id))
+    publish_event(topics, EVENT_INQUIRIES)
+    if author_id:
+        publish_event([user_topic(author_id)], EVENT_INQUIRY_REPLIED)
+
+# 문의 목록 페이지 크기 (before_id 커서 기준)
+INQUIRY_PAGE_SIZE = 30
+INQUIRY_MAX_PAGE_SIZE = 100
 
 # 문의하기 목록 조회
 @inquiries_bp.route('', methods=['GET'])
 @jwt_required()
 def get_inquiries():
-    """문의하기 목록 조회
+    """문의하기 목록 조회 (최신 limit 개, before_id 지정 시 그 이전 문의)
     - 슈퍼관리자: 모든 문의 조회
     - 클럽 운영진: 자신의 클럽 문의 (비공개 포함) + 자신이 작성한 문의
     - 일반 회원: 자신이 작성한 문의 + 같은 클럽의 전체공개 문의
+    
+    목록에는 답변 댓글 대신 reply_comment_count 를 포함 (댓글은 상세 조회 시 로드)
     """
     try:
         user = get_current_user()
         if not user:
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
         
-        # 슈퍼관리자는 모든 문의 조회
-        if user.role == 'super_admin':
-            inquiries = Inquiry.query.order_by(Inquiry.created_at.desc()).all()
-        else:
-            club_id = get_current_club_id()
-            if not club_id:
-                return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-            
-            # 클럽 운영진 권한 확인 (user.role과 무관하게 ClubMember.role 확인)
-            has_permission, result = check_club_permission(user.id, club_id, 'admin')
-            if has_permission:
-                # 클럽 운영진: 자신이 작성한 문의 + 자신의 클럽 문의 (비공개 포함)
-                inquiries = Inquiry.query.filter(
-                    db.or_(
-                        Inquiry.user_id == user.id,
-                        Inquiry.club_id == club_id
-                    )
-                ).order_by(Inquiry.created_at.desc()).all()
-            else:
-                # 일반 회원: 자신이 작성한 문의 + 같은 클럽의 전체공개 문의
-                is_member, _ = require_club_membership(user.id, club_id)
-                if is_member:
-                    inquiries = Inquiry.query.filter(
-                        db.or_(
-                            Inquiry.user_id == user.id,
-                            db.and_(
-                                Inquiry.club_id == club_id,
-                                Inquiry.is_private == False
-                            )
-                        )
-                    ).order_by(Inquiry.created_at.desc()).all()
-                else:
-                    inquiries = Inquiry.query.filter_by(user_id=user.id).order_by(Inquiry.created_at.desc()).all()
+        # 슈퍼관리자는 모든 문의 조회, 그 외에는 선택한 클럽 기준 조회 범위 적용
+        club_id = get_current_club_id()
+        if user.role != 'super_admin' and not club_id:
+            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
+        
+        try:
+            limit = min(max(int(request.args.get('limit', INQUIRY_PAGE_SIZE)), 1), INQUIRY_MAX_PAGE_SIZE)
+            before_id = request.args.get('before_id', type=int)
+        except ValueError:
+            return jsonify({'success': False, 'message': '잘못된 limit 값입니다.'}), 400
+        
+        # 작성자 / 답변자 / 클럽 이름은 JOIN 으로 함께 조회
+        author = aliased(User)
+        replier = aliased(User)
+        query = db.session.query(
+            Inquiry, author.name, author.role, replier.name, Club.name
+        ).outerjoin(
+            author, Inquiry.user_id == author.id
+        ).outerjoin(
+            replier, Inquiry.replied_by == replier.id
+        ).outerjoin(
+            Club, Inquiry.club_id == Club.id
+        )
+        visibility = inquiry_visibility_filter(user, club_id)
+        if visibility is not None:
+            query = query.filter(visibility)
+        if before_id:
+            query = query.filter(Inquiry.id < before_id)
+        
+        # limit + 1 개를 조회해 다음 페이지 여부 확인
+        rows = query.order_by(Inquiry.id.desc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        # 답변 댓글 수 (GROUP BY 한 번)
+        comment_counts = {}
+        if rows:
+            comment_counts = dict(db.session.query(
+                InquiryReplyComment.inquiry_id, func.count(InquiryReplyComment.id)
+            ).filter(
+                InquiryReplyComment.inquiry_id.in_([inquiry.id for inquiry, *_ in rows])
+            ).group_by(InquiryReplyComment.inquiry_id).all())
+        
+        inquiries = [
+            inquiry.to_dict(preloaded={
+                'user_name': user_name,
+                'user_role': user_role,
+                'replier_name': replier_name,
+                'club_name': club_name,
+                'reply_comment_count': comment_counts.get(inquiry.id, 0),
+            })
+            for inquiry, user_name, user_role, replier_name, club_name in rows
+        ]
         
         return jsonify({
             'success': True,
-            'inquiries': [inquiry.to_dict() for inquiry in inquiries]
+            'inquiries': inquiries,
+            'has_more': has_more,
+            'next_before_id': rows[-1][0].id if has_more else None
         })
     except Exception as e:
         return jsonify({'success': False, 'message': f'문의 목록 조회 실패: {str(e)}'}), 500
 
+# 문의 알림 요약 (답변 대기 문의 수 + 답변 달린 내 문의 수)
+@inquiries_bp.route('/summary', methods=['GET'])
+@jwt_required()
+def get_inquiry_summary():
+    """답변 대기 문의 수 (운영진/슈퍼관리자) 와 답변이 달린 내 문의 수를 한 번에 조회"""
+    try:
+        user = get_current_user()
+        if not user:
+            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+        
+        unread_count, replied_count = inquiry_counts(user, get_current_club_id())
+        
+        return jsonify({
+            'success': True,
+            'unread_count': unread_count,
+            'replied_count': replied_count
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'문의 요약 조회 실패: {str(e)}'}), 500
+
 # 답변이 달린 문의 개수 조회 (작성자용)
 @inquiries_bp.route('/replied-count', methods=['GET'])
 @jwt_required()
@@ -94,10 +161,7 @@ def get_replied_inquiry_count():
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
         
         # 사용자가 작성한 문의 중 답변이 달린 문의 개수 조회
-        replied_count = Inquiry.query.filter(
-            Inquiry.user_id == user.id,
-            Inquiry.reply.isnot(None)
-        ).count()
+        replied_count = replied_inquiry_count(user.id)
         
         return jsonify({
             'success': True,
@@ -116,35 +180,9 @@ def get_unread_inquiry_count():
         if not user:
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
         
-        # 슈퍼관리자는 모든 답변 없는 문의 개수 조회
-        if user.role == 'super_admin':
-            unread_count = Inquiry.query.filter(
-                Inquiry.reply.is_(None)
-            ).count()
-        else:
-            club_id = get_current_club_id()
-            if not club_id:
-                # 클럽이 선택되지 않은 경우 0 반환 (400 에러 대신)
-                # 클럽 선택 직후 타이밍 이슈로 클럽 ID가 없을 수 있음
-                return jsonify({
-                    'success': True,
-                    'unread_count': 0
-                })
-            
-            # 클럽 운영진 권한 확인
-            has_permission, result = check_club_permission(user.id, club_id, 'admin')
-            if not has_permission:
-                # 운영진이 아닌 경우 0 반환
-                return jsonify({
-                    'success': True,
-                    'unread_count': 0
-                })
-            
-            # 해당 클럽의 답변 없는 문의 개수 조회
-            unread_count = Inquiry.query.filter(
-                Inquiry.club_id == club_id,
-                Inquiry.reply.is_(None)
-            ).count()
+        # 슈퍼관리자: 전체, 클럽 운영진: 해당 클럽의 답변 없는 문의 개수
+        # 클럽이 선택되지 않았거나 운영진이 아니면 0 (클럽 선택 직후 타이밍 이슈로 클럽 ID가 없을 수 있음)
+        unread_count = unread_inquiry_count(user, get_current_club_id())
         
         return jsonify({
             'success': True,
@@ -260,6 +298,7 @@ def create_inquiry():
         
         db.session.add(inquiry)
         db.session.commit()
+        publish_inquiry_changed(club_id)
         
         # 해당 클럽의 운영진과 슈퍼관리자에게 푸시 알림 전송
         try:
@@ -390,8 +429,12 @@ def delete_inquiry(inquiry_id):
             if inquiry.club_id != club_id:
                 return jsonify({'success': False, 'message': '다른 클럽의 문의는 삭제할 수 없습니다.'}), 403
         
+        inquiry_club_id = inquiry.club_id
+        was_unanswered = inquiry.reply is None
         db.session.delete(inquiry)
         db.session.commit()
+        if was_unanswered:
+            publish_inquiry_changed(inquiry_club_id)
         
         return jsonify({
             'success': True,
@@ -452,10 +495,12 @@ def reply_inquiry(inquiry_id):
         inquiry.updated_at = datetime.utcnow()
         
         db.session.commit()
+        publish_inquiry_changed(inquiry.club_id, author_id=inquiry.user_id)
         
         # 문의 작성자에게 자동 메시지 전송
         try:
             from models import Message
+            from utils.conversation_summary import record_message
             inquiry_author = User.query.get(inquiry.user_id)
             if inquiry_author and inquiry_author.id != user.id:  # 자기 자신에게는 메시지 보내지 않음
                 # 메시지 내용 생성 (문의 바로가기 링크 포함)
@@ -470,7 +515,13 @@ def reply_inquiry(inquiry_id):
                     is_read=False,
                 )
                 db.session.add(auto_message)
+                db.session.flush()
+                record_message(auto_message)
                 db.session.commit()
+                publish_event(
+                    [user_topic(inquiry_author.id)], EVENT_MESSAGE,
+                    message_id=auto_message.id, sender_id=user.id, sender_name=user.name
+                )
                 
                 # 메시지 전송 후 푸시 알림은 messages.py의 send_message 함수에서 처리됨
                 # 여기서는 직접 푸시 알림을 보내지 않고, 메시지 전송 로직을 재사용
@@ -624,6 +675,7 @@ def delete_inquiry_reply(inquiry_id):
         inquiry.updated_at = datetime.utcnow()
         
         db.session.commit()
+        publish_inquiry_changed(inquiry.club_id, author_id=inquiry.user_id)
         
         return jsonify({
             'success': True,
@@ -634,6 +686,36 @@ def delete_inquiry_reply(inquiry_id):
         db.session.rollback()
         return jsonify({'success': False, 'message': f'답변 삭제 실패: {str(e)}'}), 500
 
+def _reply_comment_tree(inquiry_id, user_id):
+    """문의 답변 댓글 트리 (댓글 + 작성자 이름 조회 한 번, 좋아요 수/여부 조회 한 번)
+    
+    Returns:
+        tuple: (최상위 댓글 dict 목록 (작성순), {comment_id: 댓글 dict})
+    """
+    rows = db.session.query(InquiryReplyComment, User.name).outerjoin(
+        User, InquiryReplyComment.user_id == User.id
+    ).filter(
+        InquiryReplyComment.inquiry_id == inquiry_id
+    ).order_by(InquiryReplyComment.created_at.asc(), InquiryReplyComment.id.asc()).all()
+    user_names = {comment.id: user_name for comment, user_name in rows}
+    like_counts, liked_ids = load_comment_likes(InquiryReplyCommentLike, list(user_names), user_id)
+    
+    comments_by_id = {}
+    
+    def serialize(comment, replies):
+        comment_dict = comment.to_dict(
+            user_id,
+            user_name=user_names[comment.id],
+            like_count=like_counts.get(comment.id, 0),
+            is_liked=comment.id in liked_ids,
+            replies=replies
+        )
+        comments_by_id[comment.id] = comment_dict
+        return comment_dict
+    
+    roots = build_comment_tree([comment for comment, _ in rows], serialize)
+    return roots, comments_by_id
+
 # 답변 댓글 목록 조회
 @inquiries_bp.route('/<int:inquiry_id>/reply/comments', methods=['GET'])
 @jwt_required()
@@ -655,15 +737,12 @@ def get_reply_comments(inquiry_id):
                 'comments': []
             })
         
-        # parent_id가 None인 댓글만 조회 (답글이 아닌 댓글만)
-        comments = InquiryReplyComment.query.filter_by(
-            inquiry_id=inquiry_id,
-            parent_id=None
-        ).order_by(InquiryReplyComment.created_at.asc()).all()
+        # 답글이 아닌 댓글 목록 (답글은 replies 로 포함)
+        comments, _ = _reply_comment_tree(inquiry_id, user.id)
         
         return jsonify({
             'success': True,
-            'comments': [comment.to_dict(user.id) for comment in comments]
+            'comments': comments
         })
     except Exception as e:
         return jsonify({'success': False, 'message': f'댓글 목록 조회 실패: {str(e)}'}), 500
@@ -846,35 +925,41 @@ def toggle_reply_comment_like(inquiry_id, comment_id):
         if comment.inquiry_id != inquiry_id:
             return jsonify({'success': False, 'message': '잘못된 댓글입니다.'}), 400
         
-        # 기존 좋아요 확인
-        existing_like = InquiryReplyCommentLike.query.filter_by(
+        # 기존 좋아요가 있으면 삭제 (삭제된 행 수로 취소/추가 판단)
+        user_id = user.id
+        removed = InquiryReplyCommentLike.query.filter_by(
             comment_id=comment_id,
-            user_id=user.id
-        ).first()
+            user_id=user_id
+        ).delete(synchronize_session=False)
         
-        if existing_like:
+        if removed:
             # 좋아요 취소
-            db.session.delete(existing_like)
             action = 'unliked'
         else:
             # 좋아요 추가
             new_like = InquiryReplyCommentLike(
                 comment_id=comment_id,
-                user_id=user.id
+                user_id=user_id
             )
             db.session.add(new_like)
             action = 'liked'
         
         db.session.commit()
         
-        # 업데이트된 댓글 정보 반환
-        comment = InquiryReplyComment.query.get(comment_id)
+        # 업데이트된 댓글 정보 반환 (이 댓글의 좋아요 수/여부만 조회, 답글은 댓글 목록 API 로 조회)
+        like_counts, liked_ids = load_comment_likes(InquiryReplyCommentLike, [comment_id], user_id)
+        comment_dict = comment.to_dict(
+            user_id,
+            like_count=like_counts.get(comment_id, 0),
+            is_liked=comment_id in liked_ids,
+            replies=[]
+        )
         
         return jsonify({
             'success': True,
             'action': action,
-            'like_count': len(comment.likes),
-            'comment': comment.to_dict(user.id)
+            'like_count': comment_dict['like_count'],
+            'comment': comment_dict
         })
     except Exception as e:
         db.session.rollback()
@@ -1,10 +1,11 @@
 from flask import Blueprint, request, jsonify, make_response, session
 from datetime import datetime, timedelta
-from models import db, Member, Score, User, AppSetting
+from models import db, Member, Score, AppSetting
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from werkzeug.security import check_password_hash
+from utils.password_hasher import verify_password, PasswordHasherBusy, password_hasher_busy_response
 from sqlalchemy import text
-from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission
+from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission, require_club_role
+from utils.identity import get_user, get_approved_membership
 
 # 회원 관리 Blueprint
 members_bp = Blueprint('members', __name__, url_prefix='/api/members')
@@ -36,7 +37,7 @@ def get_members():
         try:
             user_id = get_jwt_identity()
             if user_id:
-                current_user_obj = User.query.get(int(user_id))
+                current_user_obj = get_user(user_id)
         except Exception as e:
             pass
         
@@ -47,12 +48,7 @@ def get_members():
         is_club_admin = False
         club_id = get_current_club_id()
         if club_id and current_user_obj:
-            from models import ClubMember
-            membership = ClubMember.query.filter_by(
-                user_id=current_user_obj.id,
-                club_id=club_id,
-                status='approved'
-            ).first()
+            membership = get_approved_membership(current_user_obj.id, club_id)
             if membership and membership.role in ['admin', 'owner']:
                 is_club_admin = True
         
@@ -211,6 +207,7 @@ def get_members():
 
 @members_bp.route('/', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def add_member():
     """회원 등록 API"""
     try:
@@ -233,26 +230,7 @@ def add_member():
         if existing_member:
             return jsonify({'success': False, 'message': '이미 등록된 회원입니다.'})
         
-        # 운영진 여부 확인 (admin/super_admin만 설정 가능)
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            from utils.club_helpers import check_club_permission
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
-        
-        # 슈퍼관리자, 시스템 관리자, 또는 클럽별 운영진만 회원 추가 가능
+        # member_role 설정 (권한 확인은 require_club_role 에서 처리)
         member_role = data.get('member_role', 'regular')
         # member_role 유효성 검사
         if member_role not in ['club_leader', 'staff', 'regular']:
@@ -349,7 +327,7 @@ def update_member(member_id):
         user_id = get_jwt_identity()
         is_super_admin = False
         if user_id:
-            current_user = User.query.get(int(user_id))
+            current_user = get_user(user_id)
             is_super_admin = current_user and current_user.role == 'super_admin'
         
         if not is_super_admin and user_id:
@@ -367,7 +345,7 @@ def update_member(member_id):
             return jsonify({'success': False, 'message': '다른 클럽의 회원은 수정할 수 없습니다.'}), 403
         
         # 현재 사용자 확인
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         
         # 슈퍼관리자 또는 시스템 관리자인지 확인
         is_system_admin = current_user and current_user.role in ['super_admin', 'admin']
@@ -375,7 +353,6 @@ def update_member(member_id):
         # 클럽별 운영진인지 확인
         is_club_admin = False
         if not is_system_admin and user_id:
-            from utils.club_helpers import check_club_permission
             has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
             if has_permission:
                 is_club_admin = True
@@ -451,33 +428,12 @@ def update_member(member_id):
 @members_bp.route('/<int:member_id>/', methods=['DELETE'])
 @members_bp.route('/<int:member_id>', methods=['DELETE'])
 @jwt_required()
+@require_club_role('admin')
 def delete_member(member_id):
     """회원 삭제 API (Soft Delete)"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 현재 사용자 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
-        # 권한 확인 (admin/super_admin만 삭제 가능)
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        is_club_admin = False
-        
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         # 회원 조회
         member = Member.query.get_or_404(member_id)
@@ -549,7 +505,7 @@ def update_all_member_averages():
     try:
         # 현재 사용자 확인
         current_user_id = get_jwt_identity()
-        current_user = User.query.get(current_user_id)
+        current_user = get_user(current_user_id)
         
         if not current_user or current_user.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'})
@@ -679,7 +635,7 @@ def verify_privacy_access():
     """개인정보 보호 비밀번호 검증 API"""
     try:
         user_id = get_jwt_identity()
-        current_user_obj = User.query.get(int(user_id))
+        current_user_obj = get_user(user_id)
         
         if not current_user_obj:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'})
@@ -691,12 +647,7 @@ def verify_privacy_access():
         is_club_admin = False
         club_id = get_current_club_id()
         if club_id:
-            from models import ClubMember
-            membership = ClubMember.query.filter_by(
-                user_id=current_user_obj.id,
-                club_id=club_id,
-                status='approved'
-            ).first()
+            membership = get_approved_membership(current_user_obj.id, club_id)
             if membership and membership.role in ['admin', 'owner']:
                 is_club_admin = True
         
@@ -716,7 +667,7 @@ def verify_privacy_access():
         if not privacy_setting or not privacy_setting.setting_value:
             return jsonify({'success': False, 'message': '개인정보 보호 비밀번호가 설정되지 않았습니다.'})
         
-        if check_password_hash(privacy_setting.setting_value, password):
+        if verify_password(privacy_setting.setting_value, password):
             # 비밀번호가 맞으면 운영진은 자동으로 허용
             from flask_jwt_extended import create_access_token
             from datetime import timedelta
@@ -740,6 +691,8 @@ def verify_privacy_access():
         else:
             return jsonify({'success': False, 'message': '비밀번호가 올바르지 않습니다.'})
             
+    except PasswordHasherBusy as e:
+        return password_hasher_busy_response(e)
     except Exception as e:
         return jsonify({'success': False, 'message': f'비밀번호 검증 중 오류가 발생했습니다: {str(e)}'})
 
@@ -756,7 +709,7 @@ def check_privacy_status():
         user_id = get_jwt_identity()
         current_user_obj = None
         if user_id:
-            current_user_obj = User.query.get(int(user_id))
+            current_user_obj = get_user(user_id)
         
         # 기본적으로 마스킹된 상태
         privacy_unlocked = False
@@ -769,12 +722,7 @@ def check_privacy_status():
             is_club_admin = False
             club_id = get_current_club_id()
             if club_id:
-                from models import ClubMember
-                membership = ClubMember.query.filter_by(
-                    user_id=current_user_obj.id,
-                    club_id=club_id,
-                    status='approved'
-                ).first()
+                membership = get_approved_membership(current_user_obj.id, club_id)
                 if membership and membership.role in ['admin', 'owner']:
                     is_club_admin = True
             
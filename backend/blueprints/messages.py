@@ -1,8 +1,14 @@
 from flask import Blueprint, request, jsonify, make_response
+from collections import Counter
 from datetime import datetime
-from models import db, User, Message, ClubMember
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func, update
+from models import db, User, Message, ClubMember, ConversationSummary
+from flask_jwt_extended import jwt_required
 from utils.club_helpers import get_current_club_id, require_club_membership
+from utils.identity import get_current_user as get_request_user
+from utils.conversation_summary import record_message, decrement_unread_counts, refresh_conversation
+from utils.event_bus import publish_event, user_topic, EVENT_MESSAGE, EVENT_MESSAGES_READ
+from utils.notification_counters import unread_message_count
 
 
 messages_bp = Blueprint('messages', __name__, url_prefix='/api/messages')
@@ -30,10 +36,8 @@ def handle_preflight():
 
 
 def get_current_user():
-    user_id = get_jwt_identity()
-    if not user_id:
-        return None
-    return User.query.get(int(user_id))
+    """현재 로그인한 사용자 가져오기 (요청 내 1회 조회)"""
+    return get_request_user()
 
 
 @messages_bp.route('/unread-count', methods=['GET'])
@@ -44,12 +48,7 @@ def unread_count():
     if not user:
         return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
 
-    count = (
-        Message.query.filter_by(receiver_id=user.id, is_read=False)
-        .filter(Message.is_deleted == False)  # 삭제되지 않은 메시지만 카운트
-        .with_entities(Message.id)
-        .count()
-    )
+    count = unread_message_count(user.id)
     return jsonify({'success': True, 'count': count})
 
 
@@ -66,216 +65,69 @@ def get_conversations():
     if not user:
         return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
 
-    # 슈퍼관리자인지 확인
-    is_super_admin = user.role == 'super_admin'
-
-    # 일반 사용자: 가입한 모든 클럽의 회원과의 대화 조회
-    if not is_super_admin:
-        # 사용자가 가입한 모든 클럽 조회
-        user_memberships = ClubMember.query.filter_by(
-            user_id=user.id, status='approved'
-        ).all()
-        
-        if not user_memberships:
-            return jsonify({'success': True, 'conversations': []})
-
-        # 사용자가 가입한 모든 클럽 ID
-        user_club_ids = {m.club_id for m in user_memberships}
-
-        # 모든 클럽에 가입된 모든 사용자 (본인 제외, 슈퍼관리자 제외)
-        all_memberships = ClubMember.query.filter(
-            ClubMember.club_id.in_(user_club_ids),
-            ClubMember.status == 'approved',
-            ClubMember.user_id != user.id
-        ).all()
-        
-        member_user_ids = {m.user_id for m in all_memberships}
-
-        # 해당 사용자들 정보 미리 조회 (슈퍼관리자 제외)
-        users = User.query.filter(
-            User.id.in_(member_user_ids),
-            User.role != 'super_admin'  # 슈퍼관리자 제외
-        ).all()
-        member_user_ids = {u.id for u in users}  # 슈퍼관리자 제외된 ID만 사용
-        user_map = {u.id: u for u in users}
-
-        # 슈퍼관리자와의 대화도 별도로 조회
-        super_admin_users = User.query.filter(
-            User.role == 'super_admin',
-            User.id != user.id,
-            User.is_active == True
-        ).all()
-        super_admin_user_ids = {u.id for u in super_admin_users}
-        super_admin_user_map = {u.id: u for u in super_admin_users}
-
-        if not member_user_ids and not super_admin_user_ids:
-            return jsonify({'success': True, 'conversations': []})
-
-        # 내가 보낸/받은 모든 메시지 중, 같은 클럽 회원과의 메시지만 조회
-        messages = (
-            Message.query.filter(
-                ((Message.sender_id == user.id) | (Message.receiver_id == user.id))
-                & (
-                    (Message.sender_id.in_(member_user_ids))
-                    | (Message.receiver_id.in_(member_user_ids))
-                )
-            )
-            .filter(Message.is_deleted == False)  # 삭제되지 않은 메시지만 조회
-            .order_by(Message.created_at.desc())
-            .all()
-        )
-
-        conversations = {}
-
-        for msg in messages:
-            other_id = msg.receiver_id if msg.sender_id == user.id else msg.sender_id
-            if other_id not in member_user_ids:
-                continue
-
-            # 대화가 없으면 초기화
-            if other_id not in conversations:
-                other_user = user_map.get(other_id)
-                if not other_user:
-                    # user_map에 없으면 직접 조회 (메시지가 있는 사용자)
-                    other_user = User.query.get(other_id)
-                conversations[other_id] = {
-                    'user_id': other_id,
-                    'name': other_user.name if other_user else '알 수 없음',
-                    'email': other_user.email if other_user else '',
-                    'last_message': '',
-                    'last_time': None,
-                    'unread_count': 0,
-                    'user_role': other_user.role if other_user else 'user',
-                }
-
-            # 마지막 메시지 업데이트 (시간이 더 최신인 경우만)
-            msg_time = msg.created_at.strftime('%Y-%m-%d %H:%M:%S') if msg.created_at else None
-            current_last_time = conversations[other_id]['last_time']
-            
-            # 시간 비교: msg_time이 더 최신이거나 현재 last_time이 없으면 업데이트
-            if not current_last_time or (msg_time and msg_time > current_last_time):
-                conversations[other_id]['last_message'] = msg.content
-                conversations[other_id]['last_time'] = msg_time
-
-            # 내가 받은 메시지 중 읽지 않은 것만 카운트
-            if msg.receiver_id == user.id and not msg.is_read:
-                conversations[other_id]['unread_count'] += 1
-
-        # 슈퍼관리자와의 메시지 조회
-        if super_admin_user_ids:
-            super_admin_messages = (
-                Message.query.filter(
-                    ((Message.sender_id == user.id) | (Message.receiver_id == user.id))
-                    & (
-                        (Message.sender_id.in_(super_admin_user_ids))
-                        | (Message.receiver_id.in_(super_admin_user_ids))
-                    )
-                )
-                .filter(Message.is_deleted == False)
-                .order_by(Message.created_at.desc())
-                .all()
-            )
+    # 대화 요약 테이블에서 (user_id, last_time) 인덱스로 한 번에 조회
+    # 삭제되지 않은 메시지가 있는 대화만 포함 (대화를 한 번도 하지 않은 회원은 제외)
+    query = db.session.query(
+        ConversationSummary, User.name, User.email, User.role
+    ).join(
+        User, User.id == ConversationSummary.peer_id
+    ).filter(
+        ConversationSummary.user_id == user.id,
+        ConversationSummary.peer_id != user.id,
+        ConversationSummary.last_message_id.isnot(None)
+    )
 
-            for msg in super_admin_messages:
-                other_id = msg.receiver_id if msg.sender_id == user.id else msg.sender_id
-                if other_id not in super_admin_user_ids:
-                    continue
-
-                if other_id not in conversations:
-                    other_user = super_admin_user_map.get(other_id)
-                    conversations[other_id] = {
-                        'user_id': other_id,
-                        'name': other_user.name if other_user else '알 수 없음',
-                        'email': other_user.email if other_user else '',
-                        'last_message': '',
-                        'last_time': None,
-                        'unread_count': 0,
-                        'user_role': 'super_admin',  # 슈퍼관리자 표시
-                    }
-
-                msg_time = msg.created_at.strftime('%Y-%m-%d %H:%M:%S') if msg.created_at else None
-                current_last_time = conversations[other_id]['last_time']
-                
-                if not current_last_time or (msg_time and msg_time > current_last_time):
-                    conversations[other_id]['last_message'] = msg.content
-                    conversations[other_id]['last_time'] = msg_time
-
-                if msg.receiver_id == user.id and not msg.is_read:
-                    conversations[other_id]['unread_count'] += 1
-
-        # 메시지가 있는 사용자만 대화 목록에 포함 (대화를 한 번도 하지 않은 회원은 제외)
+    if user.role == 'super_admin':
+        # 슈퍼관리자: 모든 활성 사용자와의 대화
+        query = query.filter(User.is_active == True)
     else:
-        # 슈퍼관리자인 경우: 모든 활성 사용자와의 대화 조회
-        # 본인을 제외한 모든 활성 사용자
-        all_users = User.query.filter(
-            User.id != user.id, User.is_active == True
-        ).all()
-        member_user_ids = {u.id for u in all_users}
-        user_map = {u.id: u for u in all_users}
-
-        if not member_user_ids:
-            return jsonify({'success': True, 'conversations': []})
-
-        # 내가 보낸/받은 모든 메시지 조회
-        messages = (
-            Message.query.filter(
-                ((Message.sender_id == user.id) | (Message.receiver_id == user.id))
-                & (
-                    (Message.sender_id.in_(member_user_ids))
-                    | (Message.receiver_id.in_(member_user_ids))
-                )
+        # 일반 사용자: 가입한 클럽의 회원(슈퍼관리자 제외) + 활성 슈퍼관리자와의 대화
+        my_club_ids = db.session.query(ClubMember.club_id).filter(
+            ClubMember.user_id == user.id,
+            ClubMember.status == 'approved'
+        )
+        shares_club = db.session.query(ClubMember.id).filter(
+            ClubMember.user_id == User.id,
+            ClubMember.status == 'approved',
+            ClubMember.club_id.in_(my_club_ids)
+        ).exists()
+        query = query.filter(
+            my_club_ids.exists(),
+            db.or_(
+                db.and_(User.role == 'super_admin', User.is_active == True),
+                db.and_(User.role != 'super_admin', shares_club)
             )
-            .filter(Message.is_deleted == False)  # 삭제되지 않은 메시지만 조회
-            .order_by(Message.created_at.desc())
-            .all()
         )
 
-        conversations = {}
-
-        for msg in messages:
-            other_id = msg.receiver_id if msg.sender_id == user.id else msg.sender_id
-            if other_id not in member_user_ids:
-                continue
-
-            # 대화가 없으면 초기화
-            if other_id not in conversations:
-                other_user = user_map.get(other_id)
-                conversations[other_id] = {
-                    'user_id': other_id,
-                    'name': other_user.name if other_user else '알 수 없음',
-                    'email': other_user.email if other_user else '',
-                    'last_message': '',
-                    'last_time': None,
-                    'unread_count': 0,
-                }
-
-            # 마지막 메시지 업데이트 (시간이 더 최신인 경우만)
-            msg_time = msg.created_at.strftime('%Y-%m-%d %H:%M:%S') if msg.created_at else None
-            current_last_time = conversations[other_id]['last_time']
-            
-            # 시간 비교: msg_time이 더 최신이거나 현재 last_time이 없으면 업데이트
-            if not current_last_time or (msg_time and msg_time > current_last_time):
-                conversations[other_id]['last_message'] = msg.content
-                conversations[other_id]['last_time'] = msg_time
-
-            # 내가 받은 메시지 중 읽지 않은 것만 카운트
-            if msg.receiver_id == user.id and not msg.is_read:
-                conversations[other_id]['unread_count'] += 1
-
-        # 메시지가 있는 사용자만 대화 목록에 포함 (대화를 한 번도 하지 않은 사용자는 제외)
-
-    # 최신 순 정렬
-    conv_list = sorted(
-        conversations.values(), key=lambda c: c['last_time'] or '', reverse=True
-    )
+    rows = query.order_by(
+        ConversationSummary.last_time.desc(), ConversationSummary.last_message_id.desc()
+    ).all()
+
+    conv_list = [
+        {
+            'user_id': summary.peer_id,
+            'name': name,
+            'email': email or '',
+            'last_message': summary.last_message_preview or '',
+            'last_time': summary.last_time.strftime('%Y-%m-%d %H:%M:%S') if summary.last_time else None,
+            'unread_count': summary.unread_count or 0,
+            'user_role': role or 'user',
+        }
+        for summary, name, email, role in rows
+    ]
 
     return jsonify({'success': True, 'conversations': conv_list})
 
 
+# 대화 메시지 페이지 크기 (before_id 커서 기준)
+MESSAGE_PAGE_SIZE = 50
+MESSAGE_MAX_PAGE_SIZE = 200
+
+
 @messages_bp.route('/with/<int:other_user_id>', methods=['GET'])
 @jwt_required()
 def get_messages_with_user(other_user_id):
-    """특정 사용자와의 메시지 목록"""
+    """특정 사용자와의 메시지 목록 (최신 limit 개, before_id 지정 시 그 이전 메시지)"""
     user = get_current_user()
     if not user:
         return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
@@ -285,25 +137,38 @@ def get_messages_with_user(other_user_id):
     if not other_user:
         return jsonify({'success': False, 'message': '상대 사용자를 찾을 수 없습니다.'}), 404
 
-    messages = (
-        Message.query.filter(
-            ((Message.sender_id == user.id) & (Message.receiver_id == other_user_id))
-            | (
-                (Message.sender_id == other_user_id)
-                & (Message.receiver_id == user.id)
-            )
-        )
-        .filter(Message.is_deleted == False)  # 삭제되지 않은 메시지만 조회
-        .order_by(Message.created_at.asc())
-        .all()
+    try:
+        limit = min(max(int(request.args.get('limit', MESSAGE_PAGE_SIZE)), 1), MESSAGE_MAX_PAGE_SIZE)
+        before_id = request.args.get('before_id', type=int)
+    except ValueError:
+        return jsonify({'success': False, 'message': '잘못된 limit 값입니다.'}), 400
+
+    # (least, greatest, id) 인덱스를 타도록 두 사용자 ID를 정렬해 조건 구성
+    low_id, high_id = sorted((user.id, other_user_id))
+    query = Message.query.filter(
+        func.least(Message.sender_id, Message.receiver_id) == low_id,
+        func.greatest(Message.sender_id, Message.receiver_id) == high_id,
+        Message.is_deleted == False  # 삭제되지 않은 메시지만 조회
     )
+    if before_id:
+        query = query.filter(Message.id < before_id)
+
+    # 최신 순으로 limit + 1 개 조회 후 (더 이전 메시지 존재 여부 확인) 오래된 순으로 반환
+    messages = query.order_by(Message.id.desc()).limit(limit + 1).all()
+    has_more = len(messages) > limit
+    messages = messages[:limit]
+    messages.reverse()
 
-    data = [m.to_dict(current_user_id=user.id) for m in messages]
+    # 보낸 사람 / 받는 사람 이름은 응답당 한 번만 확인
+    user_names = {user.id: user.name, other_user.id: other_user.name}
+    data = [m.to_dict(current_user_id=user.id, user_names=user_names) for m in messages]
 
     return jsonify(
         {
             'success': True,
             'messages': data,
+            'has_more': has_more,
+            'next_before_id': messages[0].id if has_more else None,
             'other_user': {
                 'id': other_user.id,
                 'name': other_user.name,
@@ -338,7 +203,13 @@ def send_message(other_user_id):
         is_read=False,
     )
     db.session.add(message)
+    db.session.flush()
+    record_message(message)
     db.session.commit()
+    publish_event(
+        [user_topic(other_user.id)], EVENT_MESSAGE,
+        message_id=message.id, sender_id=user.id, sender_name=user.name
+    )
 
     # 수신자에게 푸시 알림 전송
     try:
@@ -365,19 +236,66 @@ def send_message(other_user_id):
 @messages_bp.route('/with/<int:other_user_id>/read', methods=['POST'])
 @jwt_required()
 def mark_as_read(other_user_id):
-    """상대방이 보낸 메시지를 모두 읽음 처리"""
+    """상대방이 보낸 메시지를 모두 읽음 처리 (안 읽은 메시지 수와 무관하게 UPDATE 2회)"""
     user = get_current_user()
     if not user:
         return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
 
-    updated = (
-        Message.query.filter_by(sender_id=other_user_id, receiver_id=user.id, is_read=False)
-        .filter(Message.is_deleted == False)
-        .update({'is_read': True})
+    user_id = user.id
+    read_ids = _mark_read(
+        Message.sender_id == other_user_id,
+        Message.receiver_id == user_id
     )
+    if read_ids:
+        decrement_unread_counts(user_id, {other_user_id: len(read_ids)})
     db.session.commit()
+    if read_ids:
+        # 같은 사용자의 다른 탭에도 안 읽은 수 변경 알림
+        publish_event([user_topic(user_id)], EVENT_MESSAGES_READ, peer_id=other_user_id)
+
+    return jsonify({'success': True, 'updated': len(read_ids)})
+
 
-    return jsonify({'success': True, 'updated': updated})
+@messages_bp.route('/read-all', methods=['POST'])
+@jwt_required()
+def mark_all_as_read():
+    """받은 메시지를 모든 대화에서 읽음 처리"""
+    user = get_current_user()
+    if not user:
+        return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+
+    user_id = user.id
+    rows = _mark_read(Message.receiver_id == user_id, returning=(Message.id, Message.sender_id))
+    read_counts = Counter(sender_id for _, sender_id in rows)
+    decrement_unread_counts(user_id, read_counts)
+    db.session.commit()
+    if rows:
+        publish_event([user_topic(user_id)], EVENT_MESSAGES_READ)
+
+    return jsonify({
+        'success': True,
+        'updated': len(rows),
+        'conversations': len(read_counts)
+    })
+
+
+def _mark_read(*conditions, returning=None):
+    """안 읽은 메시지를 한 번의 UPDATE ... RETURNING 으로 읽음 처리
+
+    Returns:
+        list: returning 미지정 시 읽음 처리한 메시지 id 목록, 지정 시 해당 컬럼 행 목록
+    """
+    stmt = (
+        update(Message)
+        .where(*conditions, Message.is_read == False, Message.is_deleted == False)
+        .values(is_read=True)
+        .returning(*(returning or (Message.id,)))
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.session.execute(stmt).all()
+    if returning:
+        return rows
+    return [row[0] for row in rows]
 
 
 @messages_bp.route('/<int:message_id>', methods=['DELETE'])
@@ -415,7 +333,10 @@ def delete_message(message_id):
 
     # 소프트 삭제
     message.is_deleted = True
+    db.session.flush()
+    refresh_conversation(message.sender_id, message.receiver_id)
     db.session.commit()
+    publish_event([user_topic(message.receiver_id)], EVENT_MESSAGES_READ, peer_id=user.id)
 
     return jsonify({'success': True, 'message': '메시지가 삭제되었습니다.'})
 
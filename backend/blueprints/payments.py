@@ -1,10 +1,11 @@
 from flask import Blueprint, request, jsonify, make_response
 from datetime import datetime, timedelta
-from models import db, Member, Payment, User, Point, AppSetting, FundLedger, FundState, FundBalanceSnapshot
+from models import db, Member, Payment, Point, AppSetting, FundLedger, FundState, FundBalanceSnapshot
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy.orm import joinedload
 from sqlalchemy import func
-from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission
+from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission, require_club_role
+from utils.identity import get_user
 import json
 
 # 납입 관리 Blueprint
@@ -62,7 +63,7 @@ def get_payments():
         
         # 현재 사용자 확인
         user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
+        current_user = get_user(user_id)
         
         # 슈퍼관리자는 가입 여부 확인 생략, 일반 사용자는 가입 확인 필요
         is_super_admin = current_user and current_user.role == 'super_admin'
@@ -118,26 +119,12 @@ def get_payments():
 
 @payments_bp.route('/', methods=['POST'])
 @jwt_required()
+@require_club_role('admin', system_roles=('super_admin',))
 def add_payment():
     """납입 내역 추가 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 현재 사용자 확인
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id))
-        
-        # 슈퍼관리자는 가입 여부 확인 생략, 일반 사용자는 가입 확인 필요
-        is_super_admin = current_user and current_user.role == 'super_admin'
-        
-        if not is_super_admin:
-            # 클럽 내 권한 확인 (admin 이상)
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if not has_permission:
-                return jsonify({'success': False, 'message': result}), 403
         
         data = request.get_json()
         
@@ -218,7 +205,7 @@ def add_payment():
                     amount=point_amount,  # 사용은 양수 저장, 계산 시 차감
                     reason=point_reason,
                     point_date=point_date,
-                    note=f'PAYMENT:{new_payment.id}'
+                    payment_id=new_payment.id
                 )
                 db.session.add(point)
                 db.session.commit()
@@ -238,34 +225,12 @@ def add_payment():
 
 @payments_bp.route('/<int:payment_id>', methods=['PUT'])
 @jwt_required()
+@require_club_role('admin')
 def update_payment(payment_id):
     """납입 내역 수정 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 현재 사용자 확인
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id))
-        
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
-        
-        # 슈퍼관리자, 시스템 관리자, 또는 클럽별 운영진만 접근 가능
         
         data = request.get_json()
         
@@ -328,7 +293,7 @@ def update_payment(payment_id):
         # 포인트 동기화
         try:
             # 연결된 포인트 내역 찾기
-            linked_point = Point.query.filter_by(note=f'PAYMENT:{payment.id}').first()
+            linked_point = Point.query.filter_by(payment_id=payment.id).first()
 
             should_have_point = (
                 payment.is_paid is True
@@ -352,7 +317,7 @@ def update_payment(payment_id):
                     amount=point_amount,
                     reason=point_reason,
                     point_date=point_date,
-                    note=f'PAYMENT:{payment.id}'
+                    payment_id=payment.id
                 )
                 db.session.add(new_point)
                 db.session.commit()
@@ -394,34 +359,12 @@ def update_payment(payment_id):
 
 @payments_bp.route('/<int:payment_id>', methods=['DELETE'])
 @jwt_required()
+@require_club_role('admin')
 def delete_payment(payment_id):
     """납입 내역 삭제 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 현재 사용자 확인
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id))
-        
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
-        
-        # 슈퍼관리자, 시스템 관리자, 또는 클럽별 운영진만 접근 가능
         
         payment = Payment.query.options(joinedload(Payment.member)).get_or_404(payment_id)
         
@@ -432,7 +375,7 @@ def delete_payment(payment_id):
         
         # 연결된 포인트 있으면 먼저 삭제
         try:
-            linked_point = Point.query.filter_by(note=f'PAYMENT:{payment.id}').first()
+            linked_point = Point.query.filter_by(payment_id=payment.id).first()
             if linked_point:
                 db.session.delete(linked_point)
         except Exception:
@@ -459,33 +402,12 @@ def delete_payment(payment_id):
 
 @payments_bp.route('/stats', methods=['GET'])
 @jwt_required(optional=True)
+@require_club_role('admin')
 def get_payment_stats():
     """납입 통계 조회 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 현재 사용자 확인
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
-        
-        # 슈퍼관리자, 시스템 관리자, 또는 클럽별 운영진만 접근 가능
         
         # 월별 통계
         monthly_stats = {}
@@ -561,13 +483,6 @@ def _calculate_fund_balance_and_chart(club_id):
             # fund_balance_cache는 더 이상 사용하지 않음
             return
 
-        # 포인트 데이터 조회
-        points = Point.query.filter_by(club_id=club_id).order_by(Point.point_date.asc(), Point.created_at.asc()).all()
-        
-        # 탈퇴되지 않은 회원 목록
-        active_members = Member.query.filter_by(club_id=club_id, is_deleted=False).all()
-        active_member_names = {member.name for member in active_members}
-
         # 장부 항목 월별 그룹화
         monthly_data = {}
         for item in ledger_items:
@@ -580,34 +495,8 @@ def _calculate_fund_balance_and_chart(club_id):
             elif item.entry_type == 'debit':
                 monthly_data[month_key]['debit'] += int(item.amount) or 0
 
-        # 포인트 데이터 월별 그룹화
-        monthly_point_data = {}
-        for point in points:
-            # member_id로 회원 이름 확인
-            member = Member.query.get(point.member_id) if point.member_id else None
-            if not member or member.name not in active_member_names:
-                continue
-            
-            point_date = point.point_date or point.created_at
-            if isinstance(point_date, str):
-                point_date = datetime.strptime(point_date, '%Y-%m-%d').date()
-            elif isinstance(point_date, datetime):
-                point_date = point_date.date()
-            
-            month_key = point_date.strftime('%Y-%m')
-            if month_key not in monthly_point_data:
-                monthly_point_data[month_key] = 0
-            # 프론트엔드와 동일하게 계산: API의 display_amount 로직 적용
-            # PAYMENT 링크 확인 (프론트엔드와 동일)
-            is_payment_linked = point.note and isinstance(point.note, str) and point.note.startswith('PAYMENT:')
-            display_point_type = '사용' if is_payment_linked else point.point_type
-            # display_amount 계산 (프론트엔드 API와 동일)
-            amount_value = int(point.amount) if point.amount is not None else 0
-            if display_point_type in ['적립', '보너스']:
-                display_amount = amount_value
-            else:
-                display_amount = -abs(amount_value)
-            monthly_point_data[month_key] += display_amount
+        # 포인트 데이터 월별 그룹화 (DB 집계)
+        monthly_point_data = get_monthly_point_totals(club_id)
 
         # 그래프 시작 월 계산
         all_data_months = sorted(set(list(monthly_data.keys()) + list(monthly_point_data.keys())))
@@ -655,49 +544,7 @@ def _calculate_fund_balance_and_chart(club_id):
             running_balance += net_change
 
             # 해당 달의 마지막 날짜까지의 포인트 누적 잔액 계산
-            year, month = map(int, month_key.split('-'))
-            from calendar import monthrange
-            last_day = monthrange(year, month)[1]
-            month_end_date = datetime(year, month, last_day, 23, 59, 59)
-
-            # 포인트 누적 계산
-            point_balance_for_month = 0
-            for point in points:
-                # member_id로 회원 이름 확인
-                member = Member.query.get(point.member_id) if point.member_id else None
-                if not member or member.name not in active_member_names:
-                    continue
-                
-                # 포인트 날짜 처리: point_date 우선, 없으면 created_at 사용
-                point_date = point.point_date or point.created_at
-                if point_date is None:
-                    continue
-                
-                # 날짜를 datetime 객체로 통일
-                from datetime import date as date_type
-                if isinstance(point_date, str):
-                    point_date = datetime.strptime(point_date, '%Y-%m-%d')
-                elif isinstance(point_date, date_type) and not isinstance(point_date, datetime):
-                    # date 객체를 datetime으로 변환
-                    point_date = datetime.combine(point_date, datetime.min.time())
-                elif isinstance(point_date, datetime):
-                    # datetime 객체는 그대로 사용
-                    pass
-                else:
-                    continue
-                
-                if point_date <= month_end_date:
-                    # 프론트엔드와 동일하게 계산: API의 display_amount 로직 적용
-                    # PAYMENT 링크 확인 (프론트엔드와 동일)
-                    is_payment_linked = point.note and isinstance(point.note, str) and point.note.startswith('PAYMENT:')
-                    display_point_type = '사용' if is_payment_linked else point.point_type
-                    # display_amount 계산 (프론트엔드 API와 동일)
-                    amount_value = int(point.amount) if point.amount is not None else 0
-                    if display_point_type in ['적립', '보너스']:
-                        display_amount = amount_value
-                    else:
-                        display_amount = -abs(amount_value)
-                    point_balance_for_month += display_amount
+            point_balance_for_month = cumulative_point_balance(monthly_point_data, month_key)
 
             labels.append(month_key)
             payment_balances.append(running_balance)
@@ -755,46 +602,14 @@ def _calculate_fund_balance_and_chart(club_id):
 
 # 내부 유틸: 현재 월 스냅샷 업데이트 (공통 유틸리티 사용)
 from utils.fund_snapshot import update_current_month_snapshot as _update_current_month_snapshot
+from utils.fund_snapshot import get_monthly_point_totals, cumulative_point_balance
+from utils.fund_ledger import upsert_payment_ledger_entry
 
 
 # 내부 유틸: 결제-장부 동기화
 def _sync_payment_to_ledger(payment: Payment):
-    """결제 레코드를 장부에 반영/삭제한다."""
-    # 결제 반영 조건: 납입완료 + 면제 아님 + 포인트 납부 아님
-    should_exist = (
-        bool(payment.is_paid)
-        and not bool(payment.is_exempt)
-        and not bool(payment.paid_with_points)  # 포인트 납부는 장부에 기록하지 않음
-    )
-    # 기존 장부
-    existing = FundLedger.query.filter_by(payment_id=payment.id).all()
-
-    if not should_exist:
-        # 존재하면 삭제
-        if existing:
-            for row in existing:
-                db.session.delete(row)
-            db.session.commit()
-        return
-
-    # 있어야 하는 경우 → 1개 기준으로 정규화
-    if existing:
-        entry = existing[0]
-        # 중복 항목이 있으면 첫 번째만 남기고 나머지는 삭제
-        if len(existing) > 1:
-            for row in existing[1:]:
-                db.session.delete(row)
-    else:
-        entry = FundLedger(payment_id=payment.id, club_id=payment.club_id)
-        db.session.add(entry)
-
-    entry.club_id = payment.club_id
-    entry.event_date = payment.payment_date
-    entry.month = payment.month or payment.payment_date.strftime('%Y-%m')
-    entry.amount = abs(int(payment.amount))
-    entry.source = payment.payment_type  # 'monthly' or 'game'
-    entry.entry_type = 'credit' if payment.payment_type in ('monthly', 'game') else 'debit'
-    entry.note = payment.note
+    """결제 레코드를 장부에 반영/삭제한다. (payment_id 기준 upsert)"""
+    upsert_payment_ledger_entry(payment)
     db.session.commit()
     
     # 잔액 캐시 재계산
@@ -818,7 +633,7 @@ def fund_ledger_endpoint():
                 return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
             
             user_id = get_jwt_identity()
-            current_user = User.query.get(int(user_id)) if user_id else None
+            current_user = get_user(user_id)
             if not current_user:
                 return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
             
@@ -892,7 +707,7 @@ def fund_ledger_endpoint():
             return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
         
         user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
         
@@ -962,32 +777,12 @@ def fund_ledger_endpoint():
 
 @payments_bp.route('/fund/ledger/<int:ledger_id>', methods=['PUT', 'DELETE'])
 @jwt_required()
+@require_club_role('admin')
 def manage_fund_ledger_item(ledger_id):
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
         
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
-        
-        # 슈퍼관리자, 시스템 관리자, 또는 클럽별 운영진만 접근 가능
-
         entry = FundLedger.query.get_or_404(ledger_id)
         
         # 수정/삭제하려는 장부 항목이 현재 클럽에 속하는지 확인
@@ -1096,7 +891,7 @@ def payment_balance():
 
         # PUT - 관리자만
         user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
         
@@ -1173,33 +968,34 @@ def payment_balance():
         return jsonify({'success': False, 'message': f'잔액 설정 처리 중 오류: {str(e)}'})
 
 
+def _fund_snapshot_etag(club_id, snapshot_count, last_updated_at):
+    """클럽 스냅샷 버전 식별자 (스냅샷 행 수 + 최종 수정 시각)"""
+    stamp = last_updated_at.strftime('%Y%m%d%H%M%S%f') if last_updated_at else '0'
+    return f'fund-{club_id}-{snapshot_count}-{stamp}'
+
+
 @payments_bp.route('/fund/balance-cache', methods=['GET'])
 @jwt_required(optional=True)
+@require_club_role('admin')
 def get_fund_balance_cache():
     """회비 잔액 및 그래프 데이터 조회 API (fund_balance_snapshot에서 조회)"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        user_id = get_jwt_identity()
-        current_user = User.query.get(int(user_id)) if user_id else None
-        if not current_user:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'})
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
+        # 스냅샷 버전 확인 (행 수 + 최종 수정 시각) → ETag
+        # 변경이 없으면 스냅샷 행을 읽지 않고 304 반환
+        snapshot_count, last_updated_at = db.session.query(
+            func.count(FundBalanceSnapshot.id),
+            func.max(FundBalanceSnapshot.updated_at)
+        ).filter(FundBalanceSnapshot.club_id == club_id).one()
+        etag = _fund_snapshot_etag(club_id, snapshot_count, last_updated_at)
+        if snapshot_count and request.if_none_match.contains_weak(etag):
+            response = make_response('', 304)
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+
         # 스냅샷에서 데이터 조회 (장부/포인트 변경 시 이미 업데이트됨)
         snapshots = FundBalanceSnapshot.query.filter_by(club_id=club_id).order_by(FundBalanceSnapshot.month.asc()).all()
         
@@ -1218,6 +1014,7 @@ def get_fund_balance_cache():
         debits = []
         point_balances = []
         current_balance = 0
+        current_point_balance = 0
         
         for snapshot in snapshots:
             labels.append(snapshot.month)
@@ -1226,22 +1023,28 @@ def get_fund_balance_cache():
             debits.append(snapshot.debit)
             point_balances.append(snapshot.point_balance)
             current_balance = snapshot.fund_balance  # 마지막 월의 잔액이 현재 잔액
+            current_point_balance = snapshot.point_balance  # 마지막 월의 포인트 잔액이 현재 포인트 잔액
         
         balance_series = {
             'labels': labels,
-            'data': payment_balances,
             'paymentBalances': payment_balances,
             'credits': credits,
             'debits': debits,
             'pointBalances': point_balances
         }
         
-        return jsonify({
+        last_calculated_at = max((s.updated_at for s in snapshots if s.updated_at), default=None)
+        response = jsonify({
             'success': True,
             'current_balance': current_balance,
+            'current_point_balance': current_point_balance,
             'balance_series': balance_series,
-            'last_calculated_at': snapshots[-1].updated_at.isoformat() if snapshots else None
+            'last_calculated_at': last_calculated_at.isoformat() if last_calculated_at else None
         })
+        if snapshots:
+            response.set_etag(_fund_snapshot_etag(club_id, len(snapshots), last_calculated_at), weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+        return response
     except Exception as e:
         return jsonify({'success': False, 'message': f'잔액 조회 중 오류가 발생했습니다: {str(e)}'})
 
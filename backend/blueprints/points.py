@@ -2,7 +2,7 @@ from flask import Blueprint, request, jsonify, make_response
 from datetime import datetime
 from models import db, Member, Point, Club
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.club_helpers import get_current_club_id, require_club_membership
+from utils.club_helpers import get_current_club_id, require_club_membership, require_club_role
 from utils.fund_snapshot import update_current_month_snapshot
 
 # 포인트 관리 Blueprint
@@ -73,12 +73,12 @@ def get_points():
             
             # 표시용 금액/유형 보정
             display_note = point.note
-            is_payment_linked = isinstance(display_note, str) and display_note.startswith('PAYMENT:')
-            # PAYMENT 연동 포인트는 유형을 강제로 '사용'으로 표기
+            is_payment_linked = point.payment_id is not None
+            # 납입 연동 포인트는 유형을 강제로 '사용'으로 표기
             display_point_type = '사용' if is_payment_linked else point.point_type
             # 사용은 음수로 반환하여 UI에 -값이 보이도록 처리
             display_amount = point.amount if display_point_type in ['적립', '보너스'] else -abs(point.amount)
-            # PAYMENT 링크 메모는 응답에서 숨김 처리
+            # 납입 연동 포인트의 메모는 응답에서 숨김 처리
             if is_payment_linked:
                 display_note = ''
 
@@ -92,6 +92,7 @@ def get_points():
                 'note': display_note,
                 'point_date': point.point_date.strftime('%Y-%m-%d') if point.point_date else None,
                 'created_at': point.created_at.strftime('%Y-%m-%d') if point.created_at else None,
+                'payment_id': point.payment_id,
                 'balance': member_balances[member_name]  # 잔여 포인트 추가
             })
         
@@ -107,36 +108,12 @@ def get_points():
 
 @points_bp.route('/', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def add_point():
     """포인트 등록 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        from models import User
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            from utils.club_helpers import check_club_permission
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         # 클럽의 포인트 시스템 활성화 여부 확인
         club = Club.query.get_or_404(club_id)
@@ -211,36 +188,12 @@ def add_point():
 @points_bp.route('/<int:point_id>/', methods=['DELETE'])
 @points_bp.route('/<int:point_id>', methods=['DELETE'])
 @jwt_required()
+@require_club_role('admin')
 def delete_point(point_id):
     """포인트 삭제 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        from models import User
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            from utils.club_helpers import check_club_permission
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         # 클럽별 포인트 조회
         point = Point.query.filter_by(id=point_id, club_id=club_id).first_or_404()
@@ -267,36 +220,12 @@ def delete_point(point_id):
 
 @points_bp.route('/batch', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def add_points_batch():
     """여러 명의 포인트 일괄 등록 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        from models import User
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            from utils.club_helpers import check_club_permission
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         # 클럽의 포인트 시스템 활성화 여부 확인
         club = Club.query.get_or_404(club_id)
@@ -393,36 +322,12 @@ def add_points_batch():
 @points_bp.route('/<int:point_id>/', methods=['PUT'])
 @points_bp.route('/<int:point_id>', methods=['PUT'])
 @jwt_required()
+@require_club_role('admin')
 def update_point(point_id):
     """포인트 수정 API"""
     try:
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        from models import User
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            from utils.club_helpers import check_club_permission
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         # 클럽의 포인트 시스템 활성화 여부 확인
         club = Club.query.get_or_404(club_id)
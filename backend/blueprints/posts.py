@@ -2,11 +2,15 @@ from flask import Blueprint, request, jsonify, make_response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
 from models import db, User, Post, PostImage, Comment, CommentLike, Like
-from sqlalchemy import case
+from sqlalchemy import case, update
+from sqlalchemy.orm import joinedload, selectinload
 import os
 import uuid
 from werkzeug.utils import secure_filename
 from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission
+from utils.identity import get_user
+from utils.global_posts import club_feed_page, invalidate_global_posts
+from utils.comment_threads import load_liked_comment_ids, build_comment_tree
 
 # 게시판 Blueprint
 posts_bp = Blueprint('posts', __name__, url_prefix='/api/posts')
@@ -18,6 +22,22 @@ UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'upload
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def _bump_counter(column, row_id, delta):
+    """카운터 컬럼 원자적 증감 (UPDATE ... SET x = x + delta RETURNING x)
+
+    Returns:
+        int: 갱신된 값 (행이 없으면 None)
+    """
+    model = column.class_
+    stmt = (
+        update(model)
+        .where(model.id == row_id)
+        .values({column: column + delta})
+        .returning(column)
+        .execution_options(synchronize_session=False)
+    )
+    return db.session.execute(stmt).scalar()
+
 @posts_bp.before_request
 def handle_preflight():
     if request.method == "OPTIONS":
@@ -47,7 +67,7 @@ def get_posts():
         
         # 사용자 정보 확인
         try:
-            current_user = User.query.get(int(user_id))
+            current_user = get_user(user_id)
             if not current_user:
                 return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
             
@@ -67,37 +87,50 @@ def get_posts():
                 return jsonify({'success': False, 'message': result}), 403
         
         post_type = request.args.get('type', 'all')  # 'all', 'free', 'notice'
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
+        page = max(int(request.args.get('page', 1)), 1)
+        per_page = max(int(request.args.get('per_page', 20)), 1)
+        
+        # 작성자/클럽은 JOIN, 이미지는 페이지 단위 IN 조회로 한 번에 로드
+        load_options = (
+            joinedload(Post.author),
+            joinedload(Post.club),
+            selectinload(Post.images)
+        )
         
-        # 슈퍼관리자는 모든 게시글 조회, 일반 사용자는 클럽별 게시글 조회
-        if is_super_admin:
-            # 슈퍼관리자: 모든 게시글 조회
-            query = Post.query
-        else:
-            # 일반 사용자: 클럽별 게시글 + 전체 게시글 조회 (club_id가 null인 게시글은 모든 클럽이 볼 수 있음)
-            query = Post.query.filter(
-                (Post.club_id == club_id) | (Post.club_id.is_(None))
-            )
-        
-        if post_type != 'all':
-            query = query.filter_by(post_type=post_type)
-            # 특정 타입만 조회하는 경우는 최신순 정렬
-            query = query.order_by(Post.created_at.desc())
+        if not is_super_admin:
+            # 일반 사용자: 클럽별 게시글 + 전체 게시글 (club_id가 null인 게시글은 모든 클럽이 볼 수 있음)
+            # 전체 게시글은 캐시된 목록과 club_id 인덱스 페이지를 메모리에서 병합
+            post_ids, total = club_feed_page(club_id, post_type, page, per_page)
+            posts_by_id = {
+                post.id: post
+                for post in Post.query.options(*load_options).filter(Post.id.in_(post_ids)).all()
+            } if post_ids else {}
+            posts = [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id]
+            pages = (total + per_page - 1) // per_page
         else:
-            # 전체 조회 시: 공지사항을 먼저, 그 다음 일반 게시글
-            # 각 그룹 내에서는 최신순 정렬
-            query = query.order_by(
-                case(
-                    (Post.post_type == 'notice', 0),
-                    else_=1
-                ),
-                Post.created_at.desc()
-            )
-        
-        # 페이지네이션
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-        posts = pagination.items
+            # 슈퍼관리자는 모든 게시글 조회
+            query = Post.query
+            if post_type != 'all':
+                query = query.filter_by(post_type=post_type)
+                # 특정 타입만 조회하는 경우는 최신순 정렬
+                query = query.order_by(Post.created_at.desc(), Post.id.desc())
+            else:
+                # 전체 조회 시: 공지사항을 먼저, 그 다음 일반 게시글
+                # 각 그룹 내에서는 최신순 정렬
+                query = query.order_by(
+                    case(
+                        (Post.post_type == 'notice', 0),
+                        else_=1
+                    ),
+                    Post.created_at.desc(),
+                    Post.id.desc()
+                )
+            
+            # 페이지네이션
+            pagination = query.options(*load_options).paginate(page=page, per_page=per_page, error_out=False)
+            posts = pagination.items
+            total = pagination.total
+            pages = pagination.pages
         
         return jsonify({
             'success': True,
@@ -105,8 +138,8 @@ def get_posts():
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages
+                'total': total,
+                'pages': pages
             }
         })
     except Exception as e:
@@ -133,7 +166,7 @@ def get_post(post_id):
         # 슈퍼관리자는 가입 여부 확인 생략, 일반 사용자는 가입 확인 필요
         is_super_admin = False
         if user_id:
-            current_user = User.query.get(int(user_id))
+            current_user = get_user(user_id)
             is_super_admin = current_user and current_user.role == 'super_admin'
         
         # 전체 게시글이 아닌 경우에만 클럽 가입 확인 (슈퍼관리자 제외)
@@ -223,6 +256,8 @@ def create_post():
                 db.session.add(post_image)
         
         db.session.commit()
+        if is_global:
+            invalidate_global_posts()
         
         return jsonify({
             'success': True,
@@ -272,6 +307,7 @@ def update_post(post_id):
             return jsonify({'success': False, 'message': '제목과 내용을 입력해주세요.'}), 400
         
         # 게시글 수정
+        was_global = post.club_id is None
         post.title = title
         post.content = content
         post.club_id = None if is_global else club_id
@@ -290,6 +326,8 @@ def update_post(post_id):
                 db.session.add(post_image)
         
         db.session.commit()
+        if was_global or is_global:
+            invalidate_global_posts()
         
         return jsonify({
             'success': True,
@@ -324,8 +362,11 @@ def delete_post(post_id):
         if post.author_id != user_id and user.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '게시글을 삭제할 권한이 없습니다.'}), 403
         
+        was_global = post.club_id is None
         db.session.delete(post)
         db.session.commit()
+        if was_global:
+            invalidate_global_posts()
         
         return jsonify({
             'success': True,
@@ -343,37 +384,26 @@ def get_comments(post_id):
     try:
         user_id = int(get_jwt_identity())
         
-        # 부모 댓글만 조회 (대댓글 제외)
-        parent_comments = Comment.query.filter_by(post_id=post_id, parent_id=None).all()
-        
-        # 업 수 기준으로 정렬 (업 수가 같으면 최신순)
-        comments_with_likes = []
-        for comment in parent_comments:
-            like_count = len(comment.likes)
-            comments_with_likes.append((comment, like_count))
-        
-        # 업 수 내림차순, 같으면 최신순
-        comments_with_likes.sort(key=lambda x: (-x[1], x[0].created_at))
-        sorted_comments = [c[0] for c in comments_with_likes]
-        
-        # 각 댓글의 좋아요 여부 확인
-        comments_data = []
-        for comment in sorted_comments:
-            comment_dict = comment.to_dict()
-            # 현재 사용자가 좋아요를 눌렀는지 확인
-            is_liked = CommentLike.query.filter_by(comment_id=comment.id, user_id=user_id).first() is not None
-            comment_dict['is_liked'] = is_liked
-            # 좋아요 수도 다시 계산 (to_dict에서 계산된 값 사용)
-            comment_like_count = CommentLike.query.filter_by(comment_id=comment.id).count()
-            comment_dict['like_count'] = comment_like_count
-            # 대댓글도 좋아요 여부 및 좋아요 수 확인
-            for reply in comment_dict.get('replies', []):
-                reply_is_liked = CommentLike.query.filter_by(comment_id=reply['id'], user_id=user_id).first() is not None
-                reply['is_liked'] = reply_is_liked
-                # 대댓글의 좋아요 수도 다시 계산 (to_dict에서 계산된 값 사용)
-                reply_like_count = CommentLike.query.filter_by(comment_id=reply['id']).count()
-                reply['like_count'] = reply_like_count
-            comments_data.append(comment_dict)
+        # 1) 게시글의 댓글 전체 (대댓글 포함) + 작성자 이름
+        rows = db.session.query(Comment, User.name).outerjoin(
+            User, Comment.author_id == User.id
+        ).filter(Comment.post_id == post_id).order_by(Comment.created_at, Comment.id).all()
+        author_names = {comment.id: author_name for comment, author_name in rows}
+        
+        # 2) 현재 사용자가 업을 누른 댓글 (업 수는 comments.like_count 컬럼 사용)
+        liked_ids = load_liked_comment_ids(CommentLike, list(author_names), user_id)
+        
+        # 메모리에서 트리 구성 (대댓글은 작성순)
+        def serialize(comment, replies):
+            comment_dict = comment.to_dict(author_name=author_names[comment.id], replies=replies)
+            comment_dict['is_liked'] = comment.id in liked_ids
+            return comment_dict
+        
+        # 부모 댓글은 업 수 내림차순, 같으면 작성순
+        comments_data = sorted(
+            build_comment_tree([comment for comment, _ in rows], serialize),
+            key=lambda c: -c['like_count']
+        )
         
         return jsonify({
             'success': True,
@@ -411,6 +441,7 @@ def create_comment(post_id):
             content=content
         )
         db.session.add(comment)
+        _bump_counter(Post.comment_count, post_id, 1)
         db.session.commit()
         
         return jsonify({
@@ -468,7 +499,9 @@ def delete_comment(comment_id):
         if comment.author_id != user_id and user.role not in ['admin', 'super_admin']:
             return jsonify({'success': False, 'message': '댓글을 삭제할 권한이 없습니다.'}), 403
         
+        post_id = comment.post_id
         db.session.delete(comment)
+        _bump_counter(Post.comment_count, post_id, -1)
         db.session.commit()
         
         return jsonify({
@@ -488,12 +521,11 @@ def toggle_like(post_id):
         user_id = int(get_jwt_identity())
         post = Post.query.get_or_404(post_id)
         
-        # 기존 좋아요 확인
-        existing_like = Like.query.filter_by(post_id=post_id, user_id=user_id).first()
+        # 기존 좋아요가 있으면 삭제 (삭제된 행 수로 취소/추가 판단)
+        removed = Like.query.filter_by(post_id=post_id, user_id=user_id).delete(synchronize_session=False)
         
-        if existing_like:
+        if removed:
             # 좋아요 취소
-            db.session.delete(existing_like)
             action = 'unliked'
         else:
             # 좋아요 추가
@@ -501,10 +533,9 @@ def toggle_like(post_id):
             db.session.add(like)
             action = 'liked'
         
-        db.session.commit()
-        
         # 업데이트된 좋아요 수 반환
-        like_count = Like.query.filter_by(post_id=post_id).count()
+        like_count = _bump_counter(Post.like_count, post_id, -1 if removed else 1)
+        db.session.commit()
         
         return jsonify({
             'success': True,
@@ -525,12 +556,11 @@ def toggle_comment_like(comment_id):
         user_id = int(get_jwt_identity())
         comment = Comment.query.get_or_404(comment_id)
         
-        # 기존 좋아요 확인
-        existing_like = CommentLike.query.filter_by(comment_id=comment_id, user_id=user_id).first()
+        # 기존 좋아요가 있으면 삭제 (삭제된 행 수로 취소/추가 판단)
+        removed = CommentLike.query.filter_by(comment_id=comment_id, user_id=user_id).delete(synchronize_session=False)
         
-        if existing_like:
+        if removed:
             # 좋아요 취소
-            db.session.delete(existing_like)
             action = 'unliked'
         else:
             # 좋아요 추가
@@ -538,10 +568,9 @@ def toggle_comment_like(comment_id):
             db.session.add(like)
             action = 'liked'
         
-        db.session.commit()
-        
         # 업데이트된 좋아요 수 반환
-        like_count = CommentLike.query.filter_by(comment_id=comment_id).count()
+        like_count = _bump_counter(Comment.like_count, comment_id, -1 if removed else 1)
+        db.session.commit()
         
         return jsonify({
             'success': True,
@@ -1,8 +1,15 @@
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, request, jsonify, make_response, current_app
 from datetime import datetime, timedelta
-from models import db, Schedule, ScheduleAttendance, Member, User
+from models import db, Schedule, ScheduleAttendance, ScheduleRecurrence, Member
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.club_helpers import get_current_club_id, require_club_membership, check_club_permission
+from utils.identity import get_user
+from utils.schedule_attendance import (
+    serialize_schedules, lock_schedule_capacity, promote_waitlist, reserve_seat, release_seat,
+    waitlist_position, ATTENDANCE_NOT_FOUND
+)
+from utils.recurrence import RECURRENCE_WEEK_TYPES, materialize_recurrences, horizon_end
+from utils.attendance_analytics import get_club_matrix, record_attendance, invalidate_club_matrix
 
 # 일정 관리 Blueprint
 schedules_bp = Blueprint('schedules', __name__, url_prefix='/api/schedules')
@@ -48,9 +55,10 @@ def get_schedules():
         
         schedules = query.order_by(Schedule.date.asc(), Schedule.time.asc()).all()
         
+        # 참석자/이름/참석 인원은 일정 수와 관계없이 일괄 조회
         return jsonify({
             'success': True,
-            'schedules': [s.to_dict(include_attendances=True) for s in schedules]
+            'schedules': serialize_schedules(schedules)
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -74,7 +82,7 @@ def get_schedule(schedule_id):
         
         return jsonify({
             'success': True,
-            'schedule': schedule.to_dict(include_attendances=True)
+            'schedule': serialize_schedules([schedule])[0]
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -128,6 +136,7 @@ def create_schedule():
         
         db.session.add(schedule)
         db.session.commit()
+        invalidate_club_matrix(club_id)
         
         return jsonify({
             'success': True,
@@ -161,7 +170,7 @@ def update_schedule(schedule_id):
         data = request.get_json()
         
         # 권한 확인 (운영진 또는 작성자만 수정 가능)
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         is_admin = current_user and (current_user.role in ['super_admin', 'admin'] or check_club_permission(int(user_id), club_id))
         is_creator = schedule.created_by == int(user_id)
         
@@ -176,6 +185,8 @@ def update_schedule(schedule_id):
         if 'time' in data:
             schedule.time = datetime.strptime(data['time'], '%H:%M').time()
         if 'max_participants' in data:
+            # 정원 변경은 참석 신청과 같은 잠금으로 직렬화하고, 늘어난 자리는 대기자 승격
+            lock_schedule_capacity(schedule.id)
             schedule.max_participants = data['max_participants']
         if 'description' in data:
             schedule.description = data['description']
@@ -184,11 +195,15 @@ def update_schedule(schedule_id):
         if 'recurring_config' in data:
             schedule.recurring_config = data['recurring_config']
         
+        if 'max_participants' in data:
+            db.session.flush()
+            promote_waitlist(schedule.id, schedule.max_participants)
         db.session.commit()
+        invalidate_club_matrix(club_id)
         
         return jsonify({
             'success': True,
-            'schedule': schedule.to_dict(include_attendances=True)
+            'schedule': serialize_schedules([schedule])[0]
         })
     except Exception as e:
         db.session.rollback()
@@ -216,7 +231,7 @@ def delete_schedule(schedule_id):
             return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
         
         # 권한 확인 (운영진 또는 작성자만 삭제 가능)
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         is_admin = current_user and (current_user.role in ['super_admin', 'admin'] or check_club_permission(int(user_id), club_id))
         is_creator = schedule.created_by == int(user_id)
         
@@ -225,6 +240,7 @@ def delete_schedule(schedule_id):
         
         db.session.delete(schedule)
         db.session.commit()
+        invalidate_club_matrix(club_id)
         
         return jsonify({'success': True, 'message': '일정이 삭제되었습니다.'})
     except Exception as e:
@@ -239,6 +255,7 @@ def attend_schedule(schedule_id):
     - member_id가 넘어오면 그대로 사용
     - 없거나 매칭 실패 시, 로그인한 User의 이메일/이름으로 Member를 찾고,
       그래도 없으면 해당 클럽에 Member를 자동 생성한 뒤 참석 처리
+    - 정원이 차 있으면 대기 명단에 등록 (참석 취소 시 등록 순서대로 자동 승격)
     """
     try:
         user_id = get_jwt_identity()
@@ -261,7 +278,7 @@ def attend_schedule(schedule_id):
             return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
         
         # 로그인한 유저 정보 가져오기
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '사용자 정보를 찾을 수 없습니다.'}), 404
         
@@ -320,48 +337,26 @@ def attend_schedule(schedule_id):
         if schedule.date == today and schedule.time < current_time:
             return jsonify({'success': False, 'message': '이미 지난 시간입니다.'}), 400
         
-        # 중복 참석 확인
-        existing = ScheduleAttendance.query.filter(
-            ScheduleAttendance.schedule_id == schedule_id,
-            ScheduleAttendance.member_id == member_id
-        ).first()
-        
-        if existing:
-            if existing.status == 'attending':
-                return jsonify({'success': False, 'message': '이미 참석 신청되어 있습니다.'}), 400
-            # 거부된 경우 다시 참석 가능
-            existing.status = 'attending'
-            existing.rejected_by = None
-            existing.rejected_at = None
-            db.session.commit()
-            return jsonify({
-                'success': True,
-                'attendance': existing.to_dict()
-            })
-        
-        # 최대 인원 확인
-        attending_count = ScheduleAttendance.query.filter(
-            ScheduleAttendance.schedule_id == schedule_id,
-            ScheduleAttendance.status == 'attending'
-        ).count()
-        
-        if attending_count >= schedule.max_participants:
-            return jsonify({'success': False, 'message': '참석 인원이 가득 찼습니다.'}), 400
+        # 일정 행 잠금 안에서 중복/정원 확인 후 참석 또는 대기 등록 (동시 신청 시 초과 방지)
+        # 거부된 경우 다시 신청 가능
+        attendance, error = reserve_seat(schedule_id, member_id)
+        if error:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': error}), 400
         
-        # 참석 추가
-        attendance = ScheduleAttendance(
-            schedule_id=schedule_id,
-            member_id=member_id,
-            status='attending'
-        )
-        
-        db.session.add(attendance)
+        position = waitlist_position(attendance)
+        is_attending = attendance.status == 'attending'
         db.session.commit()
+        record_attendance(club_id, schedule_id, [(member_id, is_attending)])
         
-        return jsonify({
+        response = {
             'success': True,
             'attendance': attendance.to_dict()
-        }), 201
+        }
+        if position is not None:
+            response['waitlist_position'] = position
+            response['message'] = f'참석 인원이 가득 차 대기 명단에 등록되었습니다. (대기 {position}번)'
+        return jsonify(response), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -391,7 +386,7 @@ def cancel_attendance(schedule_id):
             return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
         
         # 로그인한 유저 정보 가져오기
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         if not current_user:
             return jsonify({'success': False, 'message': '사용자 정보를 찾을 수 없습니다.'}), 404
         
@@ -428,21 +423,25 @@ def cancel_attendance(schedule_id):
         # 이후 로직에서 사용할 member_id를 보정
         member_id = member.id
 
-        attendance = ScheduleAttendance.query.filter(
-            ScheduleAttendance.schedule_id == schedule_id,
-            ScheduleAttendance.member_id == member_id
-        ).first()
-        
-        if not attendance:
-            return jsonify({'success': False, 'message': '참석 내역을 찾을 수 없습니다.'}), 404
-        
-        if attendance.status != 'attending':
-            return jsonify({'success': False, 'message': '취소할 수 있는 상태가 아닙니다.'}), 400
-        
-        db.session.delete(attendance)
+        # 참석 취소로 빈 자리는 대기자에게 순서대로 승격
+        promoted, error = release_seat(schedule_id, member_id)
+        if error:
+            db.session.rollback()
+            status_code = 404 if error == ATTENDANCE_NOT_FOUND else 400
+            return jsonify({'success': False, 'message': error}), status_code
+        
+        promoted_member_ids = [attendance.member_id for attendance in promoted]
         db.session.commit()
+        record_attendance(
+            club_id, schedule_id,
+            [(member_id, False)] + [(promoted_id, True) for promoted_id in promoted_member_ids]
+        )
         
-        return jsonify({'success': True, 'message': '참석이 취소되었습니다.'})
+        return jsonify({
+            'success': True,
+            'message': '참석이 취소되었습니다.',
+            'promoted_member_ids': promoted_member_ids
+        })
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -461,7 +460,7 @@ def reject_attendance(schedule_id):
             return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
         
         # 권한 확인
-        current_user = User.query.get(int(user_id))
+        current_user = get_user(user_id)
         is_admin = current_user and (current_user.role in ['super_admin', 'admin'] or check_club_permission(int(user_id), club_id))
         
         if not is_admin:
@@ -481,19 +480,30 @@ def reject_attendance(schedule_id):
         if not schedule:
             return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
         
+        max_participants = lock_schedule_capacity(schedule_id)
         attendance = ScheduleAttendance.query.filter(
             ScheduleAttendance.schedule_id == schedule_id,
             ScheduleAttendance.member_id == member_id
         ).first()
         
         if not attendance:
+            db.session.rollback()
             return jsonify({'success': False, 'message': '참석 내역을 찾을 수 없습니다.'}), 404
         
+        was_attending = attendance.status == 'attending'
         attendance.status = 'rejected'
+        attendance.waitlisted_at = None
         attendance.rejected_by = int(user_id)
         attendance.rejected_at = datetime.utcnow()
         
+        # 거부로 빈 자리는 대기자 승격
+        promoted = []
+        if was_attending:
+            db.session.flush()
+            promoted = promote_waitlist(schedule_id, max_participants)
+        changes = [(attendance.member_id, False)] + [(row.member_id, True) for row in promoted]
         db.session.commit()
+        record_attendance(club_id, schedule_id, changes)
         
         return jsonify({
             'success': True,
@@ -503,3 +513,258 @@ def reject_attendance(schedule_id):
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
+def _is_club_admin(user_id, club_id):
+    """운영진 이상 또는 슈퍼관리자"""
+    current_user = get_user(user_id)
+    if not current_user:
+        return False
+    if current_user.role == 'super_admin':
+        return True
+    has_permission, _ = check_club_permission(int(user_id), club_id, 'admin')
+    return has_permission
+
+@schedules_bp.route('/recurrences', methods=['GET'])
+@jwt_required()
+def get_recurrences():
+    """정기 일정 규칙 목록 API"""
+    try:
+        club_id = get_current_club_id()
+        if not club_id:
+            return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
+        
+        recurrences = ScheduleRecurrence.query.filter(
+            ScheduleRecurrence.club_id == club_id,
+            ScheduleRecurrence.is_active == True
+        ).order_by(ScheduleRecurrence.id.asc()).all()
+        
+        return jsonify({
+            'success': True,
+            'recurrences': [recurrence.to_dict() for recurrence in recurrences]
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@schedules_bp.route('/recurrences', methods=['POST'])
+@jwt_required()
+def create_recurrence():
+    """정기 일정 규칙 생성 API (운영진/슈퍼관리자만)
+
+    규칙을 저장하고 starts_on ~ until 기간의 일정을 한 번에 생성합니다.
+    이후 기간은 flask materialize-recurring-schedules 주기 실행으로 ends_on 까지 이어서 생성됩니다.
+    같은 요일/주차/시간의 활성 규칙과 기간이 겹치면 409 를 반환합니다.
+    """
+    try:
+        user_id = get_jwt_identity()
+        if not user_id:
+            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+        
+        club_id = get_current_club_id()
+        if not club_id:
+            return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
+        
+        if not _is_club_admin(user_id, club_id):
+            return jsonify({'success': False, 'message': '정기 일정 생성 권한이 없습니다.'}), 403
+        
+        data = request.get_json() or {}
+        try:
+            day_of_week = int(data.get('day_of_week'))
+            frequency = int(data.get('frequency', 4))
+            max_participants = int(data.get('max_participants', 18))
+            recurrence_time = datetime.strptime(data.get('time', ''), '%H:%M').time()
+            starts_on = datetime.strptime(data['starts_on'], '%Y-%m-%d').date() if data.get('starts_on') else datetime.now().date()
+            ends_on = datetime.strptime(data['ends_on'], '%Y-%m-%d').date() if data.get('ends_on') else None
+            until = datetime.strptime(data['until'], '%Y-%m-%d').date() if data.get('until') else None
+        except (TypeError, ValueError, KeyError):
+            return jsonify({'success': False, 'message': '정기 일정 설정 형식이 올바르지 않습니다.'}), 400
+        
+        week_type = data.get('week_type', 'all')
+        if not 0 <= day_of_week <= 6 or week_type not in RECURRENCE_WEEK_TYPES or not 1 <= frequency <= 5:
+            return jsonify({'success': False, 'message': '정기 일정 설정 값이 올바르지 않습니다.'}), 400
+        if max_participants < 1 or (ends_on and ends_on < starts_on):
+            return jsonify({'success': False, 'message': '정기 일정 설정 값이 올바르지 않습니다.'}), 400
+        
+        # 같은 요일/주차/시간의 활성 규칙과 기간이 겹치면 같은 날짜에 일정이 중복 생성되므로 거부
+        # (발생 일정의 중복 방지 키는 (recurrence_id, date) 라 규칙이 다르면 막히지 않음)
+        overlapping = ScheduleRecurrence.query.filter(
+            ScheduleRecurrence.club_id == club_id,
+            ScheduleRecurrence.is_active == True,
+            ScheduleRecurrence.day_of_week == day_of_week,
+            ScheduleRecurrence.week_type == week_type,
+            ScheduleRecurrence.time == recurrence_time,
+            db.or_(ScheduleRecurrence.ends_on.is_(None), ScheduleRecurrence.ends_on >= starts_on)
+        )
+        if ends_on:
+            overlapping = overlapping.filter(ScheduleRecurrence.starts_on <= ends_on)
+        if overlapping.first():
+            return jsonify({
+                'success': False,
+                'message': '같은 요일/주차/시간의 정기 일정이 이미 있습니다. 기존 정기 일정을 중지한 후 다시 생성해주세요.'
+            }), 409
+        
+        if until is None:
+            until = horizon_end(datetime.now().date(), current_app.config.get('RECURRING_SCHEDULE_HORIZON_MONTHS', 3))
+        
+        recurrence = ScheduleRecurrence(
+            club_id=club_id,
+            schedule_type=data.get('schedule_type', 'regular'),
+            title=data.get('title') or '정기전',
+            time=recurrence_time,
+            max_participants=max_participants,
+            description=data.get('description'),
+            day_of_week=day_of_week,
+            week_type=week_type,
+            frequency=frequency,
+            starts_on=starts_on,
+            ends_on=ends_on,
+            created_by=int(user_id)
+        )
+        db.session.add(recurrence)
+        db.session.flush()
+        
+        result = materialize_recurrences(until, rules=[recurrence])
+        db.session.commit()
+        invalidate_club_matrix(club_id)
+        
+        return jsonify({
+            'success': True,
+            'recurrence': recurrence.to_dict(),
+            'created_count': result['created']
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@schedules_bp.route('/recurrences/<int:recurrence_id>', methods=['DELETE'])
+@jwt_required()
+def delete_recurrence(recurrence_id):
+    """정기 일정 규칙 중지 API (운영진/슈퍼관리자만)
+
+    더 이상 일정을 생성하지 않고, 오늘 이후 일정 중 참석 신청이 없는 일정은 삭제합니다.
+    """
+    try:
+        user_id = get_jwt_identity()
+        if not user_id:
+            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+        
+        club_id = get_current_club_id()
+        if not club_id:
+            return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
+        
+        if not _is_club_admin(user_id, club_id):
+            return jsonify({'success': False, 'message': '정기 일정 삭제 권한이 없습니다.'}), 403
+        
+        recurrence = ScheduleRecurrence.query.filter(
+            ScheduleRecurrence.id == recurrence_id,
+            ScheduleRecurrence.club_id == club_id
+        ).first()
+        if not recurrence:
+            return jsonify({'success': False, 'message': '정기 일정을 찾을 수 없습니다.'}), 404
+        
+        recurrence.is_active = False
+        deleted = Schedule.query.filter(
+            Schedule.recurrence_id == recurrence_id,
+            Schedule.date >= datetime.now().date(),
+            ~Schedule.attendances.any()
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        invalidate_club_matrix(club_id)
+        
+        return jsonify({
+            'success': True,
+            'message': '정기 일정이 중지되었습니다.',
+            'deleted_count': deleted
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+# 시즌 기간: 상반기 1~6월, 하반기 7~12월 (scores.season_half 와 같은 기준)
+SEASON_HALVES = {'first_half': (1, 6), 'second_half': (7, 12)}
+
+def _parse_season_range(args):
+    """start_date/end_date 또는 season_year(+season_half) 로 기간 계산 (형식 오류 시 ValueError)"""
+    start_date = datetime.strptime(args['start_date'], '%Y-%m-%d').date() if args.get('start_date') else None
+    end_date = datetime.strptime(args['end_date'], '%Y-%m-%d').date() if args.get('end_date') else None
+    if args.get('season_year'):
+        year = int(args['season_year'])
+        first_month, last_month = SEASON_HALVES.get(args.get('season_half'), (1, 12))
+        start_date = datetime(year, first_month, 1).date()
+        end_date = (datetime(year + 1, 1, 1) if last_month == 12 else datetime(year, last_month + 1, 1)).date() - timedelta(days=1)
+    return start_date, end_date
+
+@schedules_bp.route('/analytics', methods=['GET'])
+@jwt_required()
+def get_attendance_analytics():
+    """회원별 참석 통계 API (운영진/슈퍼관리자만)
+
+    - 기간: start_date / end_date 또는 season_year (+ season_half), 지난 일정만 집계
+    - schedule_type: 일정 종류 (기본값: regular, all 이면 전체)
+    - 참석률 / 현재 연속 참석 / 최장 연속 참석 / 노쇼(참석 신청 후 점수 기록 없음)
+    """
+    try:
+        user_id = get_jwt_identity()
+        club_id = get_current_club_id()
+        if not club_id:
+            return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
+        
+        if not _is_club_admin(user_id, club_id):
+            return jsonify({'success': False, 'message': '참석 통계 조회 권한이 없습니다.'}), 403
+        
+        try:
+            start_date, end_date = _parse_season_range(request.args)
+        except ValueError:
+            return jsonify({'success': False, 'message': '기간 형식이 올바르지 않습니다.'}), 400
+        schedule_type = request.args.get('schedule_type', 'regular')
+        
+        matrix = get_club_matrix(club_id)
+        mask = matrix.column_mask(
+            schedule_type=None if schedule_type == 'all' else schedule_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+        stats = matrix.member_stats(mask)
+        stats.sort(key=lambda item: (-item['attendance_rate'], -item['attended'], item['member_name'] or ''))
+        
+        return jsonify({
+            'success': True,
+            'games': mask.bit_count(),
+            'members': stats
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@schedules_bp.route('/analytics/qualified', methods=['GET'])
+@jwt_required()
+def get_qualified_members():
+    """최근 last 개 일정 중 min_attended 번 이상 참석한 회원 API (운영진/슈퍼관리자만)"""
+    try:
+        user_id = get_jwt_identity()
+        club_id = get_current_club_id()
+        if not club_id:
+            return jsonify({'success': False, 'message': '클럽을 선택해주세요.'}), 400
+        
+        if not _is_club_admin(user_id, club_id):
+            return jsonify({'success': False, 'message': '참석 통계 조회 권한이 없습니다.'}), 403
+        
+        try:
+            min_attended = int(request.args.get('min_attended', 1))
+            last_games = int(request.args.get('last', 10))
+        except ValueError:
+            return jsonify({'success': False, 'message': '조건 형식이 올바르지 않습니다.'}), 400
+        if min_attended < 0 or last_games < 1:
+            return jsonify({'success': False, 'message': '조건 값이 올바르지 않습니다.'}), 400
+        schedule_type = request.args.get('schedule_type', 'regular')
+        
+        members = get_club_matrix(club_id).qualified_members(
+            min_attended,
+            last_games,
+            schedule_type=None if schedule_type == 'all' else schedule_type
+        )
+        members.sort(key=lambda item: (-item['attended'], item['member_name'] or ''))
+        
+        return jsonify({
+            'success': True,
+            'members': members
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
@@ -0,0 +1,83 @@
+from flask import Blueprint, request, jsonify, make_response, current_app
+from flask_jwt_extended import jwt_required
+from utils.club_helpers import get_current_club_id, require_club_membership
+from utils.identity import get_current_user
+from utils.search import search, parse_types, SEARCH_MIN_LENGTH, SEARCH_MAX_LENGTH
+
+# 검색 Blueprint
+search_bp = Blueprint('search', __name__, url_prefix='/api/search')
+
+SEARCH_PER_PAGE = 20
+SEARCH_MAX_PER_PAGE = 50
+
+@search_bp.before_request
+def handle_preflight():
+    if request.method == "OPTIONS":
+        response = make_response()
+        allowed_origins = current_app.config.get('CORS_ALLOWED_ORIGINS', [])
+        request_origin = request.headers.get('Origin')
+        if request_origin and request_origin in allowed_origins:
+            response.headers.add("Access-Control-Allow-Origin", request_origin)
+        response.headers.add('Access-Control-Allow-Headers', "Content-Type,Authorization,X-Requested-With,X-Club-Id,X-Privacy-Token")
+        response.headers.add('Access-Control-Allow-Methods', "GET,OPTIONS")
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        return response
+
+# 게시글 / 댓글 / 문의 통합 검색
+@search_bp.route('', methods=['GET'])
+@jwt_required()
+def search_content():
+    """게시글 / 댓글 / 문의 검색 (점수순, 페이지네이션)
+
+    Query:
+        q: 검색어 (SEARCH_MIN_LENGTH ~ SEARCH_MAX_LENGTH 자)
+        types: 검색 대상 ('posts,comments,inquiries' 중 일부, 기본: 전체)
+        page / per_page: 페이지 (기본 1 / SEARCH_PER_PAGE, 최대 SEARCH_MAX_PER_PAGE)
+
+    조회 범위는 게시글 목록 / 문의 목록과 같음 (댓글은 게시글 조회 범위를 따름)
+    """
+    try:
+        user = get_current_user()
+        if not user:
+            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+        
+        query = ' '.join(request.args.get('q', '').split())
+        if len(query) < SEARCH_MIN_LENGTH:
+            return jsonify({'success': False, 'message': f'검색어를 {SEARCH_MIN_LENGTH}자 이상 입력해주세요.'}), 400
+        if len(query) > SEARCH_MAX_LENGTH:
+            return jsonify({'success': False, 'message': f'검색어는 {SEARCH_MAX_LENGTH}자 이내로 입력해주세요.'}), 400
+        
+        types = parse_types(request.args.get('types'))
+        if types is None:
+            return jsonify({'success': False, 'message': '검색 대상이 올바르지 않습니다.'}), 400
+        
+        try:
+            page = max(int(request.args.get('page', 1)), 1)
+            per_page = min(max(int(request.args.get('per_page', SEARCH_PER_PAGE)), 1), SEARCH_MAX_PER_PAGE)
+        except ValueError:
+            return jsonify({'success': False, 'message': '페이지 값이 올바르지 않습니다.'}), 400
+        
+        # 슈퍼관리자는 클럽 선택 없이 전체 검색, 일반 사용자는 선택한 클럽 가입 필요 (게시글 목록과 동일)
+        club_id = get_current_club_id()
+        if user.role != 'super_admin':
+            if not club_id:
+                return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
+            is_member, result = require_club_membership(user.id, club_id)
+            if not is_member:
+                return jsonify({'success': False, 'message': result}), 403
+        
+        results, total = search(user, club_id, query, types=types, page=page, per_page=per_page)
+        
+        return jsonify({
+            'success': True,
+            'query': query,
+            'results': results,
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'pages': (total + per_page - 1) // per_page
+            }
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'검색 중 오류가 발생했습니다: {str(e)}'}), 500
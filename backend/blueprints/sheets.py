@@ -1,9 +1,9 @@
 from flask import Blueprint, request, jsonify, make_response
-from models import db, Member, Score, Point, User
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from models import db, Member, Score, Point
+from flask_jwt_extended import jwt_required
 from google_sheets import GoogleSheetsManager
 from datetime import datetime
-from utils.club_helpers import get_current_club_id, check_club_permission
+from utils.club_helpers import get_current_club_id, require_club_role
 
 # 구글 시트 연동 Blueprint
 sheets_bp = Blueprint('sheets', __name__, url_prefix='/api')
@@ -72,34 +72,12 @@ def debug_auth():
 
 @sheets_bp.route('/scores/import-from-sheets', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def import_scores_from_sheets():
     """구글 시트에서 스코어 데이터 가져오기 API"""
     try:
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         data = request.get_json()
         spreadsheet_url = data.get('spreadsheet_url', '').strip()
@@ -217,34 +195,12 @@ def import_scores_from_sheets():
 
 @sheets_bp.route('/members/import-from-sheets', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def import_members_from_sheets():
     """구글 시트에서 회원 데이터 가져오기 API"""
     try:
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         data = request.get_json()
         spreadsheet_url = data.get('spreadsheet_url', '').strip()
@@ -348,34 +304,12 @@ def import_members_from_sheets():
 
 @sheets_bp.route('/points/import-from-sheets', methods=['POST'])
 @jwt_required()
+@require_club_role('admin')
 def import_points_from_sheets():
     """구글 시트에서 포인트 데이터 가져오기 API"""
     try:
-        # 권한 확인
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
-        
-        current_user = User.query.get(int(user_id))
-        if not current_user:
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
-        
         # 클럽 필터링
         club_id = get_current_club_id()
-        if not club_id:
-            return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
-        
-        # 슈퍼관리자 또는 시스템 관리자인지 확인
-        is_system_admin = current_user.role in ['super_admin', 'admin']
-        
-        # 클럽별 운영진인지 확인
-        is_club_admin = False
-        if not is_system_admin:
-            has_permission, result = check_club_permission(int(user_id), club_id, 'admin')
-            if has_permission:
-                is_club_admin = True
-            else:
-                return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
         
         data = request.get_json()
         spreadsheet_url = data.get('spreadsheet_url', '').strip()
@@ -94,6 +94,51 @@ class Config:
     # JWT 설정
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'your-secret-key-change-this-in-production'
 
+    # JWT 활성 토큰 캐시 설정 (token_in_blocklist_loader용)
+    TOKEN_CACHE_TTL = int(os.environ.get('TOKEN_CACHE_TTL', 30))  # 초
+    TOKEN_CACHE_MAX_SIZE = int(os.environ.get('TOKEN_CACHE_MAX_SIZE', 10000))
+    TOKEN_CACHE_REDIS_URL = os.environ.get('TOKEN_CACHE_REDIS_URL')  # 멀티 워커 배포 시 공유 캐시
+
+    # 클럽 권한 확인용 역할 캐시 설정 (require_club_role용, 워커 프로세스별)
+    ROLE_CACHE_TTL = int(os.environ.get('ROLE_CACHE_TTL', 30))  # 초
+    ROLE_CACHE_MAX_SIZE = int(os.environ.get('ROLE_CACHE_MAX_SIZE', 10000))
+
+    # 전체 게시글(club_id 가 null) 목록 캐시 설정 (게시글 목록용, 워커 프로세스별)
+    GLOBAL_POST_CACHE_TTL = int(os.environ.get('GLOBAL_POST_CACHE_TTL', 60))  # 초
+
+    # 정기 일정(정기전) 미리 생성 기간 (flask materialize-recurring-schedules)
+    RECURRING_SCHEDULE_HORIZON_MONTHS = int(os.environ.get('RECURRING_SCHEDULE_HORIZON_MONTHS', 3))  # 개월
+
+    # 회원별 참석 통계용 참석 행렬 캐시 설정 (클럽 단위, 워커 프로세스별)
+    ATTENDANCE_ANALYTICS_CACHE_TTL = int(os.environ.get('ATTENDANCE_ANALYTICS_CACHE_TTL', 600))  # 초
+    ATTENDANCE_ANALYTICS_CACHE_MAX_SIZE = int(os.environ.get('ATTENDANCE_ANALYTICS_CACHE_MAX_SIZE', 200))
+
+    # 비밀번호 해시 설정 (알고리즘/비용 변경 시 로그인할 때 자동으로 다시 해시)
+    PASSWORD_HASH_ALGORITHM = os.environ.get('PASSWORD_HASH_ALGORITHM', 'pbkdf2:sha256')  # 'pbkdf2:sha256' 또는 'scrypt'
+    PASSWORD_HASH_COST = int(os.environ['PASSWORD_HASH_COST']) if os.environ.get('PASSWORD_HASH_COST') else None  # pbkdf2 반복 횟수 / scrypt N
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))  # 동시 해시 작업 수
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 16))  # 대기열 크기
+    PASSWORD_HASH_WAIT_TIMEOUT = int(os.environ.get('PASSWORD_HASH_WAIT_TIMEOUT', 2))  # 대기열 자리 대기 시간(초), 초과 시 503
+
+    # 인증 엔드포인트 요청 제한 (토큰 버킷)
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() in ['true', 'on', '1']
+    RATE_LIMIT_REDIS_URL = os.environ.get('RATE_LIMIT_REDIS_URL')  # 멀티 워커 배포 시 공유 버킷
+
+    # 앱 앞단 리버스 프록시 단계 수 (Railway 등 프록시 1단계 = 1, 프록시 없이 직접 노출 = 0)
+    # 이 수만큼의 X-Forwarded-For 오른쪽 값만 신뢰하고 request.remote_addr 로 사용 (요청 제한 IP 기준)
+    TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', 1))
+
+    # 실시간 알림 long-poll 설정 (/api/events/poll)
+    EVENTS_POLL_TIMEOUT = int(os.environ.get('EVENTS_POLL_TIMEOUT', 25))  # 요청당 최대 대기 시간(초)
+    # 대기 요청은 gunicorn 스레드를 하나씩 점유 (DB 커넥션은 반납)
+    # → 기본값은 start.sh 의 --threads 에서 일반 요청용 스레드(EVENTS_RESERVED_THREADS)를 뺀 수
+    GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 40))
+    EVENTS_RESERVED_THREADS = int(os.environ.get('EVENTS_RESERVED_THREADS', 8))  # 일반 요청용 (DB 풀 pool_size + max_overflow 이하)
+    EVENTS_MAX_WAITERS = int(os.environ.get('EVENTS_MAX_WAITERS', max(GUNICORN_THREADS - EVENTS_RESERVED_THREADS, 1)))  # 동시 대기 요청 수
+    EVENTS_BUSY_RETRY_AFTER = int(os.environ.get('EVENTS_BUSY_RETRY_AFTER', 15))  # 대기 자리가 없을 때 짧은 폴링 간격(초)
+    EVENTS_BUFFER_SIZE = int(os.environ.get('EVENTS_BUFFER_SIZE', 50))  # 토픽별 최근 이벤트 보관 수
+    EVENTS_REDIS_URL = os.environ.get('EVENTS_REDIS_URL')  # 멀티 워커 배포 시 Redis pub/sub
+
     # Frontend/Base URL 및 CORS 설정
     FRONTEND_BASE_URL = os.environ.get('FRONTEND_BASE_URL') or 'http://localhost:3000'
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS')  # 콤마(,)로 구분된 허용 오리진 목록
@@ -10,6 +10,7 @@ from flask import current_app
 from flask_mail import Mail, Message
 from itsdangerous import URLSafeTimedSerializer
 from models import db, User, ClubMember
+from utils.password_hasher import PasswordHasherBusy
 
 # Flask-Mail 인스턴스
 mail = Mail()
@@ -389,6 +390,10 @@ def verify_email_token(token):
         
         return {'success': True, 'message': '이메일 인증이 완료되었습니다. 이제 로그인할 수 있습니다.'}
         
+    except PasswordHasherBusy:
+        # 엔드포인트에서 503 으로 응답
+        db.session.rollback()
+        raise
     except Exception as e:
         db.session.rollback()
         return {'success': False, 'message': f'인증 처리 중 오류가 발생했습니다: {str(e)}'}
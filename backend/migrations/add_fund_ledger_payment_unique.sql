@@ -0,0 +1,16 @@
+-- fund_ledger.payment_id 유니크 인덱스 추가
+-- 동시 요청으로 생성된 중복 장부 항목을 정리한 뒤 결제 1건당 장부 항목 1개를 보장
+
+-- 중복 장부 항목 정리 (payment_id별 가장 먼저 생성된 행만 유지)
+DELETE FROM fund_ledger fl
+USING fund_ledger keep
+WHERE fl.payment_id IS NOT NULL
+  AND fl.payment_id = keep.payment_id
+  AND fl.id > keep.id;
+
+-- 결제별 유일성 보장 (payment_id가 NULL인 수기 항목은 제외됨)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_fund_ledger_payment_id_unique
+ON fund_ledger(payment_id);
+
+-- 코멘트 추가
+COMMENT ON INDEX idx_fund_ledger_payment_id_unique IS '결제 1건당 장부 항목 1개 (INSERT ... ON CONFLICT 대상)';
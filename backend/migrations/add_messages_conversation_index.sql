@@ -0,0 +1,4 @@
+-- 1:1 대화별 메시지 조회용 인덱스
+-- 두 사용자 ID를 정렬한 (least, greatest) 쌍 + id 로 대화 메시지를 before_id 커서 기준 페이지 조회
+CREATE INDEX IF NOT EXISTS idx_messages_conversation
+    ON messages (LEAST(sender_id, receiver_id), GREATEST(sender_id, receiver_id), id);
@@ -0,0 +1,20 @@
+-- points.payment_id 컬럼 추가 (포인트 납부 연동 납입 내역 FK)
+-- 기존 note = 'PAYMENT:<id>' 문자열 연결을 인덱스 가능한 FK로 대체
+
+ALTER TABLE points ADD COLUMN IF NOT EXISTS payment_id INTEGER REFERENCES payments(id) ON DELETE SET NULL;
+
+-- 기존 데이터 백필: note 의 'PAYMENT:<id>' 에서 납입 내역 ID 추출
+UPDATE points pt
+SET payment_id = p.id
+FROM payments p
+WHERE pt.payment_id IS NULL
+  AND pt.note ~ '^PAYMENT:[0-9]+$'
+  AND p.id = CAST(SUBSTRING(pt.note FROM 9) AS INTEGER);
+
+-- 연결 정보가 컬럼으로 옮겨졌으므로 링크용 메모 제거
+UPDATE points SET note = NULL WHERE payment_id IS NOT NULL AND note LIKE 'PAYMENT:%';
+
+-- 납입 내역별 연동 포인트 조회를 위한 인덱스
+CREATE INDEX IF NOT EXISTS ix_points_payment_id ON points(payment_id);
+
+COMMENT ON COLUMN points.payment_id IS '포인트 납부로 생성된 경우 연동된 납입 내역 ID';
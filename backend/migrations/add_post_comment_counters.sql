@@ -0,0 +1,15 @@
+-- 게시글 좋아요/댓글 수, 댓글 업 수 컬럼 추가
+-- 목록 조회 시 likes / comments 전체를 로드해 세지 않도록 카운터를 저장하고
+-- 좋아요 토글, 댓글 작성/삭제 시 UPDATE ... SET x = x ± 1 로 갱신
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS like_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS like_count INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 데이터 기준으로 카운터 채우기
+UPDATE posts p SET
+    like_count = (SELECT COUNT(*) FROM likes l WHERE l.post_id = p.id),
+    comment_count = (SELECT COUNT(*) FROM comments c WHERE c.post_id = p.id);
+
+UPDATE comments c SET
+    like_count = (SELECT COUNT(*) FROM comment_likes cl WHERE cl.comment_id = c.id);
@@ -0,0 +1,10 @@
+-- 클럽 게시글 목록 인덱스
+-- 게시글 목록은 club_id = ? 조건의 최신순 페이지를 캐시된 전체 게시글(club_id 가 null)과 메모리에서 병합 (utils/global_posts.py)
+-- 공지 구간 / 종류별 조회: (club_id, post_type, created_at, id)
+-- 일반 게시글 구간 (post_type <> 'notice'): (club_id, created_at, id)
+
+CREATE INDEX IF NOT EXISTS idx_posts_club_type_created
+    ON posts (club_id, post_type, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_posts_club_created
+    ON posts (club_id, created_at DESC, id DESC);
@@ -0,0 +1,15 @@
+-- 일정 참석 대기 명단
+-- 정원이 차 있으면 status = 'waiting' 으로 등록하고, 참석 취소/거부/정원 증가 시
+-- waitlisted_at, id 순서대로 'attending' 으로 승격 (utils/schedule_attendance.py)
+
+ALTER TABLE schedule_attendances ADD COLUMN IF NOT EXISTS waitlisted_at TIMESTAMPTZ;
+
+-- status 에 'waiting' 허용
+ALTER TABLE schedule_attendances DROP CONSTRAINT IF EXISTS schedule_attendances_status_check;
+ALTER TABLE schedule_attendances ADD CONSTRAINT schedule_attendances_status_check
+    CHECK (status IN ('attending', 'waiting', 'rejected'));
+
+-- 대기 순번 / 승격 순서 조회
+CREATE INDEX IF NOT EXISTS idx_attendances_waitlist
+    ON schedule_attendances (schedule_id, waitlisted_at, id)
+    WHERE status = 'waiting';
@@ -0,0 +1,27 @@
+-- 게시글 / 댓글 / 문의 검색용 컬럼 및 인덱스 (PostgreSQL 12+)
+-- 1) search_vector: 'simple' 설정 tsvector 생성 컬럼 + GIN 인덱스 (단어 단위 전문 검색, ts_rank 순위)
+-- 2) pg_trgm 트라이그램 GIN 인덱스: 한국어는 형태소 분석 사전이 없어 조사가 붙은 단어("볼링장에서")가
+--    토큰으로 일치하지 않으므로 ILIKE 부분 일치로 보완
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 게시글 (제목 + 내용)
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(content, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_posts_search_vector ON posts USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_posts_title_trgm ON posts USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_posts_content_trgm ON posts USING GIN (content gin_trgm_ops);
+
+-- 댓글 (내용)
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, coalesce(content, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_comments_search_vector ON comments USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_comments_content_trgm ON comments USING GIN (content gin_trgm_ops);
+
+-- 문의 (제목 + 내용 + 답변)
+ALTER TABLE inquiries ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(content, '') || ' ' || coalesce(reply, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_inquiries_search_vector ON inquiries USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_inquiries_title_trgm ON inquiries USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_inquiries_content_trgm ON inquiries USING GIN (content gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_inquiries_reply_trgm ON inquiries USING GIN (reply gin_trgm_ops);
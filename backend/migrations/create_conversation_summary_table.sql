@@ -0,0 +1,40 @@
+-- 1:1 대화 요약 테이블 생성 (받은편지함 목록을 메시지 전체가 아닌 요약 행으로 조회)
+-- (user_id, peer_id) 마다 한 행: 마지막 메시지(삭제되지 않은 것)와 peer_id 가 보낸 안 읽은 메시지 수
+CREATE TABLE IF NOT EXISTS conversation_summary (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    peer_id INTEGER NOT NULL REFERENCES users(id),
+    last_message_id INTEGER REFERENCES messages(id),
+    last_message_preview VARCHAR(200),
+    last_time TIMESTAMP,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, peer_id)
+);
+
+-- 대화 목록 조회용 인덱스 (사용자별 최신 순)
+CREATE INDEX IF NOT EXISTS idx_conversation_summary_user_last_time ON conversation_summary(user_id, last_time);
+
+-- 기존 메시지로 요약 채우기
+WITH sides AS (
+    SELECT sender_id AS user_id, receiver_id AS peer_id, id, content, created_at, FALSE AS is_incoming_unread
+    FROM messages
+    WHERE COALESCE(is_deleted, FALSE) = FALSE
+    UNION ALL
+    SELECT receiver_id AS user_id, sender_id AS peer_id, id, content, created_at, (COALESCE(is_read, FALSE) = FALSE) AS is_incoming_unread
+    FROM messages
+    WHERE COALESCE(is_deleted, FALSE) = FALSE AND receiver_id <> sender_id
+),
+ranked AS (
+    SELECT sides.*,
+           ROW_NUMBER() OVER (PARTITION BY user_id, peer_id ORDER BY id DESC) AS rn,
+           COUNT(*) FILTER (WHERE is_incoming_unread) OVER (PARTITION BY user_id, peer_id) AS unread
+    FROM sides
+)
+INSERT INTO conversation_summary (user_id, peer_id, last_message_id, last_message_preview, last_time, unread_count)
+SELECT user_id, peer_id, id, LEFT(content, 200), created_at, unread
+FROM ranked
+WHERE rn = 1
+ON CONFLICT (user_id, peer_id) DO UPDATE SET
+    last_message_id = EXCLUDED.last_message_id,
+    last_message_preview = EXCLUDED.last_message_preview,
+    last_time = EXCLUDED.last_time,
+    unread_count = EXCLUDED.unread_count;
@@ -0,0 +1,34 @@
+-- 정기 일정 규칙 테이블
+-- 규칙의 발생 일정은 schedules 행으로 미리 생성 (utils/recurrence.py, flask materialize-recurring-schedules)
+-- (recurrence_id, date) 유니크 제약으로 다시 실행해도 같은 날짜 일정은 한 번만 생성
+
+CREATE TABLE IF NOT EXISTS schedule_recurrences (
+    id SERIAL PRIMARY KEY,
+    club_id INTEGER NOT NULL REFERENCES clubs(id) ON DELETE CASCADE,
+    schedule_type VARCHAR(20) NOT NULL DEFAULT 'regular',
+    title VARCHAR(200) NOT NULL,
+    time TIME NOT NULL,
+    max_participants INTEGER NOT NULL DEFAULT 18,
+    description TEXT,
+    day_of_week INTEGER NOT NULL CHECK (day_of_week BETWEEN 0 AND 6), -- 0: 일요일 ~ 6: 토요일
+    week_type VARCHAR(10) NOT NULL DEFAULT 'all' CHECK (week_type IN ('all', 'even', 'odd')),
+    frequency INTEGER NOT NULL DEFAULT 4, -- 월 최대 횟수
+    starts_on DATE NOT NULL,
+    ends_on DATE,
+    materialized_until DATE, -- 이 날짜까지 일정 생성 완료
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_by INTEGER REFERENCES users(id) ON DELETE SET NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_recurrences_club_id ON schedule_recurrences(club_id);
+
+ALTER TABLE schedules ADD COLUMN IF NOT EXISTS recurrence_id INTEGER REFERENCES schedule_recurrences(id) ON DELETE SET NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'unique_schedule_recurrence_date') THEN
+        ALTER TABLE schedules ADD CONSTRAINT unique_schedule_recurrence_date UNIQUE (recurrence_id, date);
+    END IF;
+END $$;
@@ -0,0 +1,32 @@
+-- 인증 코드 전용 테이블 생성 (users.verification_code / verification_code_expires 대체)
+-- 이메일 + 용도(verify, password_reset)별로 코드 1개를 보관하고, 만료 코드는 일괄 삭제합니다.
+CREATE TABLE IF NOT EXISTS verification_codes (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(120) NOT NULL,
+    purpose VARCHAR(20) NOT NULL,
+    code VARCHAR(10) NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT unique_verification_code_email_purpose UNIQUE (email, purpose)
+);
+
+-- 만료 코드 일괄 삭제용 인덱스
+CREATE INDEX IF NOT EXISTS idx_verification_codes_expires_at ON verification_codes(expires_at);
+
+-- 기존 users 컬럼의 유효한 코드 이관
+-- 인증 완료된 사용자의 코드는 비밀번호 재설정 코드, 미인증 사용자의 코드는 이메일 인증 코드
+INSERT INTO verification_codes (email, purpose, code, expires_at, created_at)
+SELECT LOWER(email),
+       CASE WHEN COALESCE(is_verified, FALSE) THEN 'password_reset' ELSE 'verify' END,
+       verification_code,
+       verification_code_expires,
+       NOW()
+FROM users
+WHERE verification_code IS NOT NULL
+  AND verification_code_expires IS NOT NULL
+  AND verification_code_expires > NOW()
+ON CONFLICT (email, purpose) DO NOTHING;
+
+-- users 테이블에서 인증 코드 컬럼 제거
+ALTER TABLE users DROP COLUMN IF EXISTS verification_code;
+ALTER TABLE users DROP COLUMN IF EXISTS verification_code_expires;
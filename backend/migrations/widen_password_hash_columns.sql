@@ -0,0 +1,5 @@
+-- users.password_hash / privacy_password_hash 길이 확장
+-- scrypt 해시(scrypt:N:r:p$salt$hash)는 128자를 넘으므로 PASSWORD_HASH_ALGORITHM=scrypt 사용 전 적용
+
+ALTER TABLE users ALTER COLUMN password_hash TYPE VARCHAR(256);
+ALTER TABLE users ALTER COLUMN privacy_password_hash TYPE VARCHAR(256);
@@ -1,7 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+from utils.password_hasher import hash_password, verify_password, needs_rehash
 
 db = SQLAlchemy()
 
@@ -14,7 +16,7 @@ class User(UserMixin, db.Model):
     name = db.Column(db.String(100), nullable=False)
     role = db.Column(db.String(20), nullable=False, default='user')  # 'user', 'admin', 'super_admin'
     google_id = db.Column(db.String(100), unique=True, nullable=True)
-    password_hash = db.Column(db.String(128), nullable=True)
+    password_hash = db.Column(db.String(256), nullable=True)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime, nullable=True)
@@ -22,12 +24,10 @@ class User(UserMixin, db.Model):
     # 인증 관련 필드
     is_verified = db.Column(db.Boolean, default=False)  # 인증 완료 여부
     verification_method = db.Column(db.String(20), nullable=True)  # 'email', 'code', 'auto'
-    verification_code = db.Column(db.String(10), nullable=True)  # 인증 코드
-    verification_code_expires = db.Column(db.DateTime, nullable=True)  # 인증 코드 만료 시간
     verified_at = db.Column(db.DateTime, nullable=True)  # 인증 완료 시간
     
     # 개인정보 보호 비밀번호
-    privacy_password_hash = db.Column(db.String(128), nullable=True)  # 개인정보 열람 비밀번호
+    privacy_password_hash = db.Column(db.String(256), nullable=True)  # 개인정보 열람 비밀번호
     
     # 활성 세션 관리
     active_token = db.Column(db.Text, nullable=True)  # 현재 활성화된 JWT 토큰
@@ -40,38 +40,47 @@ class User(UserMixin, db.Model):
         return f'<User {self.email}>'
     
     def set_password(self, password):
-        """비밀번호 해시화"""
-        self.password_hash = generate_password_hash(password)
+        """비밀번호 해시화 (전용 해시 스레드 풀에서 실행)"""
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
-        """비밀번호 확인"""
-        return check_password_hash(self.password_hash, password)
+        """비밀번호 확인
+        
+        해시 알고리즘/비용 설정이 바뀐 경우 검증 성공 시 새 설정으로 다시 해시합니다.
+        (변경된 password_hash 는 호출하는 쪽에서 커밋)
+        """
+        if not verify_password(self.password_hash, password):
+            return False
+        if needs_rehash(self.password_hash):
+            self.password_hash = hash_password(password)
+        return True
     
     def set_privacy_password(self, password):
         """개인정보 보호 비밀번호 해시화"""
-        self.privacy_password_hash = generate_password_hash(password)
+        self.privacy_password_hash = hash_password(password)
     
     def check_privacy_password(self, password):
         """개인정보 보호 비밀번호 확인"""
         if not self.privacy_password_hash:
             return False
-        return check_password_hash(self.privacy_password_hash, password)
-    
-    def to_dict(self):
-        """딕셔너리 형태로 변환"""
-        return {
-            'id': self.id,
-            'email': self.email,
-            'name': self.name,
-            'role': self.role,
-            'google_id': self.google_id,
-            'is_active': self.is_active,
-            'is_verified': self.is_verified,
-            'verification_method': self.verification_method,
-            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
-            'last_login': self.last_login.strftime('%Y-%m-%d %H:%M:%S') if self.last_login else None,
-            'verified_at': self.verified_at.strftime('%Y-%m-%d %H:%M:%S') if self.verified_at else None
-        }
+        return verify_password(self.privacy_password_hash, password)
+    
+    # to_dict 로 내보내는 필드 (목록 조회 시 load_only 대상, 토큰 컬럼 등은 제외)
+    DICT_FIELDS = (
+        'id', 'email', 'name', 'role', 'google_id', 'is_active', 'is_verified',
+        'verification_method', 'created_at', 'last_login', 'verified_at'
+    )
+    DATETIME_FIELDS = ('created_at', 'last_login', 'verified_at')
+    
+    def to_dict(self, fields=None):
+        """딕셔너리 형태로 변환 (fields 지정 시 해당 필드만)"""
+        result = {}
+        for field in fields or self.DICT_FIELDS:
+            value = getattr(self, field)
+            if field in self.DATETIME_FIELDS:
+                value = value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+            result[field] = value
+        return result
 
 class Club(db.Model):
     """볼링 클럽 모델"""
@@ -487,10 +496,12 @@ class Point(db.Model):
     amount = db.Column(db.Integer, nullable=False)
     reason = db.Column(db.String(100), nullable=True)
     note = db.Column(db.Text, nullable=True)
+    payment_id = db.Column(db.Integer, db.ForeignKey('payments.id', ondelete='SET NULL'), nullable=True, index=True)  # 포인트 납부 연동 납입 내역 ID
     created_at = db.Column(db.DateTime, default=datetime.utcnow)  # 시스템 등록 시간
     
     # 관계 설정
     member = db.relationship('Member', backref=db.backref('points', lazy=True))
+    payment = db.relationship('Payment', backref=db.backref('linked_points', lazy=True))
     
     def __repr__(self):
         return f'<Point {self.member.name} {self.point_type} {self.amount}>'
@@ -511,14 +522,28 @@ class Message(db.Model):
     sender = db.relationship('User', foreign_keys=[sender_id], backref=db.backref('sent_messages', lazy=True))
     receiver = db.relationship('User', foreign_keys=[receiver_id], backref=db.backref('received_messages', lazy=True))
 
-    def to_dict(self, current_user_id=None):
-        """프론트용 딕셔너리 변환"""
+    # 대화별 조회용 인덱스 idx_messages_conversation
+    # (least(sender_id, receiver_id), greatest(sender_id, receiver_id), id) 는
+    # migrations/add_messages_conversation_index.sql 에서 생성
+    
+    def to_dict(self, current_user_id=None, user_names=None):
+        """프론트용 딕셔너리 변환
+
+        Args:
+            user_names: {user_id: name} - 지정 시 sender / receiver 관계를 로드하지 않고 이름 조회
+        """
+        if user_names is not None:
+            sender_name = user_names.get(self.sender_id)
+            receiver_name = user_names.get(self.receiver_id)
+        else:
+            sender_name = self.sender.name if self.sender else None
+            receiver_name = self.receiver.name if self.receiver else None
         return {
             'id': self.id,
             'sender_id': self.sender_id,
             'receiver_id': self.receiver_id,
-            'sender_name': self.sender.name if self.sender else None,
-            'receiver_name': self.receiver.name if self.receiver else None,
+            'sender_name': sender_name,
+            'receiver_name': receiver_name,
             'content': self.content if not self.is_deleted else None,  # 삭제된 메시지는 내용 숨김
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'is_read': self.is_read,
@@ -533,6 +558,28 @@ class Message(db.Model):
             ),
         }
 
+class ConversationSummary(db.Model):
+    """사용자별 1:1 대화 요약 (받은편지함 목록용)
+
+    (user_id, peer_id) 마다 한 행: user_id 입장에서 peer_id 와의 마지막 메시지와
+    안 읽은 메시지 수. 메시지 전송/읽음/삭제 시 같은 트랜잭션에서 갱신한다.
+    """
+    __tablename__ = 'conversation_summary'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    peer_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    last_message_id = db.Column(db.Integer, db.ForeignKey('messages.id'), nullable=True)  # 삭제되지 않은 마지막 메시지
+    last_message_preview = db.Column(db.String(200), nullable=True)
+    last_time = db.Column(db.DateTime, nullable=True)
+    unread_count = db.Column(db.Integer, nullable=False, default=0)  # peer_id 가 보낸 안 읽은 메시지 수
+
+    __table_args__ = (
+        db.Index('idx_conversation_summary_user_last_time', 'user_id', 'last_time'),
+    )
+
+    def __repr__(self):
+        return f'<ConversationSummary {self.user_id}-{self.peer_id}>'
+
 class Inquiry(db.Model):
     """문의하기 모델"""
     __tablename__ = 'inquiries'
@@ -548,32 +595,58 @@ class Inquiry(db.Model):
     replied_at = db.Column(db.DateTime, nullable=True)  # 답변 시간
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # 검색용 tsvector (제목 + 내용 + 답변, DB 생성 컬럼 / 검색 시에만 사용)
+    search_vector = deferred(db.Column(TSVECTOR, db.Computed(
+        "to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(content, '') || ' ' || coalesce(reply, ''))",
+        persisted=True
+    )))
     
     # 관계
     user = db.relationship('User', foreign_keys=[user_id], backref=db.backref('inquiries', lazy=True))
     club = db.relationship('Club', backref=db.backref('inquiries', lazy=True))
     replier = db.relationship('User', foreign_keys=[replied_by])
     
-    def to_dict(self):
-        """프론트용 딕셔너리 변환"""
-        return {
+    def to_dict(self, preloaded=None):
+        """프론트용 딕셔너리 변환
+
+        Args:
+            preloaded: 목록 조회 시 미리 조회한 값
+                       {'user_name', 'user_role', 'replier_name', 'club_name', 'reply_comment_count'}
+                       지정 시 user / replier / club / reply_comments 관계를 로드하지 않고
+                       reply_comments 대신 reply_comment_count 를 반환
+        """
+        if preloaded is not None:
+            user_name = preloaded.get('user_name')
+            user_role = preloaded.get('user_role')
+            club_name = preloaded.get('club_name')
+            replier_name = preloaded.get('replier_name')
+        else:
+            user_name = self.user.name if self.user else None
+            user_role = self.user.role if self.user else None
+            club_name = self.club.name if self.club else None
+            replier_name = self.replier.name if self.replier else None
+        data = {
             'id': self.id,
             'user_id': self.user_id,
-            'user_name': self.user.name if self.user else None,
-            'user_role': self.user.role if self.user else None,  # 작성자 role 추가
+            'user_name': user_name,
+            'user_role': user_role,  # 작성자 role 추가
             'club_id': self.club_id,
-            'club_name': self.club.name if self.club else None,
+            'club_name': club_name,
             'title': self.title,
             'content': self.content,
             'is_private': self.is_private,
             'reply': self.reply,
             'replied_by': self.replied_by,
-            'replier_name': self.replier.name if self.replier else None,
+            'replier_name': replier_name,
             'replied_at': self.replied_at.strftime('%Y-%m-%d %H:%M:%S') if self.replied_at else None,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
-            'reply_comments': [comment.to_dict() for comment in self.reply_comments] if self.reply_comments else [],
         }
+        if preloaded is not None:
+            data['reply_comment_count'] = preloaded.get('reply_comment_count', 0)
+        else:
+            data['reply_comments'] = [comment.to_dict() for comment in self.reply_comments] if self.reply_comments else []
+        return data
     
     def __repr__(self):
         return f'<Inquiry {self.id} by {self.user_id}>'
@@ -596,25 +669,35 @@ class InquiryReplyComment(db.Model):
     parent = db.relationship('InquiryReplyComment', remote_side=[id], backref=db.backref('replies', lazy=True))
     likes = db.relationship('InquiryReplyCommentLike', backref='comment', lazy=True, cascade='all, delete-orphan')
     
-    def to_dict(self, current_user_id=None):
-        """프론트용 딕셔너리 변환"""
-        is_liked = False
-        if current_user_id:
-            is_liked = any(like.user_id == current_user_id for like in self.likes)
+    def to_dict(self, current_user_id=None, user_name=None, like_count=None, is_liked=None, replies=None):
+        """프론트용 딕셔너리 변환
+
+        Args:
+            user_name / like_count / is_liked / replies: 미리 조회한 값
+                - 지정 시 user / likes / replies 관계를 로드하지 않음
+        """
+        if user_name is None:
+            user_name = self.user.name if self.user else None
+        if like_count is None:
+            like_count = len(self.likes)
+        if is_liked is None:
+            is_liked = bool(current_user_id) and any(like.user_id == current_user_id for like in self.likes)
+        if replies is None:
+            replies = [reply.to_dict(current_user_id) for reply in self.replies] if self.replies else []
         
         return {
             'id': self.id,
             'inquiry_id': self.inquiry_id,
             'user_id': self.user_id,
             'parent_id': self.parent_id,
-            'user_name': self.user.name if self.user else None,
-            'author_name': self.user.name if self.user else None,  # 게시판과 호환성을 위해 추가
+            'user_name': user_name,
+            'author_name': user_name,  # 게시판과 호환성을 위해 추가
             'content': self.content,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
-            'like_count': len(self.likes),
+            'like_count': like_count,
             'is_liked': is_liked,
-            'replies': [reply.to_dict(current_user_id) for reply in self.replies] if self.replies else []
+            'replies': replies
         }
     
     def __repr__(self):
@@ -658,6 +741,30 @@ class AppSetting(db.Model):
         return f'<AppSetting {self.setting_key}>'
 
 
+class VerificationCode(db.Model):
+    """이메일 인증 / 비밀번호 재설정 코드 (이메일 + 용도별 1개)"""
+    __tablename__ = 'verification_codes'
+
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(120), nullable=False)
+    purpose = db.Column(db.String(20), nullable=False)  # 'verify', 'password_reset'
+    code = db.Column(db.String(10), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('email', 'purpose', name='unique_verification_code_email_purpose'),
+        db.Index('idx_verification_codes_expires_at', 'expires_at'),
+    )
+
+    @property
+    def is_expired(self):
+        return self.expires_at < datetime.utcnow()
+
+    def __repr__(self):
+        return f'<VerificationCode {self.email} {self.purpose}>'
+
+
 class FundState(db.Model):
     """회비 시작 월 및 시작 잔액 보관"""
     __tablename__ = 'fund_state'
@@ -691,6 +798,9 @@ class FundLedger(db.Model):
     # 관계
     payment = db.relationship('Payment', backref=db.backref('fund_entries', lazy=True))
 
+    # 결제 1건당 장부 항목 1개 보장 (INSERT ... ON CONFLICT 대상)
+    __table_args__ = (db.Index('idx_fund_ledger_payment_id_unique', 'payment_id', unique=True),)
+
     def __repr__(self):
         return f'<FundLedger {self.entry_type} {self.amount} {self.source}>'
 
@@ -784,8 +894,16 @@ class Post(db.Model):
     post_type = db.Column(db.String(20), nullable=False, default='free')  # 'free', 'notice'
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     club_id = db.Column(db.Integer, db.ForeignKey('clubs.id'), nullable=True)  # 클럽 ID
+    # 좋아요 / 댓글 수 (좋아요 토글, 댓글 작성/삭제 시 UPDATE ... SET x = x ± 1 로 갱신)
+    like_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    comment_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # 검색용 tsvector (제목 + 내용, DB 생성 컬럼 / 검색 시에만 사용)
+    search_vector = deferred(db.Column(TSVECTOR, db.Computed(
+        "to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(content, ''))",
+        persisted=True
+    )))
     
     # 관계
     author = db.relationship('User', backref=db.backref('posts', lazy=True))
@@ -793,6 +911,12 @@ class Post(db.Model):
     comments = db.relationship('Comment', backref='post', lazy=True, cascade='all, delete-orphan')
     likes = db.relationship('Like', backref='post', lazy=True, cascade='all, delete-orphan')
     
+    # 클럽 게시글 목록 페이지 (종류별 / 전체) - utils/global_posts
+    __table_args__ = (
+        db.Index('idx_posts_club_type_created', club_id, post_type, created_at.desc(), id.desc()),
+        db.Index('idx_posts_club_created', club_id, created_at.desc(), id.desc()),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -807,8 +931,8 @@ class Post(db.Model):
             'is_global': self.club_id is None,  # 전체 게시글 여부
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
-            'comment_count': len(self.comments),
-            'like_count': len(self.likes),
+            'comment_count': self.comment_count or 0,
+            'like_count': self.like_count or 0,
             'images': [img.url for img in self.images]
         }
 
@@ -835,26 +959,42 @@ class Comment(db.Model):
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     parent_id = db.Column(db.Integer, db.ForeignKey('comments.id'), nullable=True)  # 대댓글용
     content = db.Column(db.Text, nullable=False)
+    # 업(좋아요) 수 (업 토글 시 UPDATE ... SET like_count = like_count ± 1 로 갱신)
+    like_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # 검색용 tsvector (DB 생성 컬럼 / 검색 시에만 사용)
+    search_vector = deferred(db.Column(TSVECTOR, db.Computed(
+        "to_tsvector('simple'::regconfig, coalesce(content, ''))",
+        persisted=True
+    )))
     
     # 관계
     author = db.relationship('User', backref=db.backref('comments', lazy=True))
     parent = db.relationship('Comment', remote_side=[id], backref=db.backref('replies', lazy=True))
     likes = db.relationship('CommentLike', backref='comment', lazy=True, cascade='all, delete-orphan')
     
-    def to_dict(self):
+    def to_dict(self, author_name=None, replies=None):
+        """프론트용 딕셔너리 변환
+
+        Args:
+            author_name / replies: 미리 조회한 값 - 지정 시 author / replies 관계를 로드하지 않음
+        """
+        if author_name is None:
+            author_name = self.author.name if self.author else None
+        if replies is None:
+            replies = [reply.to_dict() for reply in self.replies] if self.replies else []
         return {
             'id': self.id,
             'post_id': self.post_id,
             'author_id': self.author_id,
             'parent_id': self.parent_id,
-            'author_name': self.author.name if self.author else None,
+            'author_name': author_name,
             'content': self.content,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
-            'like_count': len(self.likes),
-            'replies': [reply.to_dict() for reply in self.replies] if self.replies else []
+            'like_count': self.like_count or 0,
+            'replies': replies
         }
 
 
@@ -906,6 +1046,64 @@ class Like(db.Model):
         }
 
 
+class ScheduleRecurrence(db.Model):
+    """정기 일정 규칙 모델 (정기전)
+
+    발생 일정은 조회 시 계산하지 않고 schedules 행으로 미리 생성합니다 (utils/recurrence.py).
+    """
+    __tablename__ = 'schedule_recurrences'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id'), nullable=False)
+    schedule_type = db.Column(db.String(20), nullable=False, default='regular')
+    title = db.Column(db.String(200), nullable=False)
+    time = db.Column(db.Time, nullable=False)
+    max_participants = db.Column(db.Integer, nullable=False, default=18)
+    description = db.Column(db.Text, nullable=True)
+    day_of_week = db.Column(db.Integer, nullable=False)  # 0: 일요일 ~ 6: 토요일
+    week_type = db.Column(db.String(10), nullable=False, default='all')  # 'all', 'even', 'odd' (월 안에서 해당 요일의 몇 번째인지 기준)
+    frequency = db.Column(db.Integer, nullable=False, default=4)  # 월 최대 횟수
+    starts_on = db.Column(db.Date, nullable=False)
+    ends_on = db.Column(db.Date, nullable=True)
+    materialized_until = db.Column(db.Date, nullable=True)  # 이 날짜까지 일정 생성 완료 (이후만 새로 생성)
+    is_active = db.Column(db.Boolean, nullable=False, default=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ScheduleRecurrence {self.club_id} {self.title}>'
+    
+    def to_config(self):
+        """발생 일정의 recurring_config 값"""
+        return {
+            'day_of_week': self.day_of_week,
+            'week_type': self.week_type,
+            'frequency': self.frequency,
+        }
+    
+    def to_dict(self):
+        """딕셔너리 형태로 변환"""
+        return {
+            'id': self.id,
+            'club_id': self.club_id,
+            'schedule_type': self.schedule_type,
+            'title': self.title,
+            'time': self.time.strftime('%H:%M') if self.time else None,
+            'max_participants': self.max_participants,
+            'description': self.description,
+            'day_of_week': self.day_of_week,
+            'week_type': self.week_type,
+            'frequency': self.frequency,
+            'starts_on': self.starts_on.strftime('%Y-%m-%d') if self.starts_on else None,
+            'ends_on': self.ends_on.strftime('%Y-%m-%d') if self.ends_on else None,
+            'materialized_until': self.materialized_until.strftime('%Y-%m-%d') if self.materialized_until else None,
+            'is_active': self.is_active,
+            'created_by': self.created_by,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
+        }
+
+
 class Schedule(db.Model):
     """일정 모델 (정기전, 벙, 이벤트전)"""
     __tablename__ = 'schedules'
@@ -920,10 +1118,14 @@ class Schedule(db.Model):
     description = db.Column(db.Text, nullable=True)
     is_recurring = db.Column(db.Boolean, default=False)  # 정기전 여부
     recurring_config = db.Column(db.JSON, nullable=True)  # 정기전 설정: { "day_of_week": 1, "week_type": "all|even|odd", "frequency": 4 }
+    recurrence_id = db.Column(db.Integer, db.ForeignKey('schedule_recurrences.id', ondelete='SET NULL'), nullable=True)  # 정기 일정 규칙으로 생성된 일정
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # 규칙당 같은 날짜 일정은 하나 (일정 생성을 다시 실행해도 중복 없음)
+    __table_args__ = (db.UniqueConstraint('recurrence_id', 'date', name='unique_schedule_recurrence_date'),)
+    
     # 관계
     club = db.relationship('Club', backref=db.backref('schedules', lazy=True))
     creator = db.relationship('User', backref=db.backref('created_schedules', lazy=True))
@@ -932,8 +1134,13 @@ class Schedule(db.Model):
     def __repr__(self):
         return f'<Schedule {self.title} {self.date}>'
     
-    def to_dict(self, include_attendances=False):
-        """딕셔너리 형태로 변환"""
+    def to_dict(self, include_attendances=False, preloaded=None):
+        """딕셔너리 형태로 변환
+
+        Args:
+            preloaded: 목록 조회 시 미리 조회한 값 {'attendance_count', 'waitlist_count', 'attendances'}
+                       지정 시 attendances 관계를 로드하지 않음 (utils/schedule_attendance.py)
+        """
         data = {
             'id': self.id,
             'club_id': self.club_id,
@@ -945,16 +1152,23 @@ class Schedule(db.Model):
             'description': self.description,
             'is_recurring': self.is_recurring,
             'recurring_config': self.recurring_config,
+            'recurrence_id': self.recurrence_id,
             'created_by': self.created_by,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
         }
         
+        if preloaded is not None:
+            if include_attendances:
+                data['attendances'] = preloaded.get('attendances', [])
+            data['attendance_count'] = preloaded.get('attendance_count', 0)
+            data['waitlist_count'] = preloaded.get('waitlist_count', 0)
+            return data
+        
         if include_attendances:
             data['attendances'] = [att.to_dict() for att in self.attendances]
-            data['attendance_count'] = len([att for att in self.attendances if att.status == 'attending'])
-        else:
-            data['attendance_count'] = len([att for att in self.attendances if att.status == 'attending'])
+        data['attendance_count'] = len([att for att in self.attendances if att.status == 'attending'])
+        data['waitlist_count'] = len([att for att in self.attendances if att.status == 'waiting'])
         
         return data
 
@@ -966,7 +1180,8 @@ class ScheduleAttendance(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     schedule_id = db.Column(db.Integer, db.ForeignKey('schedules.id'), nullable=False)
     member_id = db.Column(db.Integer, db.ForeignKey('members.id'), nullable=False)
-    status = db.Column(db.String(20), nullable=False, default='attending')  # 'attending', 'rejected'
+    status = db.Column(db.String(20), nullable=False, default='attending')  # 'attending', 'waiting', 'rejected'
+    waitlisted_at = db.Column(db.DateTime, nullable=True)  # 대기 등록 시각 (대기 순번 기준)
     rejected_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     rejected_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -982,12 +1197,19 @@ class ScheduleAttendance(db.Model):
     def __repr__(self):
         return f'<ScheduleAttendance {self.member_id} - {self.schedule_id} ({self.status})>'
     
-    def to_dict(self):
+    def to_dict(self, preloaded=None):
         """딕셔너리 형태로 변환
 
         참석자 이름은 가능하면 마이페이지(User) 이름을 사용하고,
         없을 경우 기존 Member 이름을 사용합니다.
+
+        Args:
+            preloaded: 목록 조회 시 미리 조회한 값 {'member_name', 'rejector_name'}
+                       지정 시 member / rejector 관계와 User 를 조회하지 않음
         """
+        if preloaded is not None:
+            return self._serialize(preloaded.get('member_name'), preloaded.get('rejector_name'))
+
         member_name = None
 
         # 1. Member가 있고 이메일이 있는 경우, 같은 이메일을 가진 User를 찾아 이름 사용
@@ -1004,14 +1226,18 @@ class ScheduleAttendance(db.Model):
         if not member_name and self.member:
             member_name = self.member.name
 
+        return self._serialize(member_name, self.rejector.name if self.rejector else None)
+
+    def _serialize(self, member_name, rejector_name):
         return {
             'id': self.id,
             'schedule_id': self.schedule_id,
             'member_id': self.member_id,
             'member_name': member_name,
             'status': self.status,
+            'waitlisted_at': self.waitlisted_at.strftime('%Y-%m-%d %H:%M:%S') if self.waitlisted_at else None,
             'rejected_by': self.rejected_by,
-            'rejector_name': self.rejector.name if self.rejector else None,
+            'rejector_name': rejector_name,
             'rejected_at': self.rejected_at.strftime('%Y-%m-%d %H:%M:%S') if self.rejected_at else None,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
             'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S') if self.updated_at else None,
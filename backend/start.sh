@@ -3,13 +3,18 @@
 # PORT 환경변수가 설정되지 않았으면 기본값 5000 사용
 PORT=${PORT:-5000}
 
+# 요청 처리 스레드 수 (config.py 의 GUNICORN_THREADS 와 같은 환경변수)
+# 알림 long-poll 대기(EVENTS_MAX_WAITERS)가 스레드를 점유하므로 일반 요청용 스레드(EVENTS_RESERVED_THREADS)를 남겨 둠
+# 일반 요청용 스레드 수는 DB 커넥션 풀 한도(config.py pool_size + max_overflow) 이하로 유지
+THREADS=${GUNICORN_THREADS:-40}
+
 echo "Starting gunicorn on port $PORT"
 
 # gunicorn 실행
 exec gunicorn app:app \
     --bind "0.0.0.0:${PORT}" \
     --workers 1 \
-    --threads 2 \
+    --threads "${THREADS}" \
     --timeout 120 \
     --log-level debug \
     --access-logfile - \
@@ -0,0 +1,229 @@
+"""
+회원별 참석 이력 분석 (참석률 / 연속 참석 / 노쇼)
+schedule_attendances 를 조회할 때마다 훑지 않도록 클럽마다 회원 × 일정 참석 행렬을
+회원별 비트열(파이썬 int, 비트 i = i번째 일정)로 프로세스 메모리에 만들어 두고,
+기간/일정 종류 조건은 열 마스크로, 집계는 AND + popcount 로 계산합니다.
+
+- 열: 클럽 일정 (날짜, 시간, id 순)
+- attended: 참석('attending') 비트열
+- played: 같은 날짜에 점수 기록이 있는 비트열 → 노쇼 = 지난 일정에 참석으로 남아 있지만 점수 기록이 없음
+
+참석/취소/거부(대기자 승격 포함) 후에는 record_attendance 로 해당 비트만 갱신하고,
+일정 추가/수정/삭제 후에는 invalidate_club_matrix 로 다음 조회 때 다시 만듭니다.
+점수 기록과 다른 워커 프로세스의 변경은 TTL 만료로 반영됩니다.
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from models import db, Schedule, ScheduleAttendance, Member, Score
+from utils.token_cache import InMemoryTokenCache
+
+# 토큰 캐시와 같은 TTL/LRU 구현을 재사용 (키: club_id)
+_matrix_cache = InMemoryTokenCache(ttl_seconds=600, max_size=200)
+
+# 클럽별 변경 세대: 행렬을 만드는 도중 바뀌면 만든 행렬을 캐시에 넣지 않음
+_generations = {}
+_generations_lock = threading.Lock()
+
+
+def init_attendance_analytics(app):
+    """앱 설정에 따라 참석 행렬 캐시 초기화"""
+    global _matrix_cache
+    ttl_seconds = app.config.get('ATTENDANCE_ANALYTICS_CACHE_TTL', 600)
+    max_size = app.config.get('ATTENDANCE_ANALYTICS_CACHE_MAX_SIZE', 200)
+    _matrix_cache = InMemoryTokenCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    return _matrix_cache
+
+
+def _popcount(bits):
+    return bits.bit_count()
+
+
+def _range_mask(start, stop):
+    """[start, stop) 열 비트 마스크"""
+    if stop <= start:
+        return 0
+    return ((1 << (stop - start)) - 1) << start
+
+
+class AttendanceMatrix:
+    """클럽 회원 × 일정 참석 행렬"""
+
+    def __init__(self, club_id, columns, member_names, attended, played):
+        self.club_id = club_id
+        self.columns = columns  # [(schedule_id, date, time, schedule_type)] - 날짜, 시간, id 순
+        self.column_index = {column[0]: index for index, column in enumerate(columns)}
+        self.member_names = member_names  # {member_id: 이름} (삭제되지 않은 회원)
+        self.attended = attended  # {member_id: 비트열}
+        self.played = played  # {member_id: 비트열}
+        self._starts = [(date, time) for _, date, time, _ in columns]
+        self._type_masks = {}
+        for index, (_, _, _, schedule_type) in enumerate(columns):
+            self._type_masks[schedule_type] = self._type_masks.get(schedule_type, 0) | (1 << index)
+        self._lock = threading.Lock()
+
+    def set_attending(self, schedule_id, member_id, attending):
+        """참석 비트 갱신 (행렬에 없는 일정이면 False)"""
+        index = self.column_index.get(schedule_id)
+        if index is None:
+            return False
+        with self._lock:
+            bits = self.attended.get(member_id, 0)
+            self.attended[member_id] = bits | (1 << index) if attending else bits & ~(1 << index)
+        return True
+
+    def column_mask(self, schedule_type=None, start_date=None, end_date=None, now=None):
+        """조건에 맞는 지난 일정 열 마스크 (날짜 순으로 정렬되어 있어 기간은 연속 구간)"""
+        now = now or datetime.now()
+        lo = bisect_left(self._starts, (start_date,)) if start_date else 0
+        hi = bisect_right(self._starts, (now.date(), now.time()))
+        if end_date:
+            hi = min(hi, bisect_left(self._starts, (end_date + timedelta(days=1),)))
+        mask = _range_mask(lo, hi)
+        if schedule_type:
+            mask &= self._type_masks.get(schedule_type, 0)
+        return mask
+
+    def last_games_mask(self, count, schedule_type=None, now=None):
+        """가장 최근 지난 일정 count 개 열 마스크"""
+        mask = self.column_mask(schedule_type=schedule_type, now=now)
+        while _popcount(mask) > count:
+            mask &= mask - 1  # 가장 오래된 열 제거
+        return mask
+
+    def member_stats(self, mask):
+        """회원별 참석률 / 연속 참석 / 노쇼 (mask 열 기준)"""
+        positions = [index for index in range(mask.bit_length()) if mask >> index & 1]
+        total = len(positions)
+        full = (1 << total) - 1
+        stats = []
+        with self._lock:
+            attended = dict(self.attended)
+        for member_id, name in self.member_names.items():
+            bits = attended.get(member_id, 0) & mask
+            # mask 열만 모은 조밀한 비트열 (비트 j = j번째 일정, 최신이 최상위)
+            dense = 0
+            for j, index in enumerate(positions):
+                if bits >> index & 1:
+                    dense |= 1 << j
+            longest, run = 0, dense
+            while run:
+                run &= run >> 1
+                longest += 1
+            attended_count = _popcount(bits)
+            stats.append({
+                'member_id': member_id,
+                'member_name': name,
+                'games': total,
+                'attended': attended_count,
+                'attendance_rate': round(attended_count / total, 4) if total else 0.0,
+                'current_streak': total - (full & ~dense).bit_length(),
+                'longest_streak': longest,
+                'no_shows': _popcount(bits & ~self.played.get(member_id, 0)),
+            })
+        return stats
+
+    def qualified_members(self, min_attended, last_games, schedule_type='regular', now=None):
+        """최근 last_games 개 일정 중 min_attended 번 이상 참석한 회원"""
+        mask = self.last_games_mask(last_games, schedule_type=schedule_type, now=now)
+        games = _popcount(mask)
+        with self._lock:
+            attended = dict(self.attended)
+        members = []
+        for member_id, name in self.member_names.items():
+            count = _popcount(attended.get(member_id, 0) & mask)
+            if count >= min_attended:
+                members.append({'member_id': member_id, 'member_name': name, 'attended': count, 'games': games})
+        return members
+
+
+def build_club_matrix(club_id):
+    """클럽 참석 행렬 생성 (일정 / 참석 / 점수 날짜 / 회원 각 한 번의 쿼리)"""
+    columns = db.session.query(
+        Schedule.id, Schedule.date, Schedule.time, Schedule.schedule_type
+    ).filter(Schedule.club_id == club_id).order_by(
+        Schedule.date.asc(), Schedule.time.asc(), Schedule.id.asc()
+    ).all()
+    columns = [tuple(column) for column in columns]
+    column_index = {column[0]: index for index, column in enumerate(columns)}
+
+    attended = {}
+    rows = db.session.query(ScheduleAttendance.schedule_id, ScheduleAttendance.member_id).join(
+        Schedule, ScheduleAttendance.schedule_id == Schedule.id
+    ).filter(
+        Schedule.club_id == club_id,
+        ScheduleAttendance.status == 'attending'
+    ).all()
+    for schedule_id, member_id in rows:
+        index = column_index.get(schedule_id)
+        if index is None:
+            continue  # 일정 조회 이후 추가된 일정 (다음 생성 때 반영)
+        attended[member_id] = attended.get(member_id, 0) | (1 << index)
+
+    # 날짜별 열 마스크 (같은 날 일정이 여럿이면 모두)
+    date_masks = {}
+    for index, (_, schedule_date, _, _) in enumerate(columns):
+        date_masks[schedule_date] = date_masks.get(schedule_date, 0) | (1 << index)
+    played = {}
+    if date_masks:
+        rows = db.session.query(Score.member_id, Score.game_date).filter(
+            Score.club_id == club_id,
+            Score.game_date.between(columns[0][1], columns[-1][1])
+        ).distinct().all()
+        for member_id, game_date in rows:
+            played[member_id] = played.get(member_id, 0) | date_masks.get(game_date, 0)
+
+    member_names = dict(db.session.query(Member.id, Member.name).filter(
+        Member.club_id == club_id,
+        Member.is_deleted == False
+    ).all())
+    return AttendanceMatrix(club_id, columns, member_names, attended, played)
+
+
+def get_club_matrix(club_id):
+    """클럽 참석 행렬 (캐시 미스 시에만 생성)"""
+    club_id = int(club_id)
+    matrix = _matrix_cache.get(club_id)
+    if matrix is not None:
+        return matrix
+
+    generation = _generations.get(club_id, 0)
+    matrix = build_club_matrix(club_id)
+    with _generations_lock:
+        if generation == _generations.get(club_id, 0):
+            _matrix_cache.set(club_id, matrix)
+    return matrix
+
+
+def _bump_generation(club_id):
+    with _generations_lock:
+        _generations[club_id] = _generations.get(club_id, 0) + 1
+
+
+def record_attendance(club_id, schedule_id, changes):
+    """참석 상태 변경 반영 (커밋 후 호출)
+
+    Args:
+        changes: [(member_id, 참석 여부)]
+    """
+    if club_id is None:
+        return
+    club_id = int(club_id)
+    _bump_generation(club_id)
+    matrix = _matrix_cache.get(club_id)
+    if matrix is None:
+        return
+    for member_id, attending in changes:
+        if member_id not in matrix.member_names or not matrix.set_attending(schedule_id, member_id, attending):
+            # 행렬을 만든 뒤 추가된 회원(참석 신청 시 자동 생성 등) 또는 일정 → 다시 생성
+            _matrix_cache.delete(club_id)
+            return
+
+
+def invalidate_club_matrix(club_id):
+    """일정 추가/수정/삭제 (커밋) 후 호출"""
+    if club_id is None:
+        return
+    club_id = int(club_id)
+    _bump_generation(club_id)
+    _matrix_cache.delete(club_id)
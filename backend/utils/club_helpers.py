@@ -2,9 +2,16 @@
 클럽 관련 헬퍼 함수들
 기존 API에서 클럽 필터링 및 권한 체크에 사용
 """
-from flask import request
+from functools import wraps
+from flask import request, jsonify
 from flask_jwt_extended import get_jwt_identity
-from models import ClubMember, Club
+from models import Club
+from utils.identity import get_approved_membership
+from utils.role_cache import get_roles
+
+ROLE_HIERARCHY = {'member': 1, 'admin': 2, 'owner': 3}
+SYSTEM_ADMIN_ROLES = ('super_admin', 'admin')
+ROLE_LABELS = {'member': '클럽 회원', 'admin': '관리자', 'owner': '클럽 소유자'}
 
 def get_current_club_id():
     """현재 선택된 클럽 ID 가져오기 (요청 헤더에서)"""
@@ -25,11 +32,7 @@ def require_club_membership(user_id, club_id):
     if not club_id:
         return False, '클럽이 선택되지 않았습니다.'
     
-    membership = ClubMember.query.filter_by(
-        user_id=user_id, 
-        club_id=club_id,
-        status='approved'
-    ).first()
+    membership = get_approved_membership(user_id, club_id)
     if not membership:
         return False, '가입하지 않은 클럽입니다.'
     
@@ -49,25 +52,57 @@ def check_club_permission(user_id, club_id, required_role='member'):
     if not club_id:
         return False, '클럽이 선택되지 않았습니다.'
     
-    # status='approved'인 멤버십만 확인
-    membership = ClubMember.query.filter_by(
-        user_id=user_id, 
-        club_id=club_id,
-        status='approved'
-    ).first()
+    # status='approved'인 멤버십만 확인 (요청 내 1회 조회)
+    membership = get_approved_membership(user_id, club_id)
     
     if not membership:
         return False, '가입하지 않은 클럽이거나 승인되지 않은 클럽입니다.'
     
-    role_hierarchy = {'member': 1, 'admin': 2, 'owner': 3}
-    user_role_level = role_hierarchy.get(membership.role, 0)
-    required_role_level = role_hierarchy.get(required_role, 0)
+    user_role_level = ROLE_HIERARCHY.get(membership.role, 0)
+    required_role_level = ROLE_HIERARCHY.get(required_role, 0)
     
     if user_role_level < required_role_level:
         return False, f'{required_role} 권한이 필요합니다.'
     
     return True, membership
 
+def require_club_role(required_role='member', system_roles=SYSTEM_ADMIN_ROLES):
+    """클럽 역할 권한 데코레이터 (@jwt_required() 아래에 사용)
+
+    X-Club-Id 헤더의 클럽에서 required_role 이상인지 확인합니다.
+    system_roles 에 해당하는 시스템 역할은 클럽 역할과 무관하게 통과합니다.
+    역할은 utils.role_cache 에서 조회하므로 캐시 적중 시 DB 조회가 없습니다.
+
+    Args:
+        required_role: 필요한 최소 클럽 역할 ('member', 'admin', 'owner')
+        system_roles: 클럽 권한 확인을 생략할 시스템 역할 목록
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            club_id = get_current_club_id()
+            if not club_id:
+                return jsonify({'success': False, 'message': '클럽이 선택되지 않았습니다.'}), 400
+
+            user_id = get_jwt_identity()
+            if not user_id:
+                return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+
+            system_role, club_role = get_roles(user_id, club_id)
+            if system_role is None:
+                return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 401
+
+            if system_role not in system_roles:
+                if club_role is None:
+                    return jsonify({'success': False, 'message': '가입하지 않은 클럽이거나 승인되지 않은 클럽입니다.'}), 403
+                if ROLE_HIERARCHY.get(club_role, 0) < ROLE_HIERARCHY.get(required_role, 0):
+                    label = ROLE_LABELS.get(required_role, required_role)
+                    return jsonify({'success': False, 'message': f'{label} 권한이 필요합니다.'}), 403
+
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
 def get_club_or_404(club_id):
     """클럽 조회 (없으면 404)"""
     club = Club.query.get(club_id)
@@ -0,0 +1,69 @@
+"""
+댓글 스레드 로딩 (게시글 댓글 / 문의 답변 댓글 공용)
+댓글마다 좋아요를 따로 조회하지 않고, 댓글 id 목록에 대해 GROUP BY 한 번으로
+좋아요 수와 현재 사용자의 좋아요 여부를 가져온 뒤 메모리에서 트리를 구성합니다.
+"""
+from sqlalchemy import case, func
+from models import db
+
+
+def load_comment_likes(like_model, comment_ids, user_id):
+    """댓글별 좋아요 수 + user_id 가 좋아요를 누른 댓글 (GROUP BY 한 번)
+
+    Args:
+        like_model: comment_id / user_id 컬럼을 가진 좋아요 모델 (CommentLike, InquiryReplyCommentLike)
+        comment_ids: 댓글 id 목록
+        user_id: 현재 사용자 ID
+
+    Returns:
+        tuple: ({comment_id: 좋아요 수}, {좋아요를 누른 comment_id})
+    """
+    if not comment_ids:
+        return {}, set()
+    rows = db.session.query(
+        like_model.comment_id,
+        func.count(like_model.id),
+        func.max(case((like_model.user_id == user_id, 1), else_=0))
+    ).filter(
+        like_model.comment_id.in_(list(comment_ids))
+    ).group_by(like_model.comment_id).all()
+    like_counts = {comment_id: count for comment_id, count, _ in rows}
+    liked_ids = {comment_id for comment_id, _, liked in rows if liked}
+    return like_counts, liked_ids
+
+
+def load_liked_comment_ids(like_model, comment_ids, user_id):
+    """user_id 가 좋아요를 누른 댓글 id (좋아요 수를 별도 컬럼으로 관리하는 경우용)
+
+    load_comment_likes 와 달리 댓글의 좋아요 전체를 GROUP BY 하지 않고 user_id 의 좋아요만 조회합니다.
+
+    Returns:
+        set: 좋아요를 누른 comment_id
+    """
+    if not comment_ids:
+        return set()
+    rows = db.session.query(like_model.comment_id).filter(
+        like_model.user_id == user_id,
+        like_model.comment_id.in_(list(comment_ids))
+    ).all()
+    return {comment_id for comment_id, in rows}
+
+
+def build_comment_tree(comments, serialize):
+    """parent_id 기준으로 댓글 트리 구성 (comments 의 순서 유지)
+
+    Args:
+        comments: 스레드의 댓글 전체 (대댓글 포함)
+        serialize: serialize(comment, replies) -> dict
+
+    Returns:
+        list: 최상위 댓글 dict 목록
+    """
+    children = {}
+    for comment in comments:
+        children.setdefault(comment.parent_id, []).append(comment)
+
+    def build(comment):
+        return serialize(comment, [build(child) for child in children.get(comment.id, [])])
+
+    return [build(comment) for comment in children.get(None, [])]
@@ -0,0 +1,113 @@
+"""
+1:1 대화 요약 (conversation_summary 테이블) 관리
+받은편지함(대화 목록)을 메시지 전체가 아닌 (user_id, peer_id) 요약 행 한 번의 조회로
+만들 수 있도록 메시지 전송/읽음/삭제 시 같은 트랜잭션에서 요약 행을 갱신합니다.
+커밋은 모두 호출하는 쪽에서 수행합니다.
+"""
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import db, Message, ConversationSummary
+
+# 대화 목록에 보관하는 마지막 메시지 미리보기 길이
+PREVIEW_LENGTH = 200
+
+
+def _preview(content):
+    return (content or '')[:PREVIEW_LENGTH]
+
+
+def _unread_count_query(user_id, peer_id):
+    """peer_id 가 user_id 에게 보낸 안 읽은 메시지 수 (스칼라 서브쿼리)"""
+    return db.session.query(func.count(Message.id)).filter(
+        Message.sender_id == peer_id,
+        Message.receiver_id == user_id,
+        Message.is_read == False,
+        Message.is_deleted == False
+    ).scalar_subquery()
+
+
+def record_message(message):
+    """새 메시지를 보낸 사람/받는 사람 양쪽 요약에 반영 (message.id 가 필요하므로 flush 후 호출)
+
+    - 마지막 메시지: 동시 전송 시에도 id 가 더 큰 메시지만 반영
+    - 안 읽은 수: 받는 사람 쪽 요약만 1 증가
+    """
+    table = ConversationSummary.__table__
+    sides = {(message.sender_id, message.receiver_id): 0}
+    sides[(message.receiver_id, message.sender_id)] = 0 if message.is_read else 1
+
+    for (user_id, peer_id), unread in sides.items():
+        stmt = pg_insert(table).values(
+            user_id=user_id,
+            peer_id=peer_id,
+            last_message_id=message.id,
+            last_message_preview=_preview(message.content),
+            last_time=message.created_at,
+            unread_count=unread,
+        )
+        is_newer = or_(
+            table.c.last_message_id.is_(None),
+            stmt.excluded.last_message_id > table.c.last_message_id
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.peer_id],
+            set_={
+                'last_message_id': case((is_newer, stmt.excluded.last_message_id), else_=table.c.last_message_id),
+                'last_message_preview': case((is_newer, stmt.excluded.last_message_preview), else_=table.c.last_message_preview),
+                'last_time': case((is_newer, stmt.excluded.last_time), else_=table.c.last_time),
+                'unread_count': table.c.unread_count + stmt.excluded.unread_count,
+            },
+        )
+        db.session.execute(stmt)
+
+
+def decrement_unread_counts(user_id, read_counts):
+    """읽음 처리한 메시지 수만큼 user_id 쪽 요약의 안 읽은 수 차감 (한 번의 UPDATE)
+
+    0 으로 초기화하지 않고 차감하므로, 읽음 처리 도중 새로 도착한 메시지는 안 읽은 수에 남는다.
+
+    Args:
+        read_counts: {peer_id: 읽음 처리한 메시지 수}
+    """
+    if not read_counts:
+        return
+    decrement = case(read_counts, value=ConversationSummary.peer_id, else_=0)
+    ConversationSummary.query.filter(
+        ConversationSummary.user_id == user_id,
+        ConversationSummary.peer_id.in_(list(read_counts))
+    ).update(
+        {'unread_count': case(
+            (ConversationSummary.unread_count > decrement, ConversationSummary.unread_count - decrement),
+            else_=0
+        )},
+        synchronize_session=False
+    )
+
+
+def refresh_conversation(user_a_id, user_b_id):
+    """메시지 삭제 등으로 마지막 메시지가 바뀔 수 있을 때 두 사용자 양쪽 요약을 다시 계산"""
+    last_message = Message.query.filter(
+        or_(
+            (Message.sender_id == user_a_id) & (Message.receiver_id == user_b_id),
+            (Message.sender_id == user_b_id) & (Message.receiver_id == user_a_id)
+        ),
+        Message.is_deleted == False
+    ).order_by(Message.id.desc()).first()
+
+    for user_id, peer_id in {(user_a_id, user_b_id), (user_b_id, user_a_id)}:
+        ConversationSummary.query.filter_by(user_id=user_id, peer_id=peer_id).update(
+            {
+                'last_message_id': last_message.id if last_message else None,
+                'last_message_preview': _preview(last_message.content) if last_message else None,
+                'last_time': last_message.created_at if last_message else None,
+                'unread_count': _unread_count_query(user_id, peer_id),
+            },
+            synchronize_session=False
+        )
+
+
+def delete_user_conversations(user_id):
+    """사용자 삭제 전 해당 사용자가 포함된 요약 행 삭제"""
+    ConversationSummary.query.filter(
+        or_(ConversationSummary.user_id == user_id, ConversationSummary.peer_id == user_id)
+    ).delete(synchronize_session=False)
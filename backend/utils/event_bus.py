@@ -0,0 +1,185 @@
+"""
+실시간 알림용 이벤트 버스 (long-poll 알림 채널 /api/events/poll 용)
+새 메시지, 문의/가입 요청 변경 등을 토픽별로 발행하고, 대기 중인 long-poll 요청을 깨웁니다.
+이벤트는 "무엇이 바뀌었는지" 알리는 용도이며, 카운터 값은 깨어난 요청이 다시 계산합니다.
+
+- 기본: 프로세스 메모리 기반 pub/sub (토픽별 최근 이벤트 버퍼)
+- 멀티 워커 배포: EVENTS_REDIS_URL 설정 시 Redis pub/sub 으로 모든 워커에 전달
+- 토픽: user:<id> (개인), club_admins:<club_id> (클럽 운영진), role:super_admin (슈퍼관리자)
+"""
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+SUPER_ADMIN_TOPIC = 'role:super_admin'
+
+# 이벤트 종류
+EVENT_MESSAGE = 'message'                  # 새 메시지 (수신자)
+EVENT_MESSAGES_READ = 'messages_read'      # 메시지 읽음/삭제 (안 읽은 메시지 수 변경)
+EVENT_INQUIRIES = 'inquiries'              # 답변 대기 문의 수 변경 (운영진/슈퍼관리자)
+EVENT_INQUIRY_REPLIED = 'inquiry_replied'  # 내 문의에 답변 등록/삭제 (작성자)
+EVENT_JOIN_REQUESTS = 'join_requests'      # 클럽 가입 요청 수 변경 (슈퍼관리자)
+
+
+def user_topic(user_id):
+    return f'user:{int(user_id)}'
+
+
+def club_admins_topic(club_id):
+    return f'club_admins:{int(club_id)}'
+
+
+class EventBusBusy(Exception):
+    """동시 대기 요청 수가 가득 찬 경우 (잠시 후 다시 시도)"""
+
+
+class InProcessEventBus:
+    """프로세스 메모리 기반 pub/sub
+
+    발행 순서대로 증가하는 시퀀스를 커서로 사용하며, 대기자는 커서 이후의 이벤트가
+    구독 토픽에 들어오거나 시간이 초과될 때까지 기다립니다.
+    """
+
+    def __init__(self, buffer_size=50, max_topics=10000, max_waiters=32):
+        # 프로세스마다 다른 값 - 재시작되거나 다른 워커로 요청이 가면 커서를 새로 발급
+        self.epoch = uuid.uuid4().hex[:8]
+        self.buffer_size = buffer_size
+        self.max_topics = max_topics
+        self._topics = OrderedDict()  # topic -> deque[(seq, event)]
+        self._seq = 0
+        self._cond = threading.Condition()
+        # 대기 요청이 요청 처리 스레드를 모두 점유하지 않도록 동시 대기 수 제한
+        self._waiter_slots = threading.BoundedSemaphore(max_waiters)
+
+    @property
+    def cursor(self):
+        return self._seq
+
+    def publish(self, topics, event):
+        """이벤트 발행 (topics 의 모든 대기자를 깨움)"""
+        self._dispatch(topics, event)
+
+    def _dispatch(self, topics, event):
+        with self._cond:
+            self._seq += 1
+            for topic in topics:
+                buffer = self._topics.get(topic)
+                if buffer is None:
+                    buffer = self._topics[topic] = deque(maxlen=self.buffer_size)
+                buffer.append((self._seq, event))
+                self._topics.move_to_end(topic)
+            while len(self._topics) > self.max_topics:
+                self._topics.popitem(last=False)
+            self._cond.notify_all()
+
+    def _collect(self, topics, after):
+        events = []
+        for topic in topics:
+            for seq, event in self._topics.get(topic, ()):
+                if seq > after:
+                    events.append((seq, event))
+        events.sort(key=lambda item: item[0])
+        return [event for _, event in events]
+
+    def wait(self, topics, after, timeout):
+        """after 커서 이후 이벤트가 올 때까지 최대 timeout 초 대기
+
+        Returns:
+            tuple: (새 커서, 이벤트 목록) - 시간 초과 시 이벤트 목록은 빈 리스트
+
+        Raises:
+            EventBusBusy: 동시 대기 요청 수 초과
+        """
+        if not self._waiter_slots.acquire(blocking=False):
+            raise EventBusBusy('알림 대기 요청이 많습니다. 잠시 후 다시 시도해주세요.')
+        try:
+            deadline = time.monotonic() + timeout
+            with self._cond:
+                while True:
+                    events = self._collect(topics, after)
+                    remaining = deadline - time.monotonic()
+                    if events or remaining <= 0:
+                        return self._seq, events
+                    self._cond.wait(remaining)
+        finally:
+            self._waiter_slots.release()
+
+    def close(self):
+        pass
+
+
+class RedisEventBus(InProcessEventBus):
+    """Redis pub/sub 으로 모든 워커에 이벤트를 전달하는 이벤트 버스 (멀티 워커 배포용)
+
+    발행은 Redis 채널로만 하고, 각 워커의 수신 스레드가 자기 프로세스의 대기자에게 전달합니다.
+    """
+
+    channel = 'teamcover:events'
+
+    def __init__(self, redis_url, **kwargs):
+        super().__init__(**kwargs)
+        self._client = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: self._on_message})
+        self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def publish(self, topics, event):
+        self._client.publish(self.channel, json.dumps({'topics': list(topics), 'event': event}))
+
+    def _on_message(self, message):
+        try:
+            payload = json.loads(message['data'])
+            self._dispatch(payload['topics'], payload['event'])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    def close(self):
+        self._listener.stop()
+        self._pubsub.close()
+
+
+_bus = InProcessEventBus()
+
+
+def init_event_bus(app):
+    """앱 설정에 따라 이벤트 버스 초기화"""
+    global _bus
+    options = {
+        'buffer_size': app.config.get('EVENTS_BUFFER_SIZE', 50),
+        'max_waiters': app.config.get('EVENTS_MAX_WAITERS', 32),
+    }
+    redis_url = app.config.get('EVENTS_REDIS_URL')
+
+    previous = _bus
+    if redis_url and redis is None:
+        print("⚠️ EVENTS_REDIS_URL 이 설정되었지만 redis 패키지가 없어 메모리 이벤트 버스 사용 (pip install redis)")
+    elif redis_url:
+        try:
+            _bus = RedisEventBus(redis_url, **options)
+            previous.close()
+            return _bus
+        except Exception as e:
+            print(f"⚠️ Redis 이벤트 버스 초기화 실패, 메모리 이벤트 버스 사용: {str(e)}")
+
+    _bus = InProcessEventBus(**options)
+    previous.close()
+    return _bus
+
+
+def get_event_bus():
+    return _bus
+
+
+def publish_event(topics, event_type, **data):
+    """이벤트 발행 (커밋 후 호출). 발행 실패가 요청 처리에 영향을 주지 않도록 예외는 무시"""
+    try:
+        _bus.publish(list(topics), dict(data, type=event_type))
+    except Exception as e:
+        print(f"⚠️ 이벤트 발행 실패 ({event_type}): {str(e)}")
@@ -0,0 +1,126 @@
+"""회비 장부(fund_ledger) 동기화 관련 유틸리티 함수
+
+fund_ledger.payment_id 에는 유니크 인덱스가 걸려 있으므로
+결제 1건당 장부 항목은 최대 1개만 존재한다.
+"""
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import db, FundLedger
+
+
+def payment_should_have_ledger_entry(payment):
+    """결제 반영 조건: 납입완료 + 면제 아님 + 포인트 납부 아님 + 납입일 있음
+
+    금액 0원 결제도 반영한다. _RECONCILE_LEDGER_SQL 의 target 조건과 같아야 한다.
+    """
+    return (
+        payment.payment_date is not None  # 장부 event_date 는 NOT NULL
+        and bool(payment.is_paid)
+        and not bool(payment.is_exempt)
+        and not bool(payment.paid_with_points)  # 포인트 납부는 장부에 기록하지 않음
+    )
+
+
+def upsert_payment_ledger_entry(payment):
+    """결제 레코드를 장부에 반영/삭제한다 (INSERT ... ON CONFLICT).
+
+    동시 요청이 들어와도 payment_id 유니크 인덱스 덕분에 중복 행이 생기지 않는다.
+    커밋은 호출하는 쪽에서 수행한다.
+
+    Returns:
+        bool: 장부 항목이 존재하면 True, 삭제되었으면 False
+    """
+    if not payment_should_have_ledger_entry(payment):
+        FundLedger.query.filter_by(payment_id=payment.id).delete(synchronize_session=False)
+        return False
+
+    values = {
+        'payment_id': payment.id,
+        'club_id': payment.club_id,
+        'event_date': payment.payment_date,
+        'month': payment.month or payment.payment_date.strftime('%Y-%m'),
+        'amount': abs(int(payment.amount)),
+        'source': payment.payment_type,  # 'monthly' or 'game'
+        'entry_type': 'credit' if payment.payment_type in ('monthly', 'game') else 'debit',
+        'note': payment.note,
+    }
+    stmt = pg_insert(FundLedger.__table__).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FundLedger.__table__.c.payment_id],
+        set_={key: stmt.excluded[key] for key in values if key != 'payment_id'},
+    )
+    db.session.execute(stmt)
+    return True
+
+
+# 전체 장부 일괄 보정 (한 번의 set-based 구문)
+# - 반영 조건은 payment_should_have_ledger_entry 와 같음 (요청 처리 경로와 결과가 달라지지 않도록)
+# - 반영 조건을 만족하지 않는 결제의 장부 항목 삭제
+# - 반영 조건을 만족하는 결제는 INSERT ... ON CONFLICT 로 생성/갱신
+_RECONCILE_LEDGER_SQL = text("""
+    WITH target AS (
+        SELECT p.id AS payment_id,
+               p.club_id,
+               p.payment_date AS event_date,
+               COALESCE(p.month, TO_CHAR(p.payment_date, 'YYYY-MM')) AS month,
+               CASE WHEN p.payment_type IN ('monthly', 'game') THEN 'credit' ELSE 'debit' END AS entry_type,
+               ABS(p.amount) AS amount,
+               p.payment_type AS source,
+               p.note
+        FROM payments p
+        WHERE p.payment_date IS NOT NULL
+          AND COALESCE(p.is_paid, FALSE) = TRUE
+          AND COALESCE(p.is_exempt, FALSE) = FALSE
+          AND COALESCE(p.paid_with_points, FALSE) = FALSE
+          AND (CAST(:club_id AS INTEGER) IS NULL OR p.club_id = CAST(:club_id AS INTEGER))
+    ),
+    removed AS (
+        DELETE FROM fund_ledger fl
+        WHERE fl.payment_id IS NOT NULL
+          AND (CAST(:club_id AS INTEGER) IS NULL OR fl.club_id = CAST(:club_id AS INTEGER))
+          AND NOT EXISTS (SELECT 1 FROM target t WHERE t.payment_id = fl.payment_id)
+        RETURNING fl.club_id
+    ),
+    upserted AS (
+        INSERT INTO fund_ledger (payment_id, club_id, event_date, month, entry_type, amount, source, note, created_at)
+        SELECT payment_id, club_id, event_date, month, entry_type, amount, source, note, NOW()
+        FROM target
+        ON CONFLICT (payment_id) DO UPDATE SET
+            club_id = EXCLUDED.club_id,
+            event_date = EXCLUDED.event_date,
+            month = EXCLUDED.month,
+            entry_type = EXCLUDED.entry_type,
+            amount = EXCLUDED.amount,
+            source = EXCLUDED.source,
+            note = EXCLUDED.note
+        WHERE (fund_ledger.club_id, fund_ledger.event_date, fund_ledger.month, fund_ledger.entry_type,
+               fund_ledger.amount, fund_ledger.source, fund_ledger.note)
+              IS DISTINCT FROM
+              (EXCLUDED.club_id, EXCLUDED.event_date, EXCLUDED.month, EXCLUDED.entry_type,
+               EXCLUDED.amount, EXCLUDED.source, EXCLUDED.note)
+        RETURNING fund_ledger.club_id
+    )
+    SELECT 'removed' AS action, club_id FROM removed
+    UNION ALL
+    SELECT 'upserted' AS action, club_id FROM upserted
+""")
+
+
+def reconcile_payment_ledger(club_id=None):
+    """payments 테이블 기준으로 장부 전체를 한 번에 보정한다.
+
+    Args:
+        club_id: 특정 클럽만 보정할 경우 클럽 ID (None이면 전체)
+
+    Returns:
+        dict: {'removed': int, 'upserted': int, 'club_ids': set}
+    """
+    rows = db.session.execute(_RECONCILE_LEDGER_SQL, {'club_id': club_id}).fetchall()
+    db.session.commit()
+
+    result = {'removed': 0, 'upserted': 0, 'club_ids': set()}
+    for action, row_club_id in rows:
+        result[action] += 1
+        if row_club_id is not None:
+            result['club_ids'].add(row_club_id)
+    return result
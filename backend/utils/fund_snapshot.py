@@ -1,8 +1,54 @@
 """회비 및 포인트 스냅샷 관련 유틸리티 함수"""
-from datetime import datetime, date
+from datetime import datetime
+from sqlalchemy import func, case, literal_column
 from models import db, Member, Point, FundLedger, FundBalanceSnapshot
 
 
+def point_signed_amount_expr():
+    """포인트 표시 금액 SQL 식 (적립/보너스는 +, 사용 및 납입 연동 포인트는 -)"""
+    return case(
+        (
+            Point.payment_id.is_(None) & Point.point_type.in_(['적립', '보너스']),
+            Point.amount
+        ),
+        else_=-func.abs(Point.amount)
+    )
+
+
+def get_monthly_point_totals(club_id):
+    """클럽의 월별 포인트 증감 합계 (DB에서 월 단위로 집계)
+
+    탈퇴되지 않은 회원(이름 기준)의 포인트만 집계합니다.
+    포인트 날짜는 point_date 우선, 없으면 created_at을 사용합니다.
+
+    Returns:
+        dict: {'YYYY-MM': 증감 합계}
+    """
+    active_member_names = db.session.query(Member.name).filter(
+        Member.club_id == club_id,
+        Member.is_deleted == False
+    )
+    month_expr = func.to_char(
+        func.coalesce(Point.point_date, func.date(Point.created_at)),
+        literal_column("'YYYY-MM'")  # GROUP BY 식과 동일하도록 리터럴로 고정
+    )
+    rows = db.session.query(
+        month_expr.label('month'),
+        func.sum(point_signed_amount_expr()).label('total')
+    ).join(Member, Member.id == Point.member_id).filter(
+        Point.club_id == club_id,
+        Member.name.in_(active_member_names.scalar_subquery()),
+        func.coalesce(Point.point_date, func.date(Point.created_at)).isnot(None)
+    ).group_by(month_expr).all()
+
+    return {row.month: int(row.total or 0) for row in rows}
+
+
+def cumulative_point_balance(monthly_point_totals, month_key):
+    """해당 월 말일까지의 포인트 누적 잔액"""
+    return sum(total for month, total in monthly_point_totals.items() if month <= month_key)
+
+
 def update_current_month_snapshot(club_id):
     """현재 진행 중인 월의 스냅샷만 업데이트 (장부나 포인트 변경 시 호출)"""
     try:
@@ -22,13 +68,6 @@ def update_current_month_snapshot(club_id):
         if not ledger_items:
             return
 
-        # 포인트 데이터 조회
-        points = Point.query.filter_by(club_id=club_id).order_by(Point.point_date.asc(), Point.created_at.asc()).all()
-        
-        # 탈퇴되지 않은 회원 목록
-        active_members = Member.query.filter_by(club_id=club_id, is_deleted=False).all()
-        active_member_names = {member.name for member in active_members}
-
         # 장부 항목 월별 그룹화
         monthly_data = {}
         for item in ledger_items:
@@ -41,33 +80,8 @@ def update_current_month_snapshot(club_id):
             elif item.entry_type == 'debit':
                 monthly_data[month_key]['debit'] += int(item.amount) or 0
 
-        # 포인트 데이터 월별 그룹화
-        monthly_point_data = {}
-        for point in points:
-            member = Member.query.get(point.member_id) if point.member_id else None
-            if not member or member.name not in active_member_names:
-                continue
-            
-            point_date = point.point_date or point.created_at
-            if isinstance(point_date, str):
-                point_date = datetime.strptime(point_date, '%Y-%m-%d').date()
-            elif isinstance(point_date, datetime):
-                point_date = point_date.date()
-            
-            month_key = point_date.strftime('%Y-%m')
-            if month_key not in monthly_point_data:
-                monthly_point_data[month_key] = 0
-            # 프론트엔드와 동일하게 계산: API의 display_amount 로직 적용
-            # PAYMENT 링크 확인 (프론트엔드와 동일)
-            is_payment_linked = point.note and isinstance(point.note, str) and point.note.startswith('PAYMENT:')
-            display_point_type = '사용' if is_payment_linked else point.point_type
-            # display_amount 계산 (프론트엔드 API와 동일)
-            amount_value = int(point.amount) if point.amount is not None else 0
-            if display_point_type in ['적립', '보너스']:
-                display_amount = amount_value
-            else:
-                display_amount = -abs(amount_value)
-            monthly_point_data[month_key] += display_amount
+        # 포인트 데이터 월별 그룹화 (DB 집계)
+        monthly_point_data = get_monthly_point_totals(club_id)
 
         # 모든 월 목록
         all_data_months = sorted(set(list(monthly_data.keys()) + list(monthly_point_data.keys())))
@@ -111,51 +125,7 @@ def update_current_month_snapshot(club_id):
         month_data = monthly_data.get(current_month, {'credit': 0, 'debit': 0})
 
         # 현재 월 말일까지의 포인트 누적 잔액 계산
-        year, month = map(int, current_month.split('-'))
-        from calendar import monthrange
-        last_day = monthrange(year, month)[1]
-        month_end_date = datetime(year, month, last_day, 23, 59, 59)
-
-        point_balance_for_month = 0
-        points_counted = 0
-        for point in points:
-            member = Member.query.get(point.member_id) if point.member_id else None
-            if not member or member.name not in active_member_names:
-                continue
-            
-            # 포인트 날짜 처리: point_date 우선, 없으면 created_at 사용
-            point_date = point.point_date or point.created_at
-            if point_date is None:
-                continue
-            
-            # 날짜를 datetime 객체로 통일
-            if isinstance(point_date, str):
-                point_date = datetime.strptime(point_date, '%Y-%m-%d')
-            elif isinstance(point_date, date) and not isinstance(point_date, datetime):
-                # date 객체를 datetime으로 변환
-                point_date = datetime.combine(point_date, datetime.min.time())
-            elif isinstance(point_date, datetime):
-                # datetime 객체는 그대로 사용
-                pass
-            else:
-                continue
-            
-            if point_date <= month_end_date:
-                # 프론트엔드와 동일하게 계산: API의 display_amount 로직 적용
-                # PAYMENT 링크 확인 (프론트엔드와 동일)
-                is_payment_linked = point.note and isinstance(point.note, str) and point.note.startswith('PAYMENT:')
-                display_point_type = '사용' if is_payment_linked else point.point_type
-                # display_amount 계산 (프론트엔드 API와 동일)
-                amount_value = int(point.amount) if point.amount is not None else 0
-                if display_point_type in ['적립', '보너스']:
-                    display_amount = amount_value
-                else:
-                    display_amount = -abs(amount_value)
-                point_balance_for_month += display_amount
-                points_counted += 1
-        
-        # 디버깅 로그 (필요시 주석 해제)
-        # print(f'[스냅샷] 클럽 {club_id}, 월 {current_month}: 포인트 잔액={point_balance_for_month}, 계산된 포인트 수={points_counted}, 전체 포인트 수={len(points)}')
+        point_balance_for_month = cumulative_point_balance(monthly_point_data, current_month)
 
         # 현재 월 스냅샷 저장 또는 업데이트
         snapshot = FundBalanceSnapshot.query.filter_by(
@@ -0,0 +1,162 @@
+"""
+전체 게시글(club_id 가 null) 목록 캐시 + 클럽 게시글 목록 병합
+일반 사용자 게시글 목록은 "선택한 클럽 게시글 + 전체 게시글" 인데, 두 조건을 OR 로 묶고
+공지 우선 CASE 로 정렬하면 인덱스 순서로 페이지를 자를 수 없습니다.
+전체 게시글은 모든 클럽이 매번 읽지만 거의 바뀌지 않으므로 정렬 키(작성 시각, id, 종류)만
+프로세스 메모리에 캐시하고, club_id = ? 조건의 인덱스 페이지와 메모리에서 합칩니다.
+
+- 공지 우선 정렬은 "공지" / "그 외" 구간을 나눠 구간별로 (작성 시각, id) 최신순 병합
+- 좋아요/댓글 수 등 자주 바뀌는 값은 캐시하지 않고, 페이지에 들어간 게시글만 id 로 다시 로드
+- 인덱스: migrations/add_posts_club_feed_indexes.sql
+
+게시글 작성/수정/삭제로 전체 게시글이 바뀌면 invalidate_global_posts() 를 호출해야 합니다.
+다른 워커 프로세스의 캐시는 TTL 만료로 정리됩니다.
+"""
+import threading
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import func
+from models import db, Post
+from utils.token_cache import InMemoryTokenCache
+
+# 정렬 키 (작성 시각 최신순, 같으면 id 큰 순)
+PostKey = namedtuple('PostKey', ['created_at', 'id', 'post_type'])
+
+_CACHE_KEY = 'global_posts'
+
+# 토큰 캐시와 같은 TTL 구현을 재사용 (항목은 전체 게시글 키 목록 하나)
+_global_post_cache = InMemoryTokenCache(ttl_seconds=60, max_size=1)
+
+# 무효화 세대: 조회 도중 무효화되면 이전 목록을 캐시에 넣지 않음
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def init_global_post_cache(app):
+    """앱 설정에 따라 전체 게시글 캐시 초기화"""
+    global _global_post_cache
+    ttl_seconds = app.config.get('GLOBAL_POST_CACHE_TTL', 60)
+    _global_post_cache = InMemoryTokenCache(ttl_seconds=ttl_seconds, max_size=1)
+    return _global_post_cache
+
+
+def invalidate_global_posts():
+    """전체 게시글 작성/수정/삭제 (커밋) 후 호출"""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        _global_post_cache.delete(_CACHE_KEY)
+
+
+def _sort_value(key):
+    # PostgreSQL 의 DESC 정렬은 NULL 을 가장 앞에 둠
+    return (key.created_at or datetime.max, key.id)
+
+
+def _precedes(a, b):
+    """최신순 목록에서 a 가 b 보다 앞인지"""
+    return _sort_value(a) > _sort_value(b)
+
+
+def get_global_post_keys():
+    """전체 게시글 정렬 키 목록 (최신순, 캐시 미스 시에만 DB 조회)"""
+    keys = _global_post_cache.get(_CACHE_KEY)
+    if keys is not None:
+        return keys
+
+    generation = _generation
+    rows = db.session.query(Post.created_at, Post.id, Post.post_type).filter(
+        Post.club_id.is_(None)
+    ).all()
+    keys = tuple(sorted((PostKey(*row) for row in rows), key=_sort_value, reverse=True))
+    with _generation_lock:
+        if generation == _generation:
+            _global_post_cache.set(_CACHE_KEY, keys)
+    return keys
+
+
+def _merge_page(cached, fetch_club_keys, offset, limit):
+    """최신순 캐시 목록과 클럽 게시글 쿼리를 합친 목록의 [offset, offset + limit) 구간 id
+
+    합친 목록에서 클럽 게시글은 앞선 캐시 항목 수(최대 len(cached))만큼만 뒤로 밀리므로
+    클럽 쪽은 offset - len(cached) 부터 필요한 만큼만 조회하면 됩니다.
+
+    Args:
+        cached: 최신순 정렬된 전체 게시글 키 목록
+        fetch_club_keys: (offset, limit) -> 같은 순서의 클럽 게시글 키 목록
+    """
+    start = max(offset - len(cached), 0)
+    fetch = offset + limit - start
+    club_keys = fetch_club_keys(start, fetch)
+    if start > 0 and not club_keys:
+        return []
+    exhausted = len(club_keys) < fetch
+
+    # 합친 목록에서의 순위 = 같은 쪽에서의 순번 + 다른 쪽에서 앞선 항목 수
+    ranked = []
+    for index, key in enumerate(club_keys):
+        ahead = sum(1 for other in cached if _precedes(other, key))
+        ranked.append((start + index + ahead, key.id))
+    for index, key in enumerate(cached):
+        if start > 0 and _precedes(key, club_keys[0]):
+            continue  # 조회한 클럽 구간보다 앞 → 이 페이지보다 앞
+        if not exhausted and _precedes(club_keys[-1], key):
+            continue  # 조회한 클럽 구간보다 뒤 → 이 페이지보다 뒤
+        ahead = sum(1 for other in club_keys if _precedes(other, key))
+        ranked.append((index + start + ahead, key.id))
+
+    ranked.sort()
+    return [post_id for rank, post_id in ranked if offset <= rank < offset + limit]
+
+
+def _segments(post_type):
+    """(캐시 항목 조건, 클럽 게시글 SQL 조건) 구간 목록 (목록 순서대로)"""
+    if post_type != 'all':
+        return [(lambda key: key.post_type == post_type, Post.post_type == post_type)]
+    # 전체 조회: 공지사항을 먼저, 그 다음 일반 게시글
+    return [
+        (lambda key: key.post_type == 'notice', Post.post_type == 'notice'),
+        (lambda key: key.post_type != 'notice', Post.post_type != 'notice'),
+    ]
+
+
+def club_feed_page(club_id, post_type, page, per_page):
+    """선택한 클럽 게시글 + 전체 게시글 목록의 한 페이지
+
+    Returns:
+        tuple: (게시글 id 목록 (목록 순서), 전체 개수)
+    """
+    global_keys = get_global_post_keys()
+    segments = [
+        ([key for key in global_keys if matches(key)], condition)
+        for matches, condition in _segments(post_type)
+    ]
+
+    # 구간별 클럽 게시글 수 (한 번의 쿼리)
+    club_counts = db.session.query(*[
+        func.count(Post.id).filter(condition) for _, condition in segments
+    ]).filter(Post.club_id == club_id).one()
+
+    total = sum(club_counts) + sum(len(cached) for cached, _ in segments)
+    offset = max(page - 1, 0) * per_page
+    remaining = per_page
+    post_ids = []
+    for (cached, condition), club_count in zip(segments, club_counts):
+        segment_total = club_count + len(cached)
+        if offset >= segment_total:
+            offset -= segment_total
+            continue
+
+        def fetch_club_keys(start, limit, condition=condition):
+            rows = db.session.query(Post.created_at, Post.id, Post.post_type).filter(
+                Post.club_id == club_id, condition
+            ).order_by(Post.created_at.desc(), Post.id.desc()).offset(start).limit(limit).all()
+            return [PostKey(*row) for row in rows]
+
+        take = min(remaining, segment_total - offset)
+        post_ids.extend(_merge_page(cached, fetch_club_keys, offset, take))
+        remaining -= take
+        offset = 0
+        if remaining <= 0:
+            break
+    return post_ids, total
@@ -0,0 +1,116 @@
+"""
+요청 단위 사용자/클럽 멤버십 컨텍스트
+한 요청 안에서 같은 User / 승인된 ClubMember 를 여러 번 조회하지 않도록
+flask.g 에 요청 수명 동안만 보관합니다.
+"""
+from flask import g, has_request_context
+from flask_jwt_extended import get_jwt_identity
+from models import db, User, ClubMember, Club
+
+_MISSING = object()
+
+
+def _request_cache(name):
+    """요청 단위 캐시 딕셔너리 (요청 컨텍스트 밖에서는 None)"""
+    if not has_request_context():
+        return None
+    cache = g.get(name)
+    if cache is None:
+        cache = {}
+        setattr(g, name, cache)
+    return cache
+
+
+def get_user(user_id):
+    """사용자 조회 (요청 내에서 1회만 조회)"""
+    if not user_id:
+        return None
+    try:
+        user_id = int(user_id)
+    except (ValueError, TypeError):
+        return None
+
+    cache = _request_cache('_identity_users')
+    if cache is None:
+        return User.query.get(user_id)
+
+    user = cache.get(user_id, _MISSING)
+    if user is _MISSING:
+        user = User.query.get(user_id)
+        cache[user_id] = user
+    return user
+
+
+def get_current_user():
+    """JWT 토큰의 현재 사용자 조회 (토큰이 없거나 검증 전이면 None)"""
+    try:
+        user_id = get_jwt_identity()
+    except Exception:
+        return None
+    return get_user(user_id)
+
+
+def get_approved_membership(user_id, club_id):
+    """승인된 클럽 멤버십 조회 (요청 내에서 (user_id, club_id)별 1회만 조회)"""
+    if not user_id or not club_id:
+        return None
+    key = (int(user_id), int(club_id))
+
+    cache = _request_cache('_identity_memberships')
+    if cache is None:
+        return ClubMember.query.filter_by(user_id=key[0], club_id=key[1], status='approved').first()
+
+    membership = cache.get(key, _MISSING)
+    if membership is _MISSING:
+        membership = ClubMember.query.filter_by(user_id=key[0], club_id=key[1], status='approved').first()
+        cache[key] = membership
+    return membership
+
+
+def get_membership_summary(user_id):
+    """로그인 / 내 정보 응답용 클럽 멤버십 요약 (멤버십 + 클럽 이름을 한 번의 조인 쿼리로 조회)
+
+    Returns:
+        dict: {
+            'clubs': 승인된 클럽 목록 [{'id', 'name', 'role', 'status'}],
+            'has_approved_club': bool,
+            'has_pending_membership': bool,
+            'has_membership': bool (상태와 무관하게 멤버십 존재 여부),
+            'pending_requested_at': 승인 대기 멤버십의 요청 시각 목록
+        }
+    """
+    rows = db.session.query(
+        ClubMember.club_id,
+        ClubMember.role,
+        ClubMember.status,
+        ClubMember.requested_at,
+        Club.name
+    ).outerjoin(
+        Club, Club.id == ClubMember.club_id
+    ).filter(
+        ClubMember.user_id == int(user_id)
+    ).order_by(ClubMember.id).all()
+
+    clubs = []
+    pending_requested_at = []
+    has_approved_club = False
+    for club_id, role, status, requested_at, club_name in rows:
+        if status == 'approved':
+            has_approved_club = True
+            if club_name is not None:
+                clubs.append({
+                    'id': club_id,
+                    'name': club_name,
+                    'role': role,
+                    'status': status
+                })
+        elif status == 'pending':
+            pending_requested_at.append(requested_at)
+
+    return {
+        'clubs': clubs,
+        'has_approved_club': has_approved_club,
+        'has_pending_membership': len(pending_requested_at) > 0,
+        'has_membership': len(rows) > 0,
+        'pending_requested_at': pending_requested_at,
+    }
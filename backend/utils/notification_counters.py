@@ -0,0 +1,91 @@
+"""
+알림 카운터 계산 (안 읽은 메시지 / 답변 대기 문의 / 답변 달린 문의 / 클럽 가입 요청)
+개별 카운트 API 와 실시간 알림 채널(/api/events/poll)이 같은 계산을 사용합니다.
+"""
+from sqlalchemy import and_, func, or_
+from models import db, ClubMember, ConversationSummary, Inquiry
+from utils.club_helpers import check_club_permission
+
+
+def unread_message_count(user_id):
+    """안 읽은 메시지 수 (대화 요약 테이블의 안 읽은 수 합계)"""
+    return db.session.query(
+        func.coalesce(func.sum(ConversationSummary.unread_count), 0)
+    ).filter(ConversationSummary.user_id == user_id).scalar()
+
+
+def can_view_unread_inquiries(user, club_id):
+    """답변 대기 문의 알림 대상 여부 (슈퍼관리자 또는 선택된 클럽의 운영진)"""
+    if user.role == 'super_admin':
+        return True
+    if not club_id:
+        return False
+    has_permission, _ = check_club_permission(user.id, club_id, 'admin')
+    return has_permission
+
+
+def unread_inquiry_count(user, club_id):
+    """답변이 없는 문의 수 (슈퍼관리자: 전체, 클럽 운영진: 해당 클럽, 그 외: 0)"""
+    if user.role == 'super_admin':
+        return Inquiry.query.filter(Inquiry.reply.is_(None)).count()
+    if not can_view_unread_inquiries(user, club_id):
+        return 0
+    return Inquiry.query.filter(
+        Inquiry.club_id == club_id,
+        Inquiry.reply.is_(None)
+    ).count()
+
+
+def replied_inquiry_count(user_id):
+    """사용자가 작성한 문의 중 답변이 달린 문의 수"""
+    return Inquiry.query.filter(
+        Inquiry.user_id == user_id,
+        Inquiry.reply.isnot(None)
+    ).count()
+
+
+def inquiry_counts(user, club_id):
+    """답변 대기 문의 수와 내 문의 중 답변 달린 문의 수를 COUNT(*) FILTER 쿼리 한 번으로 계산
+
+    Returns:
+        tuple: (unread_inquiries, replied_inquiries) - unread_inquiry_count / replied_inquiry_count 와 같은 값
+    """
+    mine = Inquiry.user_id == user.id
+    replied = func.count().filter(and_(mine, Inquiry.reply.isnot(None)))
+
+    if user.role == 'super_admin':
+        query = db.session.query(func.count().filter(Inquiry.reply.is_(None)), replied)
+    elif can_view_unread_inquiries(user, club_id):
+        in_club = Inquiry.club_id == club_id
+        query = db.session.query(
+            func.count().filter(and_(in_club, Inquiry.reply.is_(None))), replied
+        ).filter(or_(mine, in_club))
+    else:
+        # 운영진이 아니면 답변 대기 문의 수는 항상 0
+        return 0, db.session.query(replied).filter(mine).scalar() or 0
+
+    unread, replied_count = query.one()
+    return unread or 0, replied_count or 0
+
+
+def pending_join_request_count():
+    """승인 대기 중인 클럽 가입 요청 수"""
+    return ClubMember.query.filter_by(status='pending').count()
+
+
+def get_counters(user, club_id):
+    """사용자에게 해당하는 알림 카운터 전체
+
+    Returns:
+        dict: {'unread_messages', 'unread_inquiries', 'replied_inquiries'}
+              (+ 슈퍼관리자는 'join_requests')
+    """
+    unread_inquiries, replied_inquiries = inquiry_counts(user, club_id)
+    counters = {
+        'unread_messages': unread_message_count(user.id),
+        'unread_inquiries': unread_inquiries,
+        'replied_inquiries': replied_inquiries,
+    }
+    if user.role == 'super_admin':
+        counters['join_requests'] = pending_join_request_count()
+    return counters
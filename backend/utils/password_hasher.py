@@ -0,0 +1,186 @@
+"""
+비밀번호 해시 서비스
+비밀번호 해시/검증은 CPU를 많이 쓰는 작업이므로 요청 스레드에서 바로 실행하지 않고
+전용 스레드 풀(크기 제한)에서 실행합니다. (동시 로그인이 CPU 를 모두 점유해
+다른 API 요청을 막지 않도록)
+
+- 알고리즘/비용: PASSWORD_HASH_ALGORITHM ('pbkdf2:sha256' 또는 'scrypt'), PASSWORD_HASH_COST
+- 동시 해시 작업 수: PASSWORD_HASH_WORKERS, 대기열 크기: PASSWORD_HASH_MAX_PENDING
+- 대기열이 가득 차면 PASSWORD_HASH_WAIT_TIMEOUT 초만 기다린 뒤 PasswordHasherBusy
+  → 엔드포인트는 password_hasher_busy_response 로 503 + Retry-After 반환
+- 설정이 바뀌면 로그인 시 기존 해시를 새 설정으로 다시 해시합니다 (needs_rehash)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import jsonify, make_response
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_ALGORITHM = 'pbkdf2:sha256'
+DEFAULT_COST = {
+    'pbkdf2:sha256': 600000,  # 반복 횟수
+    'scrypt': 32768,          # N (2의 거듭제곱)
+}
+
+
+# 대기열이 가득 찼을 때 클라이언트 재시도 간격(초)
+BUSY_RETRY_AFTER = 2
+
+
+class PasswordHasherBusy(Exception):
+    """해시 대기열이 가득 찬 경우 (잠시 후 다시 시도)"""
+
+
+def password_hasher_busy_response(error):
+    """PasswordHasherBusy → 503 응답 (Retry-After 포함)"""
+    response = make_response(jsonify({
+        'success': False,
+        'message': str(error),
+        'retry_after': BUSY_RETRY_AFTER
+    }), 503)
+    response.headers['Retry-After'] = str(BUSY_RETRY_AFTER)
+    return response
+
+
+class PasswordHasher:
+    """전용 스레드 풀에서 비밀번호 해시/검증을 수행"""
+
+    def __init__(self, algorithm=DEFAULT_ALGORITHM, cost=None, workers=2, max_pending=16, wait_timeout=2):
+        if algorithm not in DEFAULT_COST:
+            raise ValueError(f'지원하지 않는 비밀번호 해시 알고리즘입니다: {algorithm}')
+        self.algorithm = algorithm
+        self.cost = int(cost or DEFAULT_COST[algorithm])
+        self.workers = workers
+        self.wait_timeout = wait_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hasher')
+        # 실행 중 + 대기 중 작업 수 제한
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+
+    @property
+    def method(self):
+        """werkzeug generate_password_hash 에 전달할 method 문자열"""
+        if self.algorithm == 'scrypt':
+            return f'scrypt:{self.cost}:8:1'
+        return f'{self.algorithm}:{self.cost}'
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            raise PasswordHasherBusy('비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.')
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password):
+        """비밀번호 해시 생성"""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """비밀번호 검증 (해시가 없으면 False)"""
+        if not pwhash or password is None:
+            return False
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """저장된 해시가 현재 알고리즘/비용과 다른지 확인"""
+        if not pwhash:
+            return False
+        return pwhash.split('$', 1)[0] != self.method
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_hasher = None
+_hasher_lock = threading.Lock()
+
+
+def init_password_hasher(app):
+    """앱 설정에 따라 비밀번호 해시 서비스 초기화"""
+    global _hasher
+    hasher = PasswordHasher(
+        algorithm=app.config.get('PASSWORD_HASH_ALGORITHM', DEFAULT_ALGORITHM),
+        cost=app.config.get('PASSWORD_HASH_COST'),
+        workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+        max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 16),
+        wait_timeout=app.config.get('PASSWORD_HASH_WAIT_TIMEOUT', 2),
+    )
+    with _hasher_lock:
+        previous, _hasher = _hasher, hasher
+    if previous is not None:
+        previous.shutdown()
+    return hasher
+
+
+def get_password_hasher():
+    """현재 비밀번호 해시 서비스 (초기화 전이면 기본 설정으로 생성)"""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                _hasher = PasswordHasher()
+    return _hasher
+
+
+def hash_password(password):
+    return get_password_hasher().hash(password)
+
+
+def verify_password(pwhash, password):
+    return get_password_hasher().verify(pwhash, password)
+
+
+def needs_rehash(pwhash):
+    return get_password_hasher().needs_rehash(pwhash)
+
+
+def benchmark_password_verification(concurrency=4, total=32, hasher=None):
+    """동시 로그인 상황의 비밀번호 검증 처리량 측정
+
+    Args:
+        concurrency: 동시에 로그인하는 요청(스레드) 수
+        total: 전체 검증 횟수
+        hasher: 측정할 PasswordHasher (기본값: 현재 설정)
+
+    Returns:
+        dict: {'method', 'concurrency', 'total', 'elapsed', 'per_second', 'p50_ms', 'p95_ms'}
+    """
+    hasher = hasher or get_password_hasher()
+    pwhash = hasher.hash('benchmark-password')
+    latencies = []
+    latencies_lock = threading.Lock()
+    remaining = [total]
+
+    def worker():
+        while True:
+            with latencies_lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            started = time.perf_counter()
+            hasher.verify(pwhash, 'benchmark-password')
+            elapsed = time.perf_counter() - started
+            with latencies_lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'method': hasher.method,
+        'concurrency': concurrency,
+        'total': total,
+        'elapsed': elapsed,
+        'per_second': total / elapsed if elapsed else 0.0,
+        'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000 if latencies else 0.0,
+    }
@@ -0,0 +1,244 @@
+"""
+토큰 버킷 기반 요청 제한 (로그인/인증 코드 등 인증 엔드포인트용)
+IP, 이메일, 엔드포인트 조합별로 토큰 버킷을 두고, 버킷이 비면 뷰 함수 실행 전에
+(DB 조회나 비밀번호 해시 전에) 429 로 거절합니다.
+
+- 기본: 프로세스 메모리 기반 버킷
+- 멀티 워커 배포: RATE_LIMIT_REDIS_URL 설정 시 Redis 공유 버킷 사용
+- 로그인 실패 추적: 이메일별 버킷은 로그인 실패 시에만 차감 (record_login_failure)
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import request, jsonify, make_response
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class InMemoryRateLimitStore:
+    """프로세스 메모리 기반 토큰 버킷 저장소"""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def _refill(self, key, capacity, period, now):
+        tokens, updated_at = self._buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - updated_at) * capacity / period)
+        return tokens
+
+    def consume(self, key, capacity, period, cost=1):
+        """토큰 차감 시도
+
+        Returns:
+            tuple: (allowed: bool, retry_after: 초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._refill(key, capacity, period, now)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        if allowed:
+            return True, 0
+        return False, (cost - tokens) * period / capacity
+
+    def peek(self, key, capacity, period, cost=1):
+        """토큰을 차감하지 않고 남은 토큰으로 요청 가능 여부만 확인"""
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._refill(key, capacity, period, now)
+        if tokens >= cost:
+            return True, 0
+        return False, (cost - tokens) * period / capacity
+
+    def reset(self, key):
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+# Redis 토큰 버킷 (원자적 처리를 위해 Lua 스크립트 사용)
+# KEYS[1]: 버킷 키, ARGV: capacity, period, cost, now, apply(1=차감, 0=확인만)
+_REDIS_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local apply = tonumber(ARGV[5])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * capacity / period)
+local allowed = 0
+if tokens >= cost then
+    allowed = 1
+    if apply == 1 then
+        tokens = tokens - cost
+    end
+end
+if apply == 1 then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(period))
+end
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitStore:
+    """Redis 기반 공유 토큰 버킷 저장소 (멀티 워커/멀티 인스턴스 배포용)"""
+
+    key_prefix = 'teamcover:rate_limit:'
+
+    def __init__(self, redis_url):
+        self._client = redis.Redis.from_url(redis_url, decode_responses=True)
+        self._script = self._client.register_script(_REDIS_BUCKET_SCRIPT)
+
+    def _run(self, key, capacity, period, cost, apply):
+        allowed, tokens = self._script(
+            keys=[f'{self.key_prefix}{key}'],
+            args=[capacity, period, cost, time.time(), 1 if apply else 0]
+        )
+        if allowed:
+            return True, 0
+        return False, (cost - float(tokens)) * period / capacity
+
+    def consume(self, key, capacity, period, cost=1):
+        return self._run(key, capacity, period, cost, True)
+
+    def peek(self, key, capacity, period, cost=1):
+        return self._run(key, capacity, period, cost, False)
+
+    def reset(self, key):
+        self._client.delete(f'{self.key_prefix}{key}')
+
+    def clear(self):
+        for key in self._client.scan_iter(f'{self.key_prefix}*'):
+            self._client.delete(key)
+
+
+_store = InMemoryRateLimitStore()
+_enabled = True
+
+
+def init_rate_limiter(app):
+    """앱 설정에 따라 요청 제한 저장소 초기화"""
+    global _store, _enabled
+    _enabled = app.config.get('RATE_LIMIT_ENABLED', True)
+    redis_url = app.config.get('RATE_LIMIT_REDIS_URL')
+
+    if redis_url and redis is None:
+        print("⚠️ RATE_LIMIT_REDIS_URL 이 설정되었지만 redis 패키지가 없어 메모리 저장소 사용 (pip install redis)")
+    elif redis_url:
+        try:
+            _store = RedisRateLimitStore(redis_url)
+            return _store
+        except Exception as e:
+            print(f"⚠️ Redis 요청 제한 저장소 초기화 실패, 메모리 저장소 사용: {str(e)}")
+
+    _store = InMemoryRateLimitStore(max_keys=app.config.get('RATE_LIMIT_MAX_KEYS', 100000))
+    return _store
+
+
+def get_client_ip():
+    """요청 IP 주소
+
+    X-Forwarded-For 는 클라이언트가 임의로 보낼 수 있으므로 직접 읽지 않고,
+    app.py 의 ProxyFix 가 신뢰하는 프록시 단계(TRUSTED_PROXY_COUNT)만 반영한 remote_addr 를 사용
+    """
+    return request.remote_addr or ''
+
+
+def _request_email():
+    """요청 본문의 이메일 (JSON 파싱 실패 시 None)"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return None
+    email = data.get('email')
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return email.strip().lower()
+
+
+def _too_many_requests(retry_after):
+    retry_after = max(1, int(math.ceil(retry_after)))
+    response = make_response(jsonify({
+        'success': False,
+        'message': f'요청이 너무 많습니다. {retry_after}초 후 다시 시도해주세요.',
+        'retry_after': retry_after
+    }), 429)
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+
+def _check(key, limit, consume=True):
+    capacity, period = limit
+    try:
+        if consume:
+            return _store.consume(key, capacity, period)
+        return _store.peek(key, capacity, period)
+    except Exception:
+        return True, 0  # 저장소 오류 시 요청 허용 (가용성 우선)
+
+
+def rate_limit(scope, per_ip=None, per_email=None, email_on_failure=False):
+    """토큰 버킷 요청 제한 데코레이터
+
+    Args:
+        scope: 엔드포인트 구분 이름 (버킷 키에 포함)
+        per_ip: (capacity, period_seconds) - IP별 버킷, period 동안 capacity 만큼 충전
+        per_email: (capacity, period_seconds) - (IP와 무관한) 이메일별 버킷
+        email_on_failure: True 이면 이메일 버킷은 확인만 하고,
+                          차감은 뷰에서 record_login_failure 로 실패 시에만 수행
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled or request.method == 'OPTIONS':
+                return fn(*args, **kwargs)
+
+            if per_ip:
+                allowed, retry_after = _check(f'{scope}:ip:{get_client_ip()}', per_ip)
+                if not allowed:
+                    return _too_many_requests(retry_after)
+
+            if per_email:
+                email = _request_email()
+                if email:
+                    allowed, retry_after = _check(f'{scope}:email:{email}', per_email, consume=not email_on_failure)
+                    if not allowed:
+                        return _too_many_requests(retry_after)
+
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_login_failure(scope, email, limit):
+    """로그인 실패 시 이메일별 버킷 차감 (rate_limit(..., email_on_failure=True) 와 함께 사용)"""
+    if not _enabled or not email:
+        return
+    _check(f'{scope}:email:{email.strip().lower()}', limit)
+
+
+def reset_login_failures(scope, email):
+    """로그인 성공 시 이메일별 실패 기록 초기화"""
+    if not _enabled or not email:
+        return
+    try:
+        _store.reset(f'{scope}:email:{email.strip().lower()}')
+    except Exception:
+        pass
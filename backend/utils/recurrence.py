@@ -0,0 +1,118 @@
+"""
+정기 일정(정기전) 발생 일정 생성
+규칙(schedule_recurrences)의 요일 / 주차 / 월 횟수로 기간 안의 날짜를 월 단위 날짜 계산으로 한 번에 구하고,
+없는 일정만 INSERT ... ON CONFLICT (recurrence_id, date) DO NOTHING 한 번으로 일괄 생성합니다.
+달력 조회는 schedules 행만 읽으므로 조회 시 반복 규칙을 계산하지 않습니다.
+
+- 규칙마다 materialized_until 까지 생성한 것으로 기록하고 다음 실행은 그 이후만 생성
+  (운영진이 삭제한 발생 일정은 다시 만들지 않음)
+- 주기 실행: flask materialize-recurring-schedules (cron 등)
+커밋은 모두 호출하는 쪽에서 수행합니다.
+"""
+import calendar
+from datetime import date, timedelta
+from sqlalchemy import case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import db, Schedule, ScheduleRecurrence
+
+RECURRENCE_WEEK_TYPES = ('all', 'even', 'odd')
+
+# 한 INSERT 문에 넣는 최대 행 수
+INSERT_BATCH_SIZE = 1000
+
+
+def month_occurrences(year, month, day_of_week, week_type='all', frequency=4):
+    """한 달 안의 발생 날짜 (해당 요일의 n번째 기준 짝/홀 필터 후 앞에서 frequency 개)
+
+    Args:
+        day_of_week: 0: 일요일 ~ 6: 토요일 (프론트 Date.getDay 기준)
+    """
+    first_weekday, last_day = calendar.monthrange(year, month)  # 월요일 = 0
+    first_day = 1 + (((day_of_week - 1) % 7) - first_weekday) % 7
+    days = range(first_day, last_day + 1, 7)  # n번째 해당 요일 = days[n - 1]
+    if week_type == 'even':
+        days = days[1::2]
+    elif week_type == 'odd':
+        days = days[0::2]
+    return [date(year, month, day) for day in days[:max(frequency, 0)]]
+
+
+def expand_recurrence(rule, start, end):
+    """규칙의 [start, end] 기간 발생 날짜 (규칙의 시작/종료일로 한 번 더 제한)"""
+    start = max(start, rule.starts_on)
+    if rule.ends_on:
+        end = min(end, rule.ends_on)
+    if start > end:
+        return []
+
+    dates = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        dates.extend(
+            day for day in month_occurrences(year, month, rule.day_of_week, rule.week_type, rule.frequency)
+            if start <= day <= end
+        )
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return dates
+
+
+def horizon_end(today, months):
+    """today 부터 months 개월 뒤 달의 마지막 날"""
+    month_index = today.month - 1 + months
+    year, month = today.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def materialize_recurrences(until, rules=None):
+    """규칙별로 아직 생성하지 않은 기간(materialized_until 다음 날 ~ until)의 일정 일괄 생성
+
+    Args:
+        until: 이 날짜까지 생성
+        rules: 대상 규칙 (기본값: 활성 규칙 전체)
+
+    Returns:
+        dict: {'rules': 대상 규칙 수, 'created': 새로 생성한 일정 수}
+    """
+    if rules is None:
+        rules = ScheduleRecurrence.query.filter(ScheduleRecurrence.is_active == True).all()
+
+    rows = []
+    materialized = {}
+    for rule in rules:
+        start = rule.starts_on
+        if rule.materialized_until:
+            start = max(start, rule.materialized_until + timedelta(days=1))
+        if start > until:
+            continue
+        config = rule.to_config()
+        rows.extend({
+            'club_id': rule.club_id,
+            'schedule_type': rule.schedule_type,
+            'title': rule.title,
+            'date': occurrence,
+            'time': rule.time,
+            'max_participants': rule.max_participants,
+            'description': rule.description,
+            'is_recurring': True,
+            'recurring_config': config,
+            'recurrence_id': rule.id,
+            'created_by': rule.created_by,
+        } for occurrence in expand_recurrence(rule, start, until))
+        materialized[rule.id] = until
+
+    created = 0
+    table = Schedule.__table__
+    for offset in range(0, len(rows), INSERT_BATCH_SIZE):
+        stmt = pg_insert(table).values(rows[offset:offset + INSERT_BATCH_SIZE]).on_conflict_do_nothing(
+            index_elements=[table.c.recurrence_id, table.c.date]
+        )
+        created += db.session.execute(stmt).rowcount
+
+    if materialized:
+        ScheduleRecurrence.query.filter(
+            ScheduleRecurrence.id.in_(list(materialized))
+        ).update(
+            {'materialized_until': case(materialized, value=ScheduleRecurrence.id)},
+            synchronize_session=False
+        )
+    return {'rules': len(rules), 'created': created}
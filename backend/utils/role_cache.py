@@ -0,0 +1,87 @@
+"""
+클럽 권한 확인용 역할 캐시
+권한 데코레이터(require_club_role)가 매 요청마다 users / club_members 를
+조회하지 않도록 (user_id, club_id) → (시스템 역할, 승인된 클럽 역할) 을
+프로세스 메모리에 짧은 TTL로 캐시합니다.
+
+클럽 멤버십의 역할/상태를 바꾸는 곳에서는 invalidate_club_role(user_id, club_id),
+사용자의 시스템 역할을 바꾸는 곳에서는 invalidate_user_roles(user_id) 를 호출해야 합니다.
+다른 워커 프로세스의 캐시는 TTL 만료로 정리됩니다.
+"""
+from models import db, User, ClubMember
+from utils.token_cache import InMemoryTokenCache
+
+# 캐시 값 표현: 사용자가 없음
+ROLE_USER_NOT_FOUND = (None, None)
+
+# 토큰 캐시와 같은 TTL/LRU 구현을 재사용 (키만 (user_id, club_id) 튜플)
+_role_cache = InMemoryTokenCache(ttl_seconds=30, max_size=10000)
+_user_club_index = InMemoryTokenCache(ttl_seconds=30, max_size=10000)
+
+
+def init_role_cache(app):
+    """앱 설정에 따라 역할 캐시 초기화"""
+    global _role_cache, _user_club_index
+    ttl_seconds = app.config.get('ROLE_CACHE_TTL', 30)
+    max_size = app.config.get('ROLE_CACHE_MAX_SIZE', 10000)
+    _role_cache = InMemoryTokenCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    _user_club_index = InMemoryTokenCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    return _role_cache
+
+
+def _load_roles(user_id, club_id):
+    """사용자 시스템 역할 + 승인된 클럽 역할을 한 번의 쿼리로 조회"""
+    row = db.session.query(User.role, ClubMember.role).outerjoin(
+        ClubMember,
+        db.and_(
+            ClubMember.user_id == User.id,
+            ClubMember.club_id == club_id,
+            ClubMember.status == 'approved'
+        )
+    ).filter(User.id == user_id).first()
+    if row is None:
+        return ROLE_USER_NOT_FOUND
+    return (row[0], row[1])
+
+
+def get_roles(user_id, club_id):
+    """(시스템 역할, 클럽 역할) 조회 (캐시 미스 시에만 DB 조회)
+
+    Returns:
+        tuple: (system_role, club_role) - 사용자가 없으면 (None, None),
+               승인된 멤버십이 없으면 club_role 은 None
+    """
+    key = (int(user_id), int(club_id))
+    roles = _role_cache.get(key)
+    if roles is not None:
+        return roles
+
+    roles = _load_roles(*key)
+    _role_cache.set(key, roles)
+    # 시스템 역할 변경 시 사용자 단위로 무효화할 수 있도록 캐시된 club_id 기록
+    club_ids = _user_club_index.get(key[0]) or frozenset()
+    _user_club_index.set(key[0], club_ids | {key[1]})
+    return roles
+
+
+def invalidate_club_role(user_id, club_id):
+    """클럽 멤버십 역할/상태 변경 후 호출"""
+    if user_id is None or club_id is None:
+        return
+    _role_cache.delete((int(user_id), int(club_id)))
+
+
+def invalidate_user_roles(user_id):
+    """사용자 시스템 역할 변경/계정 삭제 후 호출 (해당 사용자의 모든 클럽 항목 무효화)"""
+    if user_id is None:
+        return
+    user_id = int(user_id)
+    for club_id in _user_club_index.get(user_id) or ():
+        _role_cache.delete((user_id, club_id))
+    _user_club_index.delete(user_id)
+
+
+def clear_role_cache():
+    """전체 역할 캐시 비우기 (클럽 삭제 등 대량 변경 후 호출)"""
+    _role_cache.clear()
+    _user_club_index.clear()
@@ -0,0 +1,315 @@
+"""
+일정 참석 관리
+- 일괄 로딩 (일정 목록 / 상세 공용): 일정마다 attendances 를, 참석자마다 member / rejector /
+  같은 이메일의 User 를 따로 조회하지 않고 일정 id 목록에 대해 고정된 횟수의 쿼리로
+  참석자, 회원 이름, 마이페이지 이름, 거절한 운영진 이름과 참석/대기 인원(GROUP BY)을 가져옵니다.
+- 정원 관리: 참석 인원 확인과 참석/대기 등록, 취소 시 대기자 승격을 일정 행 잠금
+  (SELECT ... FOR UPDATE) 안에서 처리해 동시에 신청해도 정원을 넘지 않습니다.
+  커밋은 모두 호출하는 쪽에서 수행합니다.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import case, func
+from sqlalchemy.orm import aliased
+from models import db, Schedule, ScheduleAttendance, Member, User, Club
+
+ATTENDANCE_NOT_FOUND = '참석 내역을 찾을 수 없습니다.'
+
+
+def load_attendance_counts(schedule_ids):
+    """일정별 참석('attending') / 대기('waiting') 인원 (GROUP BY 한 번)
+
+    Returns:
+        dict: {schedule_id: (참석 인원, 대기 인원)} (참석/대기자가 없는 일정은 없음)
+    """
+    if not schedule_ids:
+        return {}
+    rows = db.session.query(
+        ScheduleAttendance.schedule_id,
+        func.count(case((ScheduleAttendance.status == 'attending', 1))),
+        func.count(case((ScheduleAttendance.status == 'waiting', 1)))
+    ).filter(
+        ScheduleAttendance.schedule_id.in_(list(schedule_ids)),
+        ScheduleAttendance.status.in_(['attending', 'waiting'])
+    ).group_by(ScheduleAttendance.schedule_id).all()
+    return {schedule_id: (attending, waiting) for schedule_id, attending, waiting in rows}
+
+
+def _user_names_by_email(emails):
+    """이메일별 마이페이지(User) 이름 (이메일이 같은 사용자가 여럿이면 먼저 가입한 사용자)"""
+    if not emails:
+        return {}
+    rows = db.session.query(User.email, User.name).filter(
+        User.email.in_(list(emails))
+    ).order_by(User.id).all()
+    names = {}
+    for email, name in rows:
+        names.setdefault(email, name)
+    return names
+
+
+def load_attendances(schedule_ids):
+    """일정별 참석 목록 dict (참석 신청 순)
+
+    참석자 + 회원 + 거절한 운영진은 JOIN 한 번, 마이페이지 이름은 이메일 IN 조회 한 번으로 로드
+
+    Returns:
+        dict: {schedule_id: [ScheduleAttendance.to_dict() 형식]}
+    """
+    if not schedule_ids:
+        return {}
+    rejector = aliased(User)
+    rows = db.session.query(
+        ScheduleAttendance, Member.name, Member.email, rejector.name
+    ).outerjoin(
+        Member, ScheduleAttendance.member_id == Member.id
+    ).outerjoin(
+        rejector, ScheduleAttendance.rejected_by == rejector.id
+    ).filter(
+        ScheduleAttendance.schedule_id.in_(list(schedule_ids))
+    ).order_by(ScheduleAttendance.schedule_id, ScheduleAttendance.id).all()
+
+    user_names = _user_names_by_email({email for _, _, email, _ in rows if email})
+
+    attendances = {}
+    for attendance, member_name, email, rejector_name in rows:
+        # 마이페이지 이름 우선, 없으면 회원 이름
+        name = (user_names.get(email) if email else None) or member_name
+        attendances.setdefault(attendance.schedule_id, []).append(
+            attendance.to_dict(preloaded={'member_name': name, 'rejector_name': rejector_name})
+        )
+    return attendances
+
+
+def serialize_schedules(schedules, include_attendances=True):
+    """일정 목록 dict 변환 (일정 수와 관계없이 고정된 쿼리 수)"""
+    schedule_ids = [schedule.id for schedule in schedules]
+    counts = load_attendance_counts(schedule_ids)
+    attendances = load_attendances(schedule_ids) if include_attendances else {}
+    results = []
+    for schedule in schedules:
+        attending, waiting = counts.get(schedule.id, (0, 0))
+        results.append(schedule.to_dict(include_attendances=include_attendances, preloaded={
+            'attendance_count': attending,
+            'waitlist_count': waiting,
+            'attendances': attendances.get(schedule.id, []),
+        }))
+    return results
+
+
+def lock_schedule_capacity(schedule_id):
+    """일정 행 잠금 후 정원 조회 (SELECT ... FOR UPDATE, 트랜잭션 끝까지 유지)
+
+    같은 일정의 참석/취소/거부/정원 변경이 이 잠금으로 직렬화됩니다.
+
+    Returns:
+        int: max_participants (일정이 없으면 None)
+    """
+    return db.session.query(Schedule.max_participants).filter(
+        Schedule.id == schedule_id
+    ).with_for_update().scalar()
+
+
+def _attending_count(schedule_id):
+    return ScheduleAttendance.query.filter(
+        ScheduleAttendance.schedule_id == schedule_id,
+        ScheduleAttendance.status == 'attending'
+    ).count()
+
+
+def waitlist_position(attendance):
+    """대기 순번 (1부터, 대기 중이 아니면 None)"""
+    if attendance.status != 'waiting':
+        return None
+    ahead = ScheduleAttendance.query.filter(
+        ScheduleAttendance.schedule_id == attendance.schedule_id,
+        ScheduleAttendance.status == 'waiting',
+        db.or_(
+            ScheduleAttendance.waitlisted_at < attendance.waitlisted_at,
+            db.and_(
+                ScheduleAttendance.waitlisted_at == attendance.waitlisted_at,
+                ScheduleAttendance.id < attendance.id
+            )
+        )
+    ).count()
+    return ahead + 1
+
+
+def reserve_seat(schedule_id, member_id):
+    """참석 신청 (정원이 차 있으면 대기 명단에 등록)
+
+    Returns:
+        tuple: (attendance, error) - 이미 참석/대기 중이면 attendance 는 None, error 는 안내 메시지
+    """
+    max_participants = lock_schedule_capacity(schedule_id)
+    if max_participants is None:
+        return None, '일정을 찾을 수 없습니다.'
+
+    attendance = ScheduleAttendance.query.filter(
+        ScheduleAttendance.schedule_id == schedule_id,
+        ScheduleAttendance.member_id == member_id
+    ).first()
+    if attendance and attendance.status == 'attending':
+        return None, '이미 참석 신청되어 있습니다.'
+    if attendance and attendance.status == 'waiting':
+        return None, '이미 대기 명단에 등록되어 있습니다.'
+
+    has_seat = _attending_count(schedule_id) < max_participants
+    if attendance is None:
+        # 새 신청
+        attendance = ScheduleAttendance(schedule_id=schedule_id, member_id=member_id)
+        db.session.add(attendance)
+    else:
+        # 거부된 경우 다시 신청 가능
+        attendance.rejected_by = None
+        attendance.rejected_at = None
+
+    if has_seat:
+        attendance.status = 'attending'
+        attendance.waitlisted_at = None
+    else:
+        attendance.status = 'waiting'
+        attendance.waitlisted_at = datetime.utcnow()
+    db.session.flush()
+    return attendance, None
+
+
+def promote_waitlist(schedule_id, max_participants):
+    """빈 자리만큼 대기자를 등록 순서대로 참석으로 승격 (lock_schedule_capacity 잠금 안에서 호출)
+
+    Returns:
+        list: 승격된 ScheduleAttendance 목록
+    """
+    free_seats = max_participants - _attending_count(schedule_id)
+    if free_seats <= 0:
+        return []
+    promoted = ScheduleAttendance.query.filter(
+        ScheduleAttendance.schedule_id == schedule_id,
+        ScheduleAttendance.status == 'waiting'
+    ).order_by(
+        ScheduleAttendance.waitlisted_at.asc(), ScheduleAttendance.id.asc()
+    ).limit(free_seats).all()
+    for attendance in promoted:
+        attendance.status = 'attending'
+        attendance.waitlisted_at = None
+    db.session.flush()
+    return promoted
+
+
+def release_seat(schedule_id, member_id):
+    """참석/대기 취소 (참석 취소로 빈 자리는 대기자 승격)
+
+    Returns:
+        tuple: (승격된 ScheduleAttendance 목록, error)
+    """
+    max_participants = lock_schedule_capacity(schedule_id)
+    if max_participants is None:
+        return [], '일정을 찾을 수 없습니다.'
+
+    attendance = ScheduleAttendance.query.filter(
+        ScheduleAttendance.schedule_id == schedule_id,
+        ScheduleAttendance.member_id == member_id
+    ).first()
+    if not attendance:
+        return [], ATTENDANCE_NOT_FOUND
+    if attendance.status not in ('attending', 'waiting'):
+        return [], '취소할 수 있는 상태가 아닙니다.'
+
+    was_attending = attendance.status == 'attending'
+    db.session.delete(attendance)
+    db.session.flush()
+    if not was_attending:
+        return [], None
+    return promote_waitlist(schedule_id, max_participants), None
+
+
+def stress_test_attendance(app, participants=40, max_participants=18, cancels=5, concurrency=16):
+    """동시 참석 신청/취소 부하 테스트 (임시 클럽/일정/회원을 만들고 끝나면 삭제)
+
+    1. participants 명이 동시에 참석 신청 → 참석은 정원까지만, 나머지는 대기
+    2. 참석자 중 cancels 명이 동시에 취소 → 대기자가 순서대로 승격되어 정원 유지
+
+    Returns:
+        dict: {'participants', 'max_participants', 'attending', 'waiting', 'after_cancel_attending',
+               'after_cancel_waiting', 'overbooked', 'errors', 'elapsed'}
+    """
+    stamp = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+    club = Club(name=f'__attendance_stress_{stamp}')
+    db.session.add(club)
+    db.session.flush()
+    schedule = Schedule(
+        club_id=club.id,
+        schedule_type='event',
+        title='참석 동시성 테스트',
+        date=(datetime.now() + timedelta(days=1)).date(),
+        time=datetime.now().time().replace(microsecond=0),
+        max_participants=max_participants,
+    )
+    members = [Member(club_id=club.id, name=f'stress-{index}') for index in range(participants)]
+    db.session.add(schedule)
+    db.session.add_all(members)
+    db.session.commit()
+    club_id, schedule_id = club.id, schedule.id
+    member_ids = [member.id for member in members]
+
+    errors = []
+    errors_lock = threading.Lock()
+
+    def run_concurrently(action, targets):
+        pending = list(targets)
+        pending_lock = threading.Lock()
+
+        def worker():
+            with app.app_context():
+                while True:
+                    with pending_lock:
+                        if not pending:
+                            return
+                        member_id = pending.pop()
+                    try:
+                        action(schedule_id, member_id)
+                        db.session.commit()
+                    except Exception as e:
+                        db.session.rollback()
+                        with errors_lock:
+                            errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def counts():
+        db.session.expire_all()
+        return load_attendance_counts([schedule_id]).get(schedule_id, (0, 0))
+
+    started = time.perf_counter()
+    try:
+        run_concurrently(reserve_seat, member_ids)
+        attending, waiting = counts()
+        attending_ids = [row.member_id for row in ScheduleAttendance.query.filter_by(
+            schedule_id=schedule_id, status='attending'
+        ).limit(cancels).all()]
+        run_concurrently(release_seat, attending_ids)
+        after_attending, after_waiting = counts()
+        elapsed = time.perf_counter() - started
+    finally:
+        ScheduleAttendance.query.filter_by(schedule_id=schedule_id).delete(synchronize_session=False)
+        Schedule.query.filter_by(id=schedule_id).delete(synchronize_session=False)
+        Member.query.filter_by(club_id=club_id).delete(synchronize_session=False)
+        Club.query.filter_by(id=club_id).delete(synchronize_session=False)
+        db.session.commit()
+
+    return {
+        'participants': participants,
+        'max_participants': max_participants,
+        'attending': attending,
+        'waiting': waiting,
+        'after_cancel_attending': after_attending,
+        'after_cancel_waiting': after_waiting,
+        'overbooked': max(attending, after_attending) > max_participants,
+        'errors': errors,
+        'elapsed': elapsed,
+    }
@@ -0,0 +1,205 @@
+"""
+게시글 / 댓글 / 문의 통합 검색
+- 전문 검색: search_vector ('simple' 설정 tsvector 생성 컬럼, GIN 인덱스) @@ plainto_tsquery
+- 부분 일치: 한국어는 형태소 분석 없이 조사가 붙은 단어("볼링장에서")가 토큰으로 일치하지 않으므로
+  pg_trgm 트라이그램 GIN 인덱스를 사용하는 ILIKE 로 보완
+- 순위: ts_rank + word_similarity (높은 순, 같으면 최신순)
+
+대상별 (종류, id, 점수, 작성 시각)을 UNION ALL 로 합쳐 한 번에 페이지를 자르고,
+해당 페이지의 행만 종류별로 한 번씩 로드합니다.
+컬럼/인덱스: migrations/add_search_indexes.sql
+"""
+from sqlalchemy import func, literal, or_, select, union_all
+from models import db, User, Post, Comment, Inquiry
+from utils.visibility import post_visibility_filter, inquiry_visibility_filter
+
+SEARCH_CONFIG = 'simple'
+SEARCH_TYPES = ('posts', 'comments', 'inquiries')
+SEARCH_MIN_LENGTH = 2
+SEARCH_MAX_LENGTH = 100
+
+# 결과 미리보기: 검색어 앞뒤로 보여줄 글자 수
+SNIPPET_RADIUS = 40
+
+
+def _like_pattern(query):
+    """ILIKE 부분 일치 패턴 (% _ \\ 는 이스케이프)"""
+    escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def _match_and_rank(vector, text_columns, query):
+    """(일치 조건, 점수) - 전문 검색 또는 부분 일치 중 하나라도 맞으면 일치"""
+    ts_query = func.plainto_tsquery(SEARCH_CONFIG, query)
+    pattern = _like_pattern(query)
+    matched = or_(
+        vector.op('@@')(ts_query),
+        *[column.ilike(pattern, escape='\\') for column in text_columns]
+    )
+    rank = func.ts_rank(vector, ts_query) + func.greatest(
+        *[func.word_similarity(query, func.coalesce(column, '')) for column in text_columns]
+    )
+    return matched, rank
+
+
+def _post_hits(query, post_filter):
+    matched, rank = _match_and_rank(Post.search_vector, (Post.title, Post.content), query)
+    stmt = select(
+        literal('post').label('kind'), Post.id.label('id'),
+        rank.label('score'), Post.created_at.label('created_at')
+    ).where(matched)
+    if post_filter is not None:
+        stmt = stmt.where(post_filter)
+    return stmt
+
+
+def _comment_hits(query, post_filter):
+    # 댓글은 게시글 조회 범위를 따름
+    matched, rank = _match_and_rank(Comment.search_vector, (Comment.content,), query)
+    stmt = select(
+        literal('comment').label('kind'), Comment.id.label('id'),
+        rank.label('score'), Comment.created_at.label('created_at')
+    ).join(Post, Comment.post_id == Post.id).where(matched)
+    if post_filter is not None:
+        stmt = stmt.where(post_filter)
+    return stmt
+
+
+def _inquiry_hits(query, inquiry_filter):
+    matched, rank = _match_and_rank(
+        Inquiry.search_vector, (Inquiry.title, Inquiry.content, Inquiry.reply), query
+    )
+    stmt = select(
+        literal('inquiry').label('kind'), Inquiry.id.label('id'),
+        rank.label('score'), Inquiry.created_at.label('created_at')
+    ).where(matched)
+    if inquiry_filter is not None:
+        stmt = stmt.where(inquiry_filter)
+    return stmt
+
+
+def make_snippet(text, query):
+    """검색어 주변 미리보기 (검색어가 없으면 앞부분)"""
+    text = ' '.join((text or '').split())
+    position = text.lower().find(query.lower())
+    if position < 0:
+        return text[:SNIPPET_RADIUS * 2] + ('...' if len(text) > SNIPPET_RADIUS * 2 else '')
+    start = max(position - SNIPPET_RADIUS, 0)
+    end = min(position + len(query) + SNIPPET_RADIUS, len(text))
+    return ('...' if start > 0 else '') + text[start:end] + ('...' if end < len(text) else '')
+
+
+def _format_time(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+
+def _load_posts(ids, query):
+    rows = db.session.query(Post, User.name).outerjoin(
+        User, Post.author_id == User.id
+    ).filter(Post.id.in_(ids)).all()
+    return {
+        post.id: {
+            'post_id': post.id,
+            'post_type': post.post_type,
+            'club_id': post.club_id,
+            'title': post.title,
+            'snippet': make_snippet(post.content, query),
+            'author_name': author_name,
+            'created_at': _format_time(post.created_at),
+        }
+        for post, author_name in rows
+    }
+
+
+def _load_comments(ids, query):
+    rows = db.session.query(Comment, Post.title, Post.club_id, User.name).join(
+        Post, Comment.post_id == Post.id
+    ).outerjoin(User, Comment.author_id == User.id).filter(Comment.id.in_(ids)).all()
+    return {
+        comment.id: {
+            'post_id': comment.post_id,
+            'club_id': club_id,
+            'title': post_title,
+            'snippet': make_snippet(comment.content, query),
+            'author_name': author_name,
+            'created_at': _format_time(comment.created_at),
+        }
+        for comment, post_title, club_id, author_name in rows
+    }
+
+
+def _load_inquiries(ids, query):
+    rows = db.session.query(Inquiry, User.name).outerjoin(
+        User, Inquiry.user_id == User.id
+    ).filter(Inquiry.id.in_(ids)).all()
+    results = {}
+    for inquiry, author_name in rows:
+        # 답변에서만 일치한 경우 답변 미리보기
+        text = inquiry.content
+        if query.lower() not in f'{inquiry.title} {inquiry.content}'.lower() and inquiry.reply:
+            text = inquiry.reply
+        results[inquiry.id] = {
+            'club_id': inquiry.club_id,
+            'title': inquiry.title,
+            'snippet': make_snippet(text, query),
+            'author_name': author_name,
+            'is_private': inquiry.is_private,
+            'has_reply': inquiry.reply is not None,
+            'created_at': _format_time(inquiry.created_at),
+        }
+    return results
+
+
+_LOADERS = {'post': _load_posts, 'comment': _load_comments, 'inquiry': _load_inquiries}
+
+
+def search(user, club_id, query, types=SEARCH_TYPES, page=1, per_page=20):
+    """조회 범위 안에서 검색 (점수순 페이지)
+
+    Args:
+        user: 현재 사용자 (게시글 조회 권한(클럽 가입)은 호출하는 쪽에서 확인)
+        club_id: 선택된 클럽 ID
+        query: 검색어
+        types: 검색 대상 (SEARCH_TYPES 중 일부)
+
+    Returns:
+        tuple: (결과 목록, 전체 개수)
+    """
+    post_filter = post_visibility_filter(user, club_id)
+    builders = {
+        'posts': lambda: _post_hits(query, post_filter),
+        'comments': lambda: _comment_hits(query, post_filter),
+        'inquiries': lambda: _inquiry_hits(query, inquiry_visibility_filter(user, club_id)),
+    }
+    hits = union_all(*[builders[search_type]() for search_type in types]).subquery()
+
+    total = db.session.execute(select(func.count()).select_from(hits)).scalar()
+    page_rows = db.session.execute(
+        select(hits.c.kind, hits.c.id, hits.c.score)
+        .order_by(hits.c.score.desc(), hits.c.created_at.desc(), hits.c.id.desc())
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    ).all()
+
+    ids_by_kind = {}
+    for kind, row_id, _ in page_rows:
+        ids_by_kind.setdefault(kind, []).append(row_id)
+    loaded = {kind: _LOADERS[kind](ids, query) for kind, ids in ids_by_kind.items()}
+
+    results = []
+    for kind, row_id, score in page_rows:
+        item = loaded[kind].get(row_id)
+        if item is None:  # 조회 사이에 삭제된 행
+            continue
+        results.append(dict(item, type=kind, id=row_id, score=round(float(score or 0), 4)))
+    return results, total
+
+
+def parse_types(value):
+    """'posts,comments' 형식의 검색 대상 파싱 (비어 있으면 전체, 알 수 없는 값이 있으면 None)"""
+    if not value or value == 'all':
+        return SEARCH_TYPES
+    types = tuple(dict.fromkeys(part.strip() for part in value.split(',') if part.strip()))
+    if not types or any(search_type not in SEARCH_TYPES for search_type in types):
+        return None
+    return types
@@ -0,0 +1,167 @@
+"""
+JWT 활성 토큰(active_token) 캐시
+token_in_blocklist_loader 에서 매 요청마다 users 테이블을 조회하지 않도록
+user_id → active_token(jti) 를 짧은 TTL로 캐시합니다.
+
+- 기본: 프로세스 메모리 기반 TTL/LRU 캐시
+- 멀티 워커 배포: TOKEN_CACHE_REDIS_URL 설정 시 Redis 공유 캐시 사용
+로그인/로그아웃 등 active_token 을 변경하는 곳에서는 커밋 후 반드시
+store_active_token(user_id, 새 값) 으로 새 값을 캐시에 덮어써야 합니다.
+(삭제만 하면 커밋 전에 이전 값을 읽은 다른 요청이 그 값을 다시 캐시할 수 있으므로,
+ 캐시 미스 시 DB 에서 읽은 값은 키가 비어 있을 때만 저장)
+"""
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# 캐시 값 표현: 사용자가 없음 / 활성 토큰 없음
+USER_NOT_FOUND = '\x00'
+NO_ACTIVE_TOKEN = ''
+
+
+class InMemoryTokenCache:
+    """프로세스 메모리 기반 TTL/LRU 캐시"""
+
+    def __init__(self, ttl_seconds=30, max_size=10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= now:
+                del self._items[user_id]
+                return None
+            self._items.move_to_end(user_id)
+            return value
+
+    def set(self, user_id, value):
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._items[user_id] = (value, expires_at)
+            self._items.move_to_end(user_id)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def add(self, user_id, value):
+        """키가 없거나 만료된 경우에만 저장"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is not None and item[1] > now:
+                return False
+            self._items[user_id] = (value, now + self.ttl_seconds)
+            self._items.move_to_end(user_id)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+            return True
+
+    def delete(self, user_id):
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class RedisTokenCache:
+    """Redis 기반 공유 캐시 (멀티 워커/멀티 인스턴스 배포용)"""
+
+    key_prefix = 'teamcover:active_token:'
+
+    def __init__(self, redis_url, ttl_seconds=30):
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis.from_url(redis_url, decode_responses=True)
+
+    def get(self, user_id):
+        return self._client.get(f'{self.key_prefix}{user_id}')
+
+    def set(self, user_id, value):
+        self._client.set(f'{self.key_prefix}{user_id}', value, ex=self.ttl_seconds)
+
+    def add(self, user_id, value):
+        """키가 없는 경우에만 저장 (SET NX)"""
+        return bool(self._client.set(f'{self.key_prefix}{user_id}', value, ex=self.ttl_seconds, nx=True))
+
+    def delete(self, user_id):
+        self._client.delete(f'{self.key_prefix}{user_id}')
+
+    def clear(self):
+        for key in self._client.scan_iter(f'{self.key_prefix}*'):
+            self._client.delete(key)
+
+
+_token_cache = InMemoryTokenCache()
+
+
+def init_token_cache(app):
+    """앱 설정에 따라 토큰 캐시 백엔드 초기화"""
+    global _token_cache
+    ttl_seconds = app.config.get('TOKEN_CACHE_TTL', 30)
+    max_size = app.config.get('TOKEN_CACHE_MAX_SIZE', 10000)
+    redis_url = app.config.get('TOKEN_CACHE_REDIS_URL')
+
+    if redis_url and redis is None:
+        print("⚠️ TOKEN_CACHE_REDIS_URL 이 설정되었지만 redis 패키지가 없어 메모리 캐시 사용 (pip install redis)")
+    elif redis_url:
+        try:
+            _token_cache = RedisTokenCache(redis_url, ttl_seconds=ttl_seconds)
+            return _token_cache
+        except Exception as e:
+            print(f"⚠️ Redis 토큰 캐시 초기화 실패, 메모리 캐시 사용: {str(e)}")
+
+    _token_cache = InMemoryTokenCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    return _token_cache
+
+
+def get_active_token(user_id, loader):
+    """사용자의 active_token 조회 (캐시 미스 시 loader 호출 후 캐시)
+
+    Args:
+        user_id: 사용자 ID
+        loader: 캐시 미스 시 DB에서 값을 읽는 함수.
+                USER_NOT_FOUND / NO_ACTIVE_TOKEN / active_token 문자열 중 하나를 반환
+
+    Returns:
+        str: USER_NOT_FOUND, NO_ACTIVE_TOKEN 또는 active_token 값
+    """
+    try:
+        value = _token_cache.get(user_id)
+    except Exception:
+        value = None  # 캐시 백엔드 오류 시 DB 조회로 폴백
+    if value is not None:
+        return value
+
+    value = loader(user_id)
+    try:
+        # 그 사이 store_active_token 이 새 값을 썼다면 덮어쓰지 않음 (loader 가 커밋 전 값을 읽었을 수 있음)
+        _token_cache.add(user_id, value)
+    except Exception:
+        pass
+    return value
+
+
+def store_active_token(user_id, active_token):
+    """변경된 active_token 을 캐시에 기록 (로그인/로그아웃 등 커밋 후 호출)
+
+    Args:
+        active_token: 새 active_token (None 이면 활성 토큰 없음, 사용자 삭제 시 USER_NOT_FOUND)
+    """
+    if user_id is None:
+        return
+    try:
+        _token_cache.set(int(user_id), active_token or NO_ACTIVE_TOKEN)
+    except Exception:
+        pass
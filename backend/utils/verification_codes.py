@@ -0,0 +1,104 @@
+"""인증 코드 저장소 (verification_codes 테이블)
+
+이메일 인증 코드와 비밀번호 재설정 코드를 users 행이 아닌 별도 테이블에
+(email, purpose) 유니크 키로 보관한다.
+- 발급: INSERT ... ON CONFLICT 로 같은 용도의 기존 코드를 교체
+- 조회: (email, purpose) 유니크 인덱스로 단건 조회
+- 정리: expires_at 인덱스를 이용한 만료 코드 일괄 삭제 (발급 시 주기적으로 + CLI)
+"""
+import hmac
+import threading
+import time
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import db, VerificationCode
+
+PURPOSE_VERIFY = 'verify'  # 이메일 인증
+PURPOSE_PASSWORD_RESET = 'password_reset'  # 비밀번호 재설정
+
+# 만료 코드 일괄 삭제 주기 (프로세스별, 초)
+PURGE_INTERVAL_SECONDS = 3600
+
+_last_purge_at = 0.0
+_purge_lock = threading.Lock()
+
+
+def issue_code(email, purpose, code, ttl):
+    """인증 코드 발급 (같은 이메일/용도의 기존 코드는 교체). 커밋은 호출하는 쪽에서 수행한다.
+
+    Args:
+        email: 이메일 (소문자)
+        purpose: PURPOSE_VERIFY / PURPOSE_PASSWORD_RESET
+        code: 발급할 코드
+        ttl: 유효 기간 (timedelta)
+
+    Returns:
+        datetime: 만료 시각
+    """
+    now = datetime.utcnow()
+    expires_at = now + ttl
+    stmt = pg_insert(VerificationCode.__table__).values(
+        email=email,
+        purpose=purpose,
+        code=code,
+        expires_at=expires_at,
+        created_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VerificationCode.__table__.c.email, VerificationCode.__table__.c.purpose],
+        set_={
+            'code': stmt.excluded.code,
+            'expires_at': stmt.excluded.expires_at,
+            'created_at': stmt.excluded.created_at,
+        },
+    )
+    db.session.execute(stmt)
+    maybe_purge_expired_codes()
+    return expires_at
+
+
+def get_code(email, purpose):
+    """(email, purpose) 로 현재 코드 조회 (없으면 None)"""
+    return VerificationCode.query.filter_by(email=email, purpose=purpose).first()
+
+
+def check_code(email, purpose, code):
+    """인증 코드 확인
+
+    Returns:
+        str: 'ok', 'invalid' (코드 없음/불일치), 'expired'
+    """
+    entry = get_code(email, purpose)
+    if not entry or not code or not hmac.compare_digest(entry.code.encode(), code.encode()):
+        return 'invalid'
+    if entry.is_expired:
+        return 'expired'
+    return 'ok'
+
+
+def consume_code(email, purpose):
+    """사용한 코드 삭제. 커밋은 호출하는 쪽에서 수행한다."""
+    VerificationCode.query.filter_by(email=email, purpose=purpose).delete(synchronize_session=False)
+
+
+def purge_expired_codes(now=None):
+    """만료된 코드 일괄 삭제 (expires_at 인덱스 사용)
+
+    Returns:
+        int: 삭제된 행 수
+    """
+    deleted = VerificationCode.query.filter(
+        VerificationCode.expires_at < (now or datetime.utcnow())
+    ).delete(synchronize_session=False)
+    return deleted
+
+
+def maybe_purge_expired_codes():
+    """마지막 정리 후 PURGE_INTERVAL_SECONDS 가 지났으면 만료 코드 일괄 삭제 (현재 트랜잭션에 포함)"""
+    global _last_purge_at
+    now = time.monotonic()
+    with _purge_lock:
+        if now - _last_purge_at < PURGE_INTERVAL_SECONDS:
+            return 0
+        _last_purge_at = now
+    return purge_expired_codes()
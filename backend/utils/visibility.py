@@ -0,0 +1,46 @@
+"""
+게시글 / 문의 조회 범위 조건
+목록 조회(get_inquiries)와 검색이 같은 규칙을 사용하도록 SQL 조건으로 제공합니다.
+(일반 사용자의 게시글 목록은 같은 범위를 utils/global_posts 에서 캐시 병합으로 조회)
+반환값이 None 이면 제한 없음(슈퍼관리자)입니다.
+"""
+from sqlalchemy import and_, or_
+from models import Post, Inquiry
+from utils.club_helpers import check_club_permission, require_club_membership
+
+
+def post_visibility_filter(user, club_id):
+    """게시글 조회 범위
+
+    - 슈퍼관리자: 모든 게시글
+    - 일반 사용자: 선택한 클럽의 게시글 + 전체 게시글 (club_id 가 null)
+      (클럽 가입 여부는 호출하는 쪽에서 확인)
+    """
+    if user.role == 'super_admin':
+        return None
+    return or_(Post.club_id == club_id, Post.club_id.is_(None))
+
+
+def inquiry_visibility_filter(user, club_id):
+    """문의 조회 범위
+
+    - 슈퍼관리자: 모든 문의
+    - 클럽 운영진: 자신의 클럽 문의 (비공개 포함) + 자신이 작성한 문의
+    - 일반 회원: 자신이 작성한 문의 + 같은 클럽의 전체공개 문의
+    - 그 외: 자신이 작성한 문의
+    """
+    if user.role == 'super_admin':
+        return None
+
+    # 클럽 운영진 권한 확인 (user.role과 무관하게 ClubMember.role 확인)
+    has_permission, _ = check_club_permission(user.id, club_id, 'admin')
+    if has_permission:
+        return or_(Inquiry.user_id == user.id, Inquiry.club_id == club_id)
+
+    is_member, _ = require_club_membership(user.id, club_id)
+    if is_member:
+        return or_(
+            Inquiry.user_id == user.id,
+            and_(Inquiry.club_id == club_id, Inquiry.is_private == False)
+        )
+    return Inquiry.user_id == user.id
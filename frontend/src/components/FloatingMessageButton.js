@@ -48,7 +48,6 @@ const FloatingMessageButton = () => {
     };
 
     loadUnread();
-    const interval = setInterval(loadUnread, 15000);
 
     const handleMessagesUpdated = () => {
       loadUnread();
@@ -56,6 +55,12 @@ const FloatingMessageButton = () => {
 
     window.addEventListener('messagesUpdated', handleMessagesUpdated);
 
+    // 실시간 알림 채널로 안 읽은 메시지 수 갱신 (주기적 조회 대신)
+    const handleRealtimeCounters = (e) => {
+      setUnreadCount(e.detail?.unread_messages || 0);
+    };
+    window.addEventListener('realtimeCounters', handleRealtimeCounters);
+
     // 외부에서 메시지 모달을 열기 위한 이벤트 리스너
     const handleOpenMessageModal = () => {
       setIsOpen(true);
@@ -69,8 +74,8 @@ const FloatingMessageButton = () => {
     window.addEventListener('closeMessageModal', handleCloseMessageModal);
 
     return () => {
-      clearInterval(interval);
       window.removeEventListener('messagesUpdated', handleMessagesUpdated);
+      window.removeEventListener('realtimeCounters', handleRealtimeCounters);
       window.removeEventListener('openMessageModal', handleOpenMessageModal);
       window.removeEventListener('closeMessageModal', handleCloseMessageModal);
     };
@@ -22,10 +22,14 @@ const Navbar = () => {
   useEffect(() => {
     if (user?.role === 'super_admin' && isAuthenticated) {
       loadJoinRequestsCount();
-      // 30초마다 승인 요청 개수 갱신
-      const interval = setInterval(() => {
-        loadJoinRequestsCount();
-      }, 30000);
+
+      // 실시간 알림 채널로 승인 요청 개수 갱신 (주기적 조회 대신)
+      const handleRealtimeCounters = (e) => {
+        if (e.detail?.join_requests !== undefined) {
+          setJoinRequestsCount(e.detail.join_requests || 0);
+        }
+      };
+      window.addEventListener('realtimeCounters', handleRealtimeCounters);
 
       // 승인/거부 이벤트 리스너 추가
       const handleJoinRequestUpdate = () => {
@@ -35,7 +39,7 @@ const Navbar = () => {
       window.addEventListener('joinRequestUpdated', handleJoinRequestUpdate);
 
       return () => {
-        clearInterval(interval);
+        window.removeEventListener('realtimeCounters', handleRealtimeCounters);
         window.removeEventListener(
           'joinRequestUpdated',
           handleJoinRequestUpdate
@@ -54,10 +58,12 @@ const Navbar = () => {
 
     if (shouldCheckInquiries()) {
       loadUnreadInquiryCount();
-      // 30초마다 새로운 문의 확인
-      const interval = setInterval(() => {
-        loadUnreadInquiryCount();
-      }, 30000);
+
+      // 실시간 알림 채널로 새로운 문의 개수 갱신 (주기적 조회 대신)
+      const handleRealtimeCounters = (e) => {
+        setUnreadInquiryCount(e.detail?.unread_inquiries || 0);
+      };
+      window.addEventListener('realtimeCounters', handleRealtimeCounters);
 
       // 문의 페이지에서 문의를 확인했을 때 갱신
       const handleInquiryUpdate = () => {
@@ -67,7 +73,7 @@ const Navbar = () => {
       window.addEventListener('inquiryUpdated', handleInquiryUpdate);
 
       return () => {
-        clearInterval(interval);
+        window.removeEventListener('realtimeCounters', handleRealtimeCounters);
         window.removeEventListener('inquiryUpdated', handleInquiryUpdate);
       };
     } else {
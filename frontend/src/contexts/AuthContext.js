@@ -1,6 +1,7 @@
 import React, { createContext, useContext, useState, useEffect, useRef } from 'react';
 import { authAPI, messageAPI, inquiryAPI } from '../services/api';
 import { getFCMToken, setupMessageListener } from '../config/firebase';
+import { startRealtime, stopRealtime } from '../services/realtime';
 
 const AuthContext = createContext();
 
@@ -268,60 +269,72 @@ export const AuthProvider = ({ children }) => {
     return cleanup;
   }, [token, user]);
 
-  // 주기적으로 읽지 않은 메시지 확인 및 알림 표시
+  // 실시간 알림 채널 (long-poll) 시작/중지
+  useEffect(() => {
+    if (!token || !user?.id) return;
+
+    startRealtime();
+    return () => {
+      stopRealtime();
+    };
+  }, [token, user?.id]);
+
+  // 읽지 않은 메시지 확인 및 알림 표시 (실시간 알림 채널)
   useEffect(() => {
     if (!token || !user) return;
 
-    let intervalId = null;
     let timeoutId = null;
     let isFirstCheck = true; // 첫 번째 확인인지 여부
     let hasShownInitialNotification = false; // 초기 알림 표시 여부
 
+    const handleUnreadMessageCount = (currentCount) => {
+      const previousCount = lastUnreadCountRef.current;
+
+      // 첫 번째 확인이 아니고, 새로운 메시지가 있는 경우 알림 표시
+      if (!isFirstCheck && currentCount > previousCount && previousCount >= 0) {
+        const newMessagesCount = currentCount - previousCount;
+        if (window.showPushNotification && newMessagesCount > 0) {
+          window.showPushNotification({
+            type: 'info',
+            title: '새로운 메시지',
+            body: `읽지 않은 메시지 ${newMessagesCount}개가 있습니다.`,
+            onClick: () => {
+              // FloatingMessageButton의 메시지 모달을 열기 위한 이벤트 발생
+              window.dispatchEvent(new CustomEvent('openMessageModal'));
+            },
+            duration: 5000,
+          });
+        }
+      }
+      // 첫 번째 확인이고 읽지 않은 메시지가 있는 경우 알림 표시 (한 번만)
+      else if (isFirstCheck && currentCount > 0 && !hasShownInitialNotification) {
+        if (window.showPushNotification) {
+          window.showPushNotification({
+            type: 'info',
+            title: '읽지 않은 메시지',
+            body: `읽지 않은 메시지 ${currentCount}개가 있습니다.`,
+            onClick: () => {
+              // FloatingMessageButton의 메시지 모달을 열기 위한 이벤트 발생
+              window.dispatchEvent(new CustomEvent('openMessageModal'));
+            },
+            duration: 5000,
+          });
+          hasShownInitialNotification = true;
+        }
+        isFirstCheck = false;
+      }
+      else if (isFirstCheck) {
+        isFirstCheck = false;
+      }
+
+      lastUnreadCountRef.current = currentCount;
+    };
+
     const checkUnreadMessages = async () => {
       try {
         const response = await messageAPI.getUnreadCount();
         if (response.data.success) {
-          const currentCount = response.data.count || 0;
-          const previousCount = lastUnreadCountRef.current;
-
-          // 첫 번째 확인이 아니고, 새로운 메시지가 있는 경우 알림 표시
-          if (!isFirstCheck && currentCount > previousCount && previousCount >= 0) {
-            const newMessagesCount = currentCount - previousCount;
-            if (window.showPushNotification && newMessagesCount > 0) {
-              window.showPushNotification({
-                type: 'info',
-                title: '새로운 메시지',
-                body: `읽지 않은 메시지 ${newMessagesCount}개가 있습니다.`,
-                onClick: () => {
-                  // FloatingMessageButton의 메시지 모달을 열기 위한 이벤트 발생
-                  window.dispatchEvent(new CustomEvent('openMessageModal'));
-                },
-                duration: 5000,
-              });
-            }
-          }
-          // 첫 번째 확인이고 읽지 않은 메시지가 있는 경우 알림 표시 (한 번만)
-          else if (isFirstCheck && currentCount > 0 && !hasShownInitialNotification) {
-            if (window.showPushNotification) {
-              window.showPushNotification({
-                type: 'info',
-                title: '읽지 않은 메시지',
-                body: `읽지 않은 메시지 ${currentCount}개가 있습니다.`,
-                onClick: () => {
-                  // FloatingMessageButton의 메시지 모달을 열기 위한 이벤트 발생
-                  window.dispatchEvent(new CustomEvent('openMessageModal'));
-                },
-                duration: 5000,
-              });
-              hasShownInitialNotification = true;
-            }
-            isFirstCheck = false;
-          }
-          else if (isFirstCheck) {
-            isFirstCheck = false;
-          }
-
-          lastUnreadCountRef.current = currentCount;
+          handleUnreadMessageCount(response.data.count || 0);
         }
       } catch (error) {
         console.error('읽지 않은 메시지 확인 실패:', error);
@@ -333,20 +346,21 @@ export const AuthProvider = ({ children }) => {
       checkUnreadMessages();
     }, 2000);
 
-    // 30초마다 확인
-    intervalId = setInterval(checkUnreadMessages, 30000);
+    // 실시간 알림 채널로 갱신 (30초마다 조회하는 대신)
+    const handleRealtimeCounters = (e) => {
+      handleUnreadMessageCount(e.detail?.unread_messages || 0);
+    };
+    window.addEventListener('realtimeCounters', handleRealtimeCounters);
 
     return () => {
-      if (intervalId) {
-        clearInterval(intervalId);
-      }
+      window.removeEventListener('realtimeCounters', handleRealtimeCounters);
       if (timeoutId) {
         clearTimeout(timeoutId);
       }
     };
   }, [token, user]);
 
-  // 주기적으로 읽지 않은 문의 확인 및 알림 표시 (운영진/슈퍼관리자용)
+  // 읽지 않은 문의 확인 및 알림 표시 (운영진/슈퍼관리자용, 실시간 알림 채널)
   useEffect(() => {
     if (!token || !user) return;
     
@@ -354,54 +368,56 @@ export const AuthProvider = ({ children }) => {
     // 슈퍼관리자, 시스템 admin, 클럽 운영진 모두 확인
     // 백엔드에서 권한이 없는 사용자는 0을 반환하므로 안전합니다.
 
-    let intervalId = null;
     let timeoutId = null;
     let isFirstCheck = true;
     let hasShownInitialNotification = false; // 초기 알림 표시 여부
 
+    const handleUnreadInquiryCount = (currentCount) => {
+      const previousCount = lastUnreadInquiryCountRef.current;
+
+      // 첫 번째 확인이 아니고, 새로운 문의가 있는 경우 알림 표시
+      if (!isFirstCheck && currentCount > previousCount && previousCount >= 0) {
+        const newInquiriesCount = currentCount - previousCount;
+        if (window.showPushNotification && newInquiriesCount > 0) {
+          window.showPushNotification({
+            type: 'warning',
+            title: '새로운 문의',
+            body: `답변이 필요한 문의 ${newInquiriesCount}개가 있습니다.`,
+            onClick: () => {
+              window.location.href = '/inquiry';
+            },
+            duration: 5000,
+          });
+        }
+      }
+      // 첫 번째 확인이고 읽지 않은 문의가 있는 경우 알림 표시 (한 번만)
+      else if (isFirstCheck && currentCount > 0 && !hasShownInitialNotification) {
+        if (window.showPushNotification) {
+          window.showPushNotification({
+            type: 'warning',
+            title: '답변이 필요한 문의',
+            body: `답변이 필요한 문의 ${currentCount}개가 있습니다.`,
+            onClick: () => {
+              window.location.href = '/inquiry';
+            },
+            duration: 5000,
+          });
+          hasShownInitialNotification = true;
+        }
+        isFirstCheck = false;
+      }
+      else if (isFirstCheck) {
+        isFirstCheck = false;
+      }
+
+      lastUnreadInquiryCountRef.current = currentCount;
+    };
+
     const checkUnreadInquiries = async () => {
       try {
         const response = await inquiryAPI.getUnreadCount();
         if (response.data.success) {
-          const currentCount = response.data.unread_count || 0;
-          const previousCount = lastUnreadInquiryCountRef.current;
-
-          // 첫 번째 확인이 아니고, 새로운 문의가 있는 경우 알림 표시
-          if (!isFirstCheck && currentCount > previousCount && previousCount >= 0) {
-            const newInquiriesCount = currentCount - previousCount;
-            if (window.showPushNotification && newInquiriesCount > 0) {
-              window.showPushNotification({
-                type: 'warning',
-                title: '새로운 문의',
-                body: `답변이 필요한 문의 ${newInquiriesCount}개가 있습니다.`,
-                onClick: () => {
-                  window.location.href = '/inquiry';
-                },
-                duration: 5000,
-              });
-            }
-          }
-          // 첫 번째 확인이고 읽지 않은 문의가 있는 경우 알림 표시 (한 번만)
-          else if (isFirstCheck && currentCount > 0 && !hasShownInitialNotification) {
-            if (window.showPushNotification) {
-              window.showPushNotification({
-                type: 'warning',
-                title: '답변이 필요한 문의',
-                body: `답변이 필요한 문의 ${currentCount}개가 있습니다.`,
-                onClick: () => {
-                  window.location.href = '/inquiry';
-                },
-                duration: 5000,
-              });
-              hasShownInitialNotification = true;
-            }
-            isFirstCheck = false;
-          }
-          else if (isFirstCheck) {
-            isFirstCheck = false;
-          }
-
-          lastUnreadInquiryCountRef.current = currentCount;
+          handleUnreadInquiryCount(response.data.unread_count || 0);
         }
       } catch (error) {
         console.error('읽지 않은 문의 확인 실패:', error);
@@ -413,13 +429,14 @@ export const AuthProvider = ({ children }) => {
       checkUnreadInquiries();
     }, 2500);
 
-    // 30초마다 확인
-    intervalId = setInterval(checkUnreadInquiries, 30000);
+    // 실시간 알림 채널로 갱신 (30초마다 조회하는 대신)
+    const handleRealtimeCounters = (e) => {
+      handleUnreadInquiryCount(e.detail?.unread_inquiries || 0);
+    };
+    window.addEventListener('realtimeCounters', handleRealtimeCounters);
 
     return () => {
-      if (intervalId) {
-        clearInterval(intervalId);
-      }
+      window.removeEventListener('realtimeCounters', handleRealtimeCounters);
       if (timeoutId) {
         clearTimeout(timeoutId);
       }
@@ -8,6 +8,7 @@ import React, {
 } from 'react';
 import { clubAPI } from '../services/api';
 import { useAuth } from './AuthContext';
+import { restartRealtime } from '../services/realtime';
 
 const ClubContext = createContext();
 
@@ -195,6 +196,11 @@ export const ClubProvider = ({ children }) => {
     // user가 아직 로드 중이면 기다림 (loading 상태 유지)
   }, [user, loadClubs]);
 
+  // 클럽이 바뀌면 실시간 알림 구독 대상(클럽 운영진 알림)이 달라지므로 카운터를 새로 받음
+  useEffect(() => {
+    restartRealtime();
+  }, [currentClub?.id]);
+
   // 토큰 변경 감지 (다른 탭에서 로그인/로그아웃 시)
   useEffect(() => {
     const handleStorageChange = (e) => {
@@ -2,7 +2,7 @@ import React, { useState, useEffect, useMemo } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
 import { useClub } from '../contexts/ClubContext';
-import { postAPI } from '../services/api';
+import { postAPI, searchAPI } from '../services/api';
 import PostForm from '../components/PostForm';
 import PostDetail from '../components/PostDetail';
 import './Board.css';
@@ -26,6 +26,16 @@ const Board = () => {
     pages: 0,
   });
   const [openPostMenuId, setOpenPostMenuId] = useState(null); // 게시글 메뉴 열림 상태
+  const [searchInput, setSearchInput] = useState('');
+  const [searchQuery, setSearchQuery] = useState(''); // 검색 중인 검색어 (빈 값이면 목록 표시)
+  const [searchResults, setSearchResults] = useState([]);
+  const [searchPagination, setSearchPagination] = useState({
+    page: 1,
+    per_page: 20,
+    total: 0,
+    pages: 0,
+  });
+  const [searching, setSearching] = useState(false);
 
   const isSuperAdmin = user?.role === 'super_admin';
   const isAdmin = isSuperAdmin || clubIsAdmin;
@@ -66,6 +76,55 @@ const Board = () => {
     }
   };
 
+  useEffect(() => {
+    if (searchQuery) {
+      fetchSearchResults();
+    }
+  }, [searchQuery, searchPagination.page]);
+
+  const fetchSearchResults = async () => {
+    try {
+      setSearching(true);
+      setError('');
+      const response = await searchAPI.search({
+        q: searchQuery,
+        types: 'posts,comments',
+        page: searchPagination.page,
+        per_page: searchPagination.per_page,
+      });
+
+      if (response.data.success) {
+        setSearchResults(response.data.results);
+        setSearchPagination(response.data.pagination);
+      } else {
+        setError(response.data.message || '검색에 실패했습니다.');
+      }
+    } catch (error) {
+      console.error('검색 오류:', error);
+      setError(error.response?.data?.message || '검색에 실패했습니다.');
+    } finally {
+      setSearching(false);
+    }
+  };
+
+  const handleSearchSubmit = (e) => {
+    e.preventDefault();
+    const query = searchInput.trim();
+    if (query.length < 2) {
+      alert('검색어를 2자 이상 입력해주세요.');
+      return;
+    }
+    setSearchPagination({ ...searchPagination, page: 1 });
+    setSearchQuery(query);
+  };
+
+  const handleSearchClear = () => {
+    setSearchInput('');
+    setSearchQuery('');
+    setSearchResults([]);
+    setError('');
+  };
+
   // 슈퍼관리자인 경우 클럽별로 게시글 분류 (메모이제이션)
   const postsByClub = useMemo(() => {
     if (!isSuperAdmin) return null;
@@ -150,6 +209,27 @@ const Board = () => {
 
       <div className="board-content-section">
         <div className="board-content-header">
+          <form className="board-search" onSubmit={handleSearchSubmit}>
+            <input
+              type="text"
+              value={searchInput}
+              onChange={(e) => setSearchInput(e.target.value)}
+              placeholder="게시글·댓글 검색"
+              maxLength={100}
+            />
+            <button type="submit" className="btn btn-sm">
+              검색
+            </button>
+            {searchQuery && (
+              <button
+                type="button"
+                className="btn btn-sm"
+                onClick={handleSearchClear}
+              >
+                닫기
+              </button>
+            )}
+          </form>
           <div className="header-actions">
             <button onClick={handleCreatePost} className="btn btn-primary">
               글작성
@@ -189,7 +269,84 @@ const Board = () => {
 
         {error && <div className="error-message">{error}</div>}
 
-        {loading ? (
+        {searchQuery ? (
+          searching ? (
+            <div className="loading">검색 중...</div>
+          ) : (
+            <>
+              <div className="search-summary">
+                '{searchQuery}' 검색 결과 {searchPagination.total}건
+              </div>
+              <div className="posts-list">
+                {searchResults.length === 0 ? (
+                  <div className="no-posts">검색 결과가 없습니다.</div>
+                ) : (
+                  searchResults.map((result) => (
+                    <div
+                      key={`${result.type}-${result.id}`}
+                      className="post-item"
+                      onClick={() => handlePostClick({ id: result.post_id })}
+                    >
+                      <div className="post-header">
+                        <span
+                          className={`post-type ${
+                            result.type === 'post' ? result.post_type : 'free'
+                          }`}
+                        >
+                          {result.type === 'comment'
+                            ? '댓글'
+                            : result.post_type === 'notice'
+                            ? '공지'
+                            : '자유'}
+                        </span>
+                        <h3 className="post-title">{result.title}</h3>
+                      </div>
+                      <div className="post-content-preview">
+                        {result.snippet}
+                      </div>
+                      <div className="post-footer">
+                        <span className="post-author">
+                          {result.author_name}
+                        </span>
+                        <span className="post-date">{result.created_at}</span>
+                      </div>
+                    </div>
+                  ))
+                )}
+              </div>
+
+              {searchPagination.pages > 1 && (
+                <div className="pagination">
+                  <button
+                    onClick={() =>
+                      setSearchPagination({
+                        ...searchPagination,
+                        page: searchPagination.page - 1,
+                      })
+                    }
+                    disabled={searchPagination.page === 1}
+                  >
+                    이전
+                  </button>
+                  <span>
+                    {searchPagination.page} / {searchPagination.pages}
+                  </span>
+                  <button
+                    onClick={() =>
+                      setSearchPagination({
+                        ...searchPagination,
+                        page: searchPagination.page + 1,
+                      })
+                    }
+                    disabled={searchPagination.page === searchPagination.pages}
+                  >
+                    다음
+                  </button>
+                </div>
+              )}
+            </>
+          )
+        ) : loading ? (
           <div className="loading">로딩 중...</div>
         ) : (
           <>
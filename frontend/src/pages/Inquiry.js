@@ -14,6 +14,9 @@ const Inquiry = () => {
 
   const [inquiries, setInquiries] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [hasMoreInquiries, setHasMoreInquiries] = useState(false);
+  const [nextBeforeId, setNextBeforeId] = useState(null);
+  const [loadingMoreInquiries, setLoadingMoreInquiries] = useState(false);
   const [error, setError] = useState('');
   const [showForm, setShowForm] = useState(false);
   const [editingInquiry, setEditingInquiry] = useState(null);
@@ -100,6 +103,8 @@ const Inquiry = () => {
       const response = await inquiryAPI.getInquiries();
       if (response.data.success) {
         setInquiries(response.data.inquiries);
+        setHasMoreInquiries(response.data.has_more);
+        setNextBeforeId(response.data.next_before_id);
       } else {
         setError('문의 목록을 불러오는데 실패했습니다.');
       }
@@ -111,6 +116,34 @@ const Inquiry = () => {
     }
   };
 
+  // 이전 문의 더 불러오기 (before_id 커서)
+  const loadMoreInquiries = async () => {
+    if (!hasMoreInquiries || loadingMoreInquiries) return;
+    try {
+      setLoadingMoreInquiries(true);
+      const response = await inquiryAPI.getInquiries({
+        before_id: nextBeforeId,
+      });
+      if (response.data.success) {
+        setInquiries((prev) => {
+          const loadedIds = new Set(prev.map((inquiry) => inquiry.id));
+          return [
+            ...prev,
+            ...response.data.inquiries.filter(
+              (inquiry) => !loadedIds.has(inquiry.id)
+            ),
+          ];
+        });
+        setHasMoreInquiries(response.data.has_more);
+        setNextBeforeId(response.data.next_before_id);
+      }
+    } catch (error) {
+      console.error('문의 목록 추가 조회 오류:', error);
+    } finally {
+      setLoadingMoreInquiries(false);
+    }
+  };
+
   const handleCreateInquiry = () => {
     setEditingInquiry(null);
     setFormData({
@@ -1510,6 +1543,16 @@ const Inquiry = () => {
               })}
             </div>
           )}
+          {hasMoreInquiries && (
+            <div className="inquiry-load-more">
+              <button
+                onClick={loadMoreInquiries}
+                disabled={loadingMoreInquiries}
+              >
+                {loadingMoreInquiries ? '불러오는 중...' : '이전 문의 더 보기'}
+              </button>
+            </div>
+          )}
         </div>
       </div>
     </div>
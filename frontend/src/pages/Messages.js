@@ -24,6 +24,9 @@ const Messages = () => {
   const [newMessage, setNewMessage] = useState('');
   const [sending, setSending] = useState(false);
   const messagesEndRef = useRef(null);
+  const [hasMoreMessages, setHasMoreMessages] = useState(false); // 더 이전 메시지 존재 여부
+  const [loadingOlderMessages, setLoadingOlderMessages] = useState(false);
+  const skipScrollRef = useRef(false); // 이전 메시지를 앞에 붙일 때는 맨 아래로 스크롤하지 않음
   const [openMessageMenuId, setOpenMessageMenuId] = useState(null); // 메시지 메뉴 열림 상태
 
   // UTC 시간을 한국 시간(KST, UTC+9)으로 변환
@@ -208,6 +211,7 @@ const Messages = () => {
         const res = await messageAPI.getMessagesWithUser(otherUserId);
         if (res.data.success) {
           setMessages(res.data.messages || []);
+          setHasMoreMessages(!!res.data.has_more);
           if (!selectedUser) {
             setSelectedUser(res.data.other_user);
           }
@@ -356,9 +360,33 @@ const Messages = () => {
   }, [openMessageMenuId, messages]);
 
   useEffect(() => {
+    if (skipScrollRef.current) {
+      skipScrollRef.current = false;
+      return;
+    }
     scrollToBottom();
   }, [messages]);
 
+  // 이전 메시지 더 불러오기 (가장 오래된 메시지 id 기준 커서)
+  const loadOlderMessages = async () => {
+    if (!selectedUser?.id || loadingOlderMessages || messages.length === 0) return;
+    try {
+      setLoadingOlderMessages(true);
+      const res = await messageAPI.getMessagesWithUser(selectedUser.id, {
+        before_id: messages[0].id,
+      });
+      if (res.data.success) {
+        skipScrollRef.current = true;
+        setMessages((prev) => [...(res.data.messages || []), ...prev]);
+        setHasMoreMessages(!!res.data.has_more);
+      }
+    } catch (e) {
+      console.error('이전 메시지 로드 실패:', e);
+    } finally {
+      setLoadingOlderMessages(false);
+    }
+  };
+
   // 실시간 메시지 폴링 (선택된 사용자가 있을 때만)
   useEffect(() => {
     if (!selectedUser?.id) return;
@@ -367,7 +395,16 @@ const Messages = () => {
       try {
         const res = await messageAPI.getMessagesWithUser(selectedUser.id);
         if (res.data.success) {
-          const newMessages = res.data.messages || [];
+          const latestMessages = res.data.messages || [];
+          // 최신 페이지만 다시 받으므로, 이전에 불러온 더 오래된 메시지는 유지
+          const oldestLatestId = latestMessages.length > 0 ? latestMessages[0].id : null;
+          const newMessages =
+            oldestLatestId === null
+              ? latestMessages
+              : [
+                  ...messages.filter((msg) => !msg.is_sending && msg.id < oldestLatestId),
+                  ...latestMessages,
+                ];
           // 새 메시지가 있는지 확인
           const currentLastMessageId = messages.length > 0 ? messages[messages.length - 1]?.id : null;
           const newLastMessageId = newMessages.length > 0 ? newMessages[newMessages.length - 1]?.id : null;
@@ -405,6 +442,22 @@ const Messages = () => {
     return () => clearInterval(pollInterval);
   }, [selectedUser?.id, messages.length, loadConversations]);
 
+  // 모든 대화 읽음 처리
+  const handleMarkAllAsRead = async () => {
+    try {
+      const res = await messageAPI.markAllAsRead();
+      if (res.data.success) {
+        const clearUnread = (prev) => prev.map((c) => ({ ...c, unread_count: 0 }));
+        setConversations(clearUnread);
+        setSuperAdminConversations(clearUnread);
+        setNormalConversations(clearUnread);
+        window.dispatchEvent(new Event('messagesUpdated'));
+      }
+    } catch (e) {
+      console.error('전체 읽음 처리 실패:', e);
+    }
+  };
+
   const handleSelectConversation = async (conv) => {
     setSelectedUser({
       id: conv.user_id,
@@ -638,7 +691,17 @@ const Messages = () => {
 
           {activeTab === 'conversations' ? (
             <>
-              <div className="conversation-list-header">대화 목록</div>
+              <div className="conversation-list-header">
+                대화 목록
+                {conversations.some((c) => c.unread_count > 0) && (
+                  <button
+                    className="conversation-read-all-btn"
+                    onClick={handleMarkAllAsRead}
+                  >
+                    모두 읽음
+                  </button>
+                )}
+              </div>
               {loadingConversations ? (
                 <div className="conversation-empty">대화 목록을 불러오는 중...</div>
               ) : superAdminConversations.length === 0 && normalConversations.length === 0 ? (
@@ -791,7 +854,9 @@ const Messages = () => {
                       onClick={async () => {
                         try {
                           setLoadingMembers(true);
-                          const res = await authAPI.getUsers();
+                          const res = await authAPI.getUsers({
+                            fields: 'id,name,email,is_active',
+                          });
                           if (res.data.success) {
                             const allUsers = (res.data.users || [])
                               .filter((u) => u.id !== user?.id && u.is_active)
@@ -874,6 +939,17 @@ const Messages = () => {
                 </div>
               </div>
               <div className="chat-messages">
+                {!loadingMessages && hasMoreMessages && (
+                  <div className="chat-load-more">
+                    <button
+                      className="chat-load-more-btn"
+                      onClick={loadOlderMessages}
+                      disabled={loadingOlderMessages}
+                    >
+                      {loadingOlderMessages ? '불러오는 중...' : '이전 메시지 더 보기'}
+                    </button>
+                  </div>
+                )}
                 {loadingMessages ? (
                   <div className="chat-loading">메시지를 불러오는 중...</div>
                 ) : messages.length === 0 ? (
@@ -383,7 +383,8 @@ const Payments = () => {
     try {
       const response = await paymentAPI.getFundBalanceCache();
       if (response.data.success) {
-        const { current_balance, balance_series } = response.data;
+        const { current_balance, current_point_balance, balance_series } =
+          response.data;
 
         // 캐시된 데이터가 있으면 사용
         if (balance_series && Object.keys(balance_series).length > 0) {
@@ -398,20 +399,8 @@ const Payments = () => {
           setBalanceSeries(newBalanceSeries);
           setCurrentBalance(current_balance || 0);
 
-          // 포인트 잔액은 fund_balance_snapshot에서 가져온 값 사용 (별도 계산 불필요)
-          // 총 포인트 잔액은 마지막 월의 포인트 잔액으로 설정
-          if (
-            newBalanceSeries.pointBalances &&
-            newBalanceSeries.pointBalances.length > 0
-          ) {
-            const lastPointBalance =
-              newBalanceSeries.pointBalances[
-                newBalanceSeries.pointBalances.length - 1
-              ];
-            setTotalPointBalance(lastPointBalance || 0);
-          } else {
-            setTotalPointBalance(0);
-          }
+          // 포인트 잔액은 서버가 fund_balance_snapshot에서 계산한 값 사용 (별도 계산 불필요)
+          setTotalPointBalance(current_point_balance || 0);
         } else {
           // 캐시가 없으면 빈 데이터 설정
           setBalanceSeries({
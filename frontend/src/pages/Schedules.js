@@ -31,6 +31,9 @@ const Schedules = () => {
   const [showDateSchedulesModal, setShowDateSchedulesModal] = useState(false);
   const [selectedDateSchedules, setSelectedDateSchedules] = useState([]);
 
+  // 등록된 정기전 규칙 (정기전 설정 모달에서 조회/중지)
+  const [recurrences, setRecurrences] = useState([]);
+
   // 정기전 설정 상태
   const [regularSettings, setRegularSettings] = useState({
     dayOfWeek: 1, // 0: 일요일, 1: 월요일, ...
@@ -203,6 +206,10 @@ const Schedules = () => {
         member_id: currentMember?.id || null,
       });
       if (response.data.success) {
+        // 정원이 차 대기 명단에 등록된 경우 대기 순번 안내
+        if (response.data.waitlist_position) {
+          alert(response.data.message);
+        }
         await loadSchedules();
         if (selectedSchedule?.id === scheduleId) {
           const updated = schedules.find((s) => s.id === scheduleId);
@@ -219,9 +226,13 @@ const Schedules = () => {
     }
   };
 
-  // 참석 취소
-  const handleCancel = async (scheduleId) => {
-    if (!window.confirm('참석을 취소하시겠습니까?')) {
+  // 참석 취소 (대기 중이면 대기 취소)
+  const handleCancel = async (scheduleId, isWaiting = false) => {
+    if (
+      !window.confirm(
+        isWaiting ? '대기 신청을 취소하시겠습니까?' : '참석을 취소하시겠습니까?'
+      )
+    ) {
       return;
     }
 
@@ -326,97 +337,74 @@ const Schedules = () => {
     }
   };
 
-  // 정기전 생성 (해당 연도의 모든 월에 적용)
-  const handleCreateRegularSchedules = async () => {
-    setCreatingRegularSchedules(true);
+  // 등록된 정기전 규칙 조회
+  const loadRecurrences = async () => {
     try {
-      const targetYear = currentDate.getFullYear();
-      const schedulesToCreate = [];
-
-      // 해당 연도의 1월부터 12월까지 모든 월에 적용
-      for (let month = 1; month <= 12; month++) {
-        const lastDay = new Date(targetYear, month, 0).getDate();
-
-        // 해당 월의 첫 번째 해당 요일 찾기
-        let firstTargetDay = null;
-        for (let day = 1; day <= 7; day++) {
-          const date = new Date(targetYear, month - 1, day);
-          if (date.getDay() === regularSettings.dayOfWeek) {
-            firstTargetDay = day;
-            break;
-          }
-        }
-
-        if (!firstTargetDay) continue; // 해당 요일이 없는 월 (없을 수 없지만 안전장치)
+      const response = await scheduleAPI.getRecurrences();
+      if (response.data.success) {
+        setRecurrences(response.data.recurrences);
+      }
+    } catch (error) {
+      console.error('정기전 목록 로드 실패:', error);
+    }
+  };
 
-        // 해당 월의 모든 해당 요일 찾기
-        const targetDays = [];
-        for (let day = firstTargetDay; day <= lastDay; day += 7) {
-          targetDays.push(day);
-        }
+  const openRegularSettingsModal = () => {
+    setShowRegularSettingsModal(true);
+    loadRecurrences();
+  };
 
-        // 주차별 필터링
-        const filteredDays = [];
-        for (let i = 0; i < targetDays.length; i++) {
-          const weekNumber = i + 1; // 1주차, 2주차, 3주차...
-
-          if (regularSettings.weekType === 'all') {
-            filteredDays.push(targetDays[i]);
-          } else if (
-            regularSettings.weekType === 'even' &&
-            weekNumber % 2 === 0
-          ) {
-            filteredDays.push(targetDays[i]);
-          } else if (
-            regularSettings.weekType === 'odd' &&
-            weekNumber % 2 === 1
-          ) {
-            filteredDays.push(targetDays[i]);
-          }
-        }
+  // 정기전 중지 (이후 일정 생성 중단, 참석 신청이 없는 남은 일정 삭제)
+  const handleStopRecurrence = async (recurrenceId) => {
+    if (
+      !window.confirm(
+        '이 정기전을 중지하시겠습니까?\n오늘 이후 참석 신청이 없는 정기전 일정은 삭제됩니다.'
+      )
+    ) {
+      return;
+    }
 
-        // 횟수 제한 적용
-        const daysToAdd = filteredDays.slice(0, regularSettings.frequency);
-
-        for (const day of daysToAdd) {
-          const date = new Date(targetYear, month - 1, day);
-          schedulesToCreate.push({
-            schedule_type: 'regular',
-            title: '정기전',
-            date: date.toISOString().split('T')[0],
-            time: regularSettings.time,
-            max_participants: regularSettings.maxParticipants,
-            description: '',
-            is_recurring: true,
-            recurring_config: regularSettings,
-          });
-        }
+    try {
+      const response = await scheduleAPI.deleteRecurrence(recurrenceId);
+      if (response.data.success) {
+        await Promise.all([loadRecurrences(), loadSchedules()]);
+        alert(
+          `정기전이 중지되었습니다. (삭제된 일정 ${response.data.deleted_count}개)`
+        );
       }
+    } catch (error) {
+      console.error('정기전 중지 실패:', error);
+      alert(error.response?.data?.message || '정기전 중지에 실패했습니다.');
+    }
+  };
 
-      // 일괄 생성
-      let successCount = 0;
-      let errorCount = 0;
-
-      for (const schedule of schedulesToCreate) {
-        try {
-          await scheduleAPI.createSchedule(schedule);
-          successCount++;
-        } catch (error) {
-          console.error('일정 생성 실패:', schedule.date, error);
-          errorCount++;
-        }
-      }
+  // 정기전 생성 (해당 연도의 모든 월에 적용)
+  // 요일/주차/월 횟수 규칙을 해당 연도 기간(starts_on ~ ends_on)으로 저장하면 서버가 일정을 한 번에 생성
+  // (같은 요일/주차/시간의 정기전과 기간이 겹치면 서버가 거부)
+  const handleCreateRegularSchedules = async () => {
+    setCreatingRegularSchedules(true);
+    try {
+      const targetYear = currentDate.getFullYear();
+      const response = await scheduleAPI.createRecurrence({
+        schedule_type: 'regular',
+        title: '정기전',
+        day_of_week: regularSettings.dayOfWeek,
+        week_type: regularSettings.weekType,
+        frequency: regularSettings.frequency,
+        time: regularSettings.time,
+        max_participants: regularSettings.maxParticipants,
+        description: '',
+        starts_on: `${targetYear}-01-01`,
+        ends_on: `${targetYear}-12-31`,
+        until: `${targetYear}-12-31`,
+      });
 
-      await loadSchedules();
+      await Promise.all([loadSchedules(), loadRecurrences()]);
       setShowRegularSettingsModal(false);
 
-      if (errorCount > 0) {
-        alert(
-          `${successCount}개의 정기전이 생성되었습니다. ${errorCount}개의 생성에 실패했습니다.`
-        );
-      } else {
+      if (response.data.success) {
         alert(
-          `${successCount}개의 정기전이 생성되었습니다. (${targetYear}년 전체)`
+          `${response.data.created_count}개의 정기전이 생성되었습니다. (${targetYear}년 전체)`
         );
       }
     } catch (error) {
@@ -437,6 +425,7 @@ const Schedules = () => {
   }
 
   const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
+  const weekTypeLabels = { all: '매주', even: '짝수 주', odd: '홀수 주' };
   const monthNames = [
     '1월',
     '2월',
@@ -461,7 +450,7 @@ const Schedules = () => {
           {isAdmin && (
             <button
               className="btn btn-primary"
-              onClick={() => setShowRegularSettingsModal(true)}
+              onClick={openRegularSettingsModal}
               disabled={creatingRegularSchedules}
             >
               정기전 설정
@@ -560,6 +549,34 @@ const Schedules = () => {
         size="md"
       >
         <div className="regular-settings-form">
+          <div className="form-group">
+            <label>등록된 정기전</label>
+            {recurrences.length === 0 ? (
+              <p className="recurrence-empty">등록된 정기전이 없습니다.</p>
+            ) : (
+              <ul className="recurrence-list">
+                {recurrences.map((recurrence) => (
+                  <li key={recurrence.id} className="recurrence-item">
+                    <span>
+                      {weekDays[recurrence.day_of_week]}요일 ·{' '}
+                      {weekTypeLabels[recurrence.week_type]} · 월{' '}
+                      {recurrence.frequency}회 · {recurrence.time} ·{' '}
+                      {recurrence.starts_on} ~ {recurrence.ends_on || '종료일 없음'}
+                    </span>
+                    <button
+                      type="button"
+                      className="btn btn-sm btn-danger"
+                      onClick={() => handleStopRecurrence(recurrence.id)}
+                      disabled={creatingRegularSchedules}
+                    >
+                      중지
+                    </button>
+                  </li>
+                ))}
+              </ul>
+            )}
+          </div>
+
           <div className="form-group">
             <label>요일</label>
             <select
@@ -603,7 +620,7 @@ const Schedules = () => {
             <input
               type="number"
               min="1"
-              max="10"
+              max="5"
               value={regularSettings.frequency}
               onChange={(e) =>
                 setRegularSettings({
@@ -789,6 +806,8 @@ const Schedules = () => {
               <p>
                 <strong>인원:</strong> {selectedSchedule.attendance_count}/
                 {selectedSchedule.max_participants}
+                {selectedSchedule.waitlist_count > 0 &&
+                  ` (대기 ${selectedSchedule.waitlist_count}명)`}
               </p>
               {selectedSchedule.description && (
                 <p>
@@ -823,6 +842,26 @@ const Schedules = () => {
                       .join(', ')}
                   </div>
 
+                  {/* 대기 명단 (대기 순서대로, 참석 취소 시 자동 승격) */}
+                  {selectedSchedule.attendances.some(
+                    (att) => att.status === 'waiting'
+                  ) && (
+                    <div className="attendee-summary">
+                      <strong>대기:</strong>{' '}
+                      {selectedSchedule.attendances
+                        .filter((att) => att.status === 'waiting')
+                        .sort((a, b) =>
+                          a.waitlisted_at === b.waitlisted_at
+                            ? a.id - b.id
+                            : a.waitlisted_at < b.waitlisted_at
+                            ? -1
+                            : 1
+                        )
+                        .map((att, index) => `${index + 1}. ${att.member_name}`)
+                        .join(', ')}
+                    </div>
+                  )}
+
                   {/* 운영진/슈퍼관리자용: 참석자 개별 거부 섹션 */}
                   {isAdmin && (
                     <div className="attendee-admin-section">
@@ -860,38 +899,42 @@ const Schedules = () => {
               <div className="schedule-actions-left">
                 {user && (
                   <>
-                    {selectedSchedule.attendances?.some((att) => {
-                      // currentMember가 있으면 member_id로 비교, 없으면 이름으로 비교
-                      if (currentMember) {
+                    {(() => {
+                      // currentMember가 있으면 member_id로 비교, 없으면 이름으로 비교 (로그인한 유저 이름)
+                      const myAttendance = selectedSchedule.attendances?.find(
+                        (att) =>
+                          (currentMember
+                            ? att.member_id === currentMember.id
+                            : att.member_name === user.name) &&
+                          (att.status === 'attending' ||
+                            att.status === 'waiting')
+                      );
+                      if (myAttendance) {
+                        const isWaiting = myAttendance.status === 'waiting';
                         return (
-                          att.member_id === currentMember.id &&
-                          att.status === 'attending'
+                          <button
+                            className="btn btn-warning"
+                            onClick={() =>
+                              handleCancel(selectedSchedule.id, isWaiting)
+                            }
+                          >
+                            {isWaiting ? '대기 취소' : '참석 취소'}
+                          </button>
                         );
                       }
-                      // 이름으로 비교 (로그인한 유저 이름)
+                      // 정원이 차 있으면 대기 신청 (취소자가 생기면 순서대로 자동 참석)
                       return (
-                        att.member_name === user.name &&
-                        att.status === 'attending'
-                      );
-                    }) ? (
-                      <button
-                        className="btn btn-warning"
-                        onClick={() => handleCancel(selectedSchedule.id)}
-                      >
-                        참석 취소
-                      </button>
-                    ) : (
-                      <button
-                        className="btn btn-primary"
-                        onClick={() => handleAttend(selectedSchedule.id)}
-                        disabled={
-                          selectedSchedule.attendance_count >=
+                        <button
+                          className="btn btn-primary"
+                          onClick={() => handleAttend(selectedSchedule.id)}
+                        >
+                          {selectedSchedule.attendance_count >=
                           selectedSchedule.max_participants
-                        }
-                      >
-                        참석
-                      </button>
-                    )}
+                            ? '대기 신청'
+                            : '참석'}
+                        </button>
+                      );
+                    })()}
                   </>
                 )}
               </div>
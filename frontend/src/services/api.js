@@ -148,7 +148,7 @@ export const authAPI = {
   logout: () => api.post('/api/auth/logout'),
   logoutOtherDevices: () => api.post('/api/auth/logout-other-devices'),
   getCurrentUser: () => api.get('/api/auth/me'),
-  getUsers: () => api.get('/api/auth/users'),
+  getUsers: (params) => api.get('/api/auth/users', { params }),
   updateUserRole: (userId, data) =>
     api.put(`/api/auth/users/${userId}/role`, data),
   updateUserStatus: (userId, data) =>
@@ -225,13 +225,15 @@ export const paymentAPI = {
 export const messageAPI = {
   getUnreadCount: () => api.get('/api/messages/unread-count'),
   getConversations: () => api.get('/api/messages/conversations'),
-  getMessagesWithUser: (userId, markRead = true) => {
+  // params: { before_id, limit } - before_id 이전의 메시지를 limit 개씩 조회
+  getMessagesWithUser: (userId, params = {}) => {
     const url = `/api/messages/with/${userId}`;
-    return api.get(url);
+    return api.get(url, { params });
   },
   sendMessage: (userId, content) =>
     api.post(`/api/messages/with/${userId}`, { content }),
   markAsRead: (userId) => api.post(`/api/messages/with/${userId}/read`),
+  markAllAsRead: () => api.post('/api/messages/read-all'),
   deleteMessage: (messageId) => api.delete(`/api/messages/${messageId}`),
 };
 
@@ -305,8 +307,20 @@ export const postAPI = {
     }),
 };
 
+// 검색 API (게시글 / 댓글 / 문의)
+export const searchAPI = {
+  search: (params = {}) => {
+    const queryString = new URLSearchParams(params).toString();
+    return api.get(`/api/search?${queryString}`);
+  },
+};
+
 export const inquiryAPI = {
-  getInquiries: () => api.get('/api/inquiries'),
+  getInquiries: (params = {}) => {
+    const queryString = new URLSearchParams(params).toString();
+    return api.get(`/api/inquiries${queryString ? '?' + queryString : ''}`);
+  },
+  getSummary: () => api.get('/api/inquiries/summary'), // 답변 대기 / 답변 달린 문의 수
   getInquiry: (inquiryId, params = {}) => {
     const queryString = new URLSearchParams(params).toString();
     return api.get(
@@ -351,6 +365,17 @@ export const scheduleAPI = {
   attendSchedule: (scheduleId, data) => api.post(`/api/schedules/${scheduleId}/attend`, data),
   cancelAttendance: (scheduleId, data) => api.post(`/api/schedules/${scheduleId}/cancel`, data),
   rejectAttendance: (scheduleId, data) => api.post(`/api/schedules/${scheduleId}/reject`, data),
+  // 정기 일정 규칙 (규칙 저장 + 기간 내 일정 일괄 생성은 서버에서 처리)
+  getRecurrences: () => api.get('/api/schedules/recurrences'),
+  createRecurrence: (data) => api.post('/api/schedules/recurrences', data),
+  deleteRecurrence: (recurrenceId) => api.delete(`/api/schedules/recurrences/${recurrenceId}`),
+};
+
+// 실시간 알림 API (long-poll)
+export const eventAPI = {
+  // cursor: 이전 응답의 cursor (없으면 현재 카운터 즉시 반환)
+  poll: (cursor, signal) =>
+    api.get('/api/events/poll', { params: cursor ? { cursor } : {}, signal }),
 };
 
 export default api;
@@ -0,0 +1,77 @@
+import { eventAPI } from './api';
+
+// 실시간 알림 채널 (long-poll)
+// 안 읽은 메시지 / 답변 대기 문의 / 가입 요청 카운터를 각각 주기적으로 조회하는 대신
+// 요청 하나로 변경 사항을 기다렸다가 window 이벤트로 전달합니다.
+// - 'realtimeCounters': detail = { unread_messages, unread_inquiries, replied_inquiries, join_requests? }
+// - 'realtimeEvent': detail = { type: 'message' | 'messages_read' | 'inquiries' | ... }
+
+const RETRY_DELAY = 5000; // 오류 시 재시도 간격 (ms)
+
+let generation = 0; // 시작/중지/재시작마다 증가 (이전 루프 종료용)
+let controller = null;
+let latestCounters = null;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// 마지막으로 받은 카운터 (채널 시작 후 마운트된 컴포넌트의 초기값용)
+export const getLatestCounters = () => latestCounters;
+
+const runLoop = async (myGeneration) => {
+  let cursor = null;
+
+  while (myGeneration === generation) {
+    controller = new AbortController();
+    try {
+      const res = await eventAPI.poll(cursor, controller.signal);
+      if (myGeneration !== generation) return;
+      if (res.data.success) {
+        cursor = res.data.cursor;
+        if (res.data.counters) {
+          latestCounters = res.data.counters;
+          window.dispatchEvent(
+            new CustomEvent('realtimeCounters', { detail: res.data.counters })
+          );
+        }
+        (res.data.events || []).forEach((event) => {
+          window.dispatchEvent(new CustomEvent('realtimeEvent', { detail: event }));
+        });
+      }
+      // 서버 대기 자리가 없으면 카운터만 받고 retry_after 초 후 다시 요청 (짧은 폴링)
+      if (res.data.retry_after > 0) {
+        await sleep(res.data.retry_after * 1000);
+      }
+    } catch (error) {
+      if (myGeneration !== generation) return;
+      // 로그인 만료 시 중지 (재로그인 시 다시 시작)
+      if (error.response?.status === 401) {
+        generation += 1;
+        return;
+      }
+      // 네트워크/서버 오류: Retry-After 또는 기본 간격 후 재시도
+      const retryAfter = Number(error.response?.headers?.['retry-after']);
+      await sleep(retryAfter > 0 ? retryAfter * 1000 : RETRY_DELAY);
+    }
+  }
+};
+
+export const startRealtime = () => {
+  stopRealtime();
+  runLoop(generation);
+};
+
+export const stopRealtime = () => {
+  generation += 1;
+  latestCounters = null;
+  if (controller) {
+    controller.abort();
+    controller = null;
+  }
+};
+
+// 클럽 변경 등으로 구독 대상이 바뀌었을 때 카운터를 새로 받기 위해 재시작
+export const restartRealtime = () => {
+  if (controller) {
+    startRealtime();
+  }
+};